@@ -0,0 +1,100 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the animation clip used by every animated sprite. A clip scales its frames once for its target size, along with the upside-down frames used when gravity is inverted, so advancing an animation only swaps which surface a sprite shows.
+"""
+
+from assetRegistry import ASSETS
+
+
+class AnimationClip:
+    """
+    Description: The frames of one animation, pre-scaled to one size.
+
+    Frames are always scaled from the original files through the asset registry, so resizing a clip never
+    stacks scaling losses, and clips of the same files and size share their surfaces, which are packed into the
+    registry's sprite atlas.
+
+    Attributes:
+        paths (tuple): The file path of each frame, in order.
+        size (tuple): The (width, height) the frames are scaled to, or None for the files' own size.
+        upright (list): The frames the right way up.
+        inverted (list): The frames flipped upside down, built the first time they are needed.
+        flashes (dict): The hit-flash frames the right way up (False) and upside down (True), each built the
+            first time it is needed.
+    """
+
+    def __init__(self, paths, size=None):
+        """
+        Description: Initialize a clip and scale its frames.
+
+        Parameters:
+            paths (list): The file path of each frame, in order.
+            size (tuple, optional): The (width, height) to scale the frames to. None keeps the files' size.
+
+        Returns: None
+        """
+        self.paths = tuple(paths)
+        self.size = None
+        self.upright = None
+        self.inverted = None
+        self.flashes = {}
+        self.resize(size)
+
+    def resize(self, size):
+        """
+        Description: Scale the frames to a new size. Nothing is done when the size is unchanged.
+
+        Parameters:
+            size (tuple): The new (width, height), or None for the files' own size.
+
+        Returns: None
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        if size == self.size and self.upright is not None:
+            return
+        self.size = size
+        self.upright = [ASSETS.sprite(path, size) for path in self.paths]
+        self.inverted = None
+        self.flashes = {}
+
+    def frames(self, flipped=False):
+        """
+        Description: Get the frames the right way up or upside down.
+
+        Parameters:
+            flipped (bool, optional): Whether to get the upside-down frames.
+
+        Returns:
+            list: The frames, in order.
+        """
+        if not flipped:
+            return self.upright
+        if self.inverted is None:
+            self.inverted = [ASSETS.sprite(path, self.size, flip_y=True) for path in self.paths]
+        return self.inverted
+
+    def flashed(self, flipped=False):
+        """
+        Description: Get the frames flashed white, as shown for a moment when the sprite is hit.
+
+        Parameters:
+            flipped (bool, optional): Whether to get the upside-down frames.
+
+        Returns:
+            list: The flashed frames, in order.
+        """
+        frames = self.flashes.get(flipped)
+        if frames is None:
+            frames = self.flashes[flipped] = [ASSETS.flash(frame) for frame in self.frames(flipped)]
+        return frames
+
+    def __len__(self):
+        """
+        Description: Get the number of frames.
+        Parameters: None
+        Returns:
+            int: The number of frames.
+        """
+        return len(self.paths)
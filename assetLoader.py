@@ -0,0 +1,191 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the background asset loader. Image and sound files are decoded on a pool of worker threads while the home menu is already on screen, then handed to the asset registry on the main thread, which also does every display-format conversion.
+"""
+
+import os
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from assetRegistry import ASSETS
+
+IMAGE_FOLDER = "01. Visual Assets"
+SOUND_FOLDER = "00. Sounds"
+IMAGE_EXTENSIONS = (".png", ".gif", ".jpg", ".bmp")
+SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+WORKERS = 4  # Decoding threads; pygame releases the GIL while a file is decoded
+PUMP_BUDGET_MS = 2  # Main-thread time spent handing finished files to the registry per frame
+
+# Kinds of asset
+IMAGE = "image"
+SOUND = "sound"
+
+
+def find_assets(folder, extensions):
+    """
+    Description: List every asset file in a folder and its subfolders.
+
+    Parameters:
+        folder (str): The folder to search.
+        extensions (tuple): The file extensions to include.
+
+    Returns:
+        list: The file paths in sorted order, with "/" separators to match the paths used in the code.
+    """
+    paths = []
+    for directory, subdirectories, files in os.walk(folder):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.lower().endswith(extensions):
+                paths.append(directory.replace(os.sep, "/") + "/" + name)
+    return paths
+
+
+def decode(kind, path):
+    """
+    Description: Decode one file. Runs on a worker thread.
+
+    Parameters:
+        kind (str): IMAGE or SOUND.
+        path (str): The file path.
+
+    Returns:
+        pygame.Surface or pygame.mixer.Sound: The decoded asset.
+    """
+    if kind == IMAGE:
+        return pygame.image.load(path)
+    return pygame.mixer.Sound(path)
+
+
+class AssetLoader:
+    """
+    Description: Decodes asset files in the background and hands them to the asset registry.
+
+    Usage: queue() the files, call pump() once per frame, and wait() for the files a scene cannot start without.
+    A file that fails to decode is skipped; the registry loads it itself when it is requested.
+
+    Attributes:
+        registry (assetRegistry.AssetRegistry): The registry the decoded files go to.
+        executor (ThreadPoolExecutor): The decoding threads.
+        pending (dict): The (kind, future) of each file still to be handed over, in queue order.
+        total (int): Files queued so far.
+        loaded (int): Files handed to the registry.
+        failed (list): Files that could not be decoded.
+    """
+
+    def __init__(self, registry=ASSETS, workers=WORKERS):
+        """
+        Description: Initialize an idle loader.
+
+        Parameters:
+            registry (assetRegistry.AssetRegistry, optional): The registry the decoded files go to.
+            workers (int, optional): The number of decoding threads.
+
+        Returns: None
+        """
+        self.registry = registry
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self.pending = {}
+        self.total = 0
+        self.loaded = 0
+        self.failed = []
+
+    def queue(self, paths):
+        """
+        Description: Start decoding files that are not loaded or queued yet.
+
+        Sounds are skipped when the mixer is not initialized, since the registry hands out silent sounds then.
+
+        Parameters:
+            paths (list): The file paths, decoded roughly in this order.
+
+        Returns: None
+        """
+        for path in paths:
+            if path in self.pending or self.registry.has(path):
+                continue
+            kind = SOUND if path.lower().endswith(SOUND_EXTENSIONS) else IMAGE
+            if kind == SOUND and not pygame.mixer.get_init():
+                continue
+            self.pending[path] = (kind, self.executor.submit(decode, kind, path))
+            self.total += 1
+
+    def install(self, path):
+        """
+        Description: Hand one decoded file to the registry, waiting for it if it is still decoding.
+
+        Parameters:
+            path (str): The file path.
+
+        Returns: None
+        """
+        kind, future = self.pending.pop(path)
+        try:
+            asset = future.result()
+        except (pygame.error, OSError):
+            self.failed.append(path)
+            return
+        if kind == IMAGE:
+            self.registry.preload_image(path, asset)
+        else:
+            self.registry.preload_sound(path, asset)
+        self.loaded += 1
+
+    def pump(self, budget_ms=PUMP_BUDGET_MS):
+        """
+        Description: Hand finished files to the registry without waiting on any, within a time budget.
+
+        Parameters:
+            budget_ms (float, optional): The most time to spend, in milliseconds.
+
+        Returns: None
+        """
+        start = time.perf_counter()
+        for path, (kind, future) in list(self.pending.items()):
+            if (time.perf_counter() - start) * 1000 > budget_ms:
+                break
+            if future.done():
+                self.install(path)
+
+    def wait(self, paths=None):
+        """
+        Description: Block until some files, or all of them, are decoded and handed over.
+
+        Parameters:
+            paths (list, optional): The files to wait for. Every queued file when None.
+
+        Returns: None
+        """
+        for path in list(self.pending if paths is None else paths):
+            if path in self.pending:
+                self.install(path)
+
+    def done(self):
+        """
+        Description: Check whether every queued file has been handed over.
+        Parameters: None
+        Returns:
+            bool: True when nothing is pending.
+        """
+        return not self.pending
+
+    def progress(self):
+        """
+        Description: Get how much of the queue has been handled.
+        Parameters: None
+        Returns:
+            float: The handled fraction of the queued files, from 0 to 1.
+        """
+        if not self.total:
+            return 1.0
+        return (self.total - len(self.pending)) / self.total
+
+    def shutdown(self):
+        """
+        Description: Stop the decoding threads, dropping files that have not started decoding.
+        Parameters: None
+        Returns: None
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
@@ -0,0 +1,355 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the baked asset pack. An offline bake writes every image the game asks for, already decoded and scaled to the size it is shown at, and every sound as raw PCM, into one file with an index. At startup the pack is memory-mapped and surfaces are built straight from its bytes, so nothing has to be decoded or scaled. Files that changed since the bake are loaded from disk as before.
+
+Usage:
+    python assetPack.py                      Bake the pack next to the game
+    python assetPack.py --output other.pack  Bake the pack to another file
+"""
+
+import os
+import argparse
+import json
+import mmap
+import struct
+import sys
+import pygame
+from assetRegistry import ASSETS
+import assetLoader
+
+PACK_PATH = "assets.pack"
+PACK_VERSION = 1
+MAGIC = b"MRPACK\r\n"
+HEADER = struct.Struct("<8sI")  # Magic, then the length of the JSON index that follows
+ALIGNMENT = 64  # Pixel data starts on this boundary
+BAKED_SWORD_UPGRADES = 4  # Sword sizes baked beyond the starting one; bigger swords are scaled at runtime
+
+
+def file_hash(path):
+    """
+    Description: Get the content hash of a file.
+
+    Parameters:
+        path (str): The file path.
+
+    Returns:
+        str: The SHA-1 of the file's bytes in hex.
+    """
+    import hashlib  # Imported here as it loads OpenSSL, and a fresh pack is checked without hashing anything
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def source_record(path):
+    """
+    Description: Describe a source file so a pack can tell later whether it changed.
+
+    Parameters:
+        path (str): The file path.
+
+    Returns:
+        dict: The file's size, modification time and content hash.
+    """
+    stat = os.stat(path)
+    return {"bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": file_hash(path)}
+
+
+def variant_name(size):
+    """
+    Description: Get the index name of an image variant.
+
+    Parameters:
+        size (tuple): The (width, height) requested, or None for the file's own size.
+
+    Returns:
+        str: Such as "35x35", or "original".
+    """
+    return "original" if size is None else f"{size[0]}x{size[1]}"
+
+
+class AssetPack:
+    """
+    Description: A baked asset pack, memory-mapped for reading.
+
+    Surfaces come back as views of the mapped file, so the operating system only reads the pages that are used
+    and the pack has to stay open while they are alive. Each file is checked against its source the first time it
+    is used; when its size or modification time changed, its content hash decides whether the baked copy is stale.
+
+    Attributes:
+        path (str): The pack's file path.
+        file (file): The open pack file.
+        data (mmap.mmap): The mapped pack.
+        files (dict): The index entry of each source file by path.
+        mixer (tuple): The (frequency, format, channels) the sounds were baked for, or None without sounds.
+        fresh (dict): Whether each checked source file still matches the pack.
+        served (int): Images and sounds built from the pack.
+    """
+
+    def __init__(self, path=PACK_PATH):
+        """
+        Description: Open and map a pack.
+
+        Parameters:
+            path (str, optional): The pack's file path.
+
+        Returns: None
+
+        Raises:
+            ValueError: If the file is not a pack of this version.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_length = HEADER.unpack_from(self.data)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an asset pack")
+            index = json.loads(self.data[HEADER.size:HEADER.size + index_length].decode("utf-8"))
+        except (ValueError, struct.error):
+            self.file.close()
+            raise
+        if index.get("version") != PACK_VERSION:
+            self.file.close()
+            raise ValueError(f"{path} is version {index.get('version')}, expected {PACK_VERSION}")
+        self.files = index["files"]
+        self.mixer = tuple(index["mixer"]) if index["mixer"] else None
+        self.fresh = {}
+        self.served = 0
+
+    def is_fresh(self, path):
+        """
+        Description: Check whether the pack's copy of a source file is up to date.
+
+        Parameters:
+            path (str): The source file path.
+
+        Returns:
+            bool: True when the file is in the pack and has not changed since the bake.
+        """
+        fresh = self.fresh.get(path)
+        if fresh is None:
+            entry = self.files.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                entry = None
+            if entry is None:
+                fresh = False
+            elif stat.st_size == entry["bytes"] and stat.st_mtime_ns == entry["mtime_ns"]:
+                fresh = True
+            else:
+                # A checkout or copy changes the time but not the content
+                fresh = stat.st_size == entry["bytes"] and file_hash(path) == entry["sha1"]
+            self.fresh[path] = fresh
+        return fresh
+
+    def covers(self, path):
+        """
+        Description: Check whether the pack can stand in for a source file, so it need not be decoded.
+
+        Parameters:
+            path (str): The source file path.
+
+        Returns:
+            bool: True when the file is fresh and, for a sound, the mixer matches the baked format.
+        """
+        if not self.is_fresh(path):
+            return False
+        return "variants" in self.files[path] or self.mixer == pygame.mixer.get_init()
+
+    def image(self, path, size=None):
+        """
+        Description: Build an image from the pack.
+
+        Parameters:
+            path (str): The source file path.
+            size (tuple, optional): The (width, height) requested, or None for the file's own size.
+
+        Returns:
+            pygame.Surface: An RGBA surface viewing the pack's bytes, or None when the pack does not have this
+                variant or the source changed.
+        """
+        if not self.is_fresh(path):
+            return None
+        variant = self.files[path].get("variants", {}).get(variant_name(size))
+        if variant is None:
+            return None
+        offset, length = variant["offset"], variant["length"]
+        self.served += 1
+        return pygame.image.frombuffer(memoryview(self.data)[offset:offset + length], tuple(variant["size"]), "RGBA")
+
+    def image_size(self, path):
+        """
+        Description: Get the size of a source image as recorded by the bake.
+
+        Parameters:
+            path (str): The source file path.
+
+        Returns:
+            tuple: The (width, height) of the image file, or None when the pack does not have it or it changed.
+        """
+        if not self.is_fresh(path) or "image_size" not in self.files[path]:
+            return None
+        return tuple(self.files[path]["image_size"])
+
+    def sound(self, path):
+        """
+        Description: Build a sound from the pack's PCM samples.
+
+        Parameters:
+            path (str): The source file path.
+
+        Returns:
+            pygame.mixer.Sound: The sound, or None when the pack does not have it, the source changed or the mixer
+                runs in a different format than the one baked.
+        """
+        if not self.covers(path) or "pcm" not in self.files[path]:
+            return None
+        pcm = self.files[path]["pcm"]
+        self.served += 1
+        return pygame.mixer.Sound(buffer=self.data[pcm["offset"]:pcm["offset"] + pcm["length"]])
+
+    def stats(self):
+        """
+        Description: Report how much of the pack is in use.
+        Parameters: None
+        Returns:
+            dict: The pack's size, its file count, files found stale and assets served from it.
+        """
+        return {
+            "bytes": len(self.data),
+            "files": len(self.files),
+            "stale": sum(1 for path, fresh in self.fresh.items() if not fresh and path in self.files),
+            "served": self.served,
+        }
+
+
+def open_pack(path=PACK_PATH):
+    """
+    Description: Open the asset pack if there is a usable one.
+
+    Parameters:
+        path (str, optional): The pack's file path.
+
+    Returns:
+        AssetPack: The pack, or None when it is missing, damaged or from another version.
+    """
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def requested_images():
+    """
+    Description: Build the game headlessly and list every image variant it asks the registry for.
+
+    The game is built without a pack, so every image comes from its source file. Its scene is built with the
+    boss spawned and the sword upgraded a few times, which creates every sprite and pooled object up front, so the
+    registry ends up holding each size the game shows.
+
+    Parameters: None
+    Returns:
+        list: Sorted (path, size) pairs. Size is None for an image used at its own size.
+    """
+    import main  # Imported here so the SDL dummy drivers are set before the display is created
+
+    game = main.MetroRunnersGame(seed=0, pack_path=None)
+    game.load_game_scene()
+    game.sim.final_boss()
+    for _ in range(BAKED_SWORD_UPGRADES):
+        game.sim.upgrade_sword()
+    game.loader.shutdown()
+    variants = {(path, size) for path, size, flip_x, flip_y, pixel_format in ASSETS.images
+                if not flip_x and not flip_y}
+    # A file's own size is only kept when it is shown that way; otherwise it was just the source of the scaling
+    scaled = {path for path, size in variants if size is not None}
+    variants = {(path, size) for path, size in variants if size is not None or path not in scaled}
+    return sorted(variants, key=lambda variant: (variant[0], variant[1] or (0, 0)))
+
+
+def bake(output=PACK_PATH):
+    """
+    Description: Write a new asset pack.
+
+    Images are stored as RGBA pixels after conversion to the display format, so building a surface from the
+    pack gives exactly the pixels loading the file would. Sounds are stored as the mixer's PCM samples.
+
+    Parameters:
+        output (str, optional): The pack's file path.
+
+    Returns:
+        dict: The pack's index.
+    """
+    variants = requested_images()
+    blobs = []
+    files = {}
+
+    for path, size in variants:
+        entry = files.get(path)
+        if entry is None:
+            entry = files[path] = dict(source_record(path), variants={})
+            entry["image_size"] = list(ASSETS.image(path).get_size())
+        surface = ASSETS.image(path, size)
+        pixels = pygame.image.tobytes(surface, "RGBA")
+        entry["variants"][variant_name(size)] = {"size": list(surface.get_size()), "length": len(pixels)}
+        blobs.append((entry["variants"][variant_name(size)], pixels))
+
+    mixer = pygame.mixer.get_init()
+    if mixer:
+        for path in assetLoader.find_assets(assetLoader.SOUND_FOLDER, assetLoader.SOUND_EXTENSIONS):
+            entry = files[path] = source_record(path)
+            samples = ASSETS.sound(path).get_raw()
+            entry["pcm"] = {"length": len(samples)}
+            blobs.append((entry["pcm"], samples))
+
+    # Lay the blobs out after the index; offsets go in the index, so size it until the layout settles
+    index = {"version": PACK_VERSION, "mixer": list(mixer) if mixer else None, "files": files}
+    start = 0
+    while True:
+        offset = start
+        for record, blob in blobs:
+            offset += -offset % ALIGNMENT
+            record["offset"] = offset
+            offset += len(blob)
+        encoded = json.dumps(index, sort_keys=True).encode("utf-8")
+        needed = HEADER.size + len(encoded)
+        needed += -needed % ALIGNMENT
+        if needed <= start:
+            break
+        start = needed
+
+    with open(output, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(encoded)))
+        file.write(encoded)
+        for record, blob in blobs:
+            file.write(b"\0" * (record["offset"] - file.tell()))
+            file.write(blob)
+    return index
+
+
+def main():
+    """
+    Description: Bake the asset pack from the command line.
+    Parameters: None
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Bake the METRO RUNNERS assets into one memory-mapped pack.")
+    parser.add_argument("--output", default=PACK_PATH, help="file to write the pack to")
+    args = parser.parse_args()
+
+    # The bake builds the game without opening a window or an audio device
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    index = bake(args.output)
+    images = sum(len(entry.get("variants", ())) for entry in index["files"].values())
+    sounds = sum(1 for entry in index["files"].values() if "pcm" in entry)
+    print(f"Baked {images} images and {sounds} sounds into {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
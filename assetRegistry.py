@@ -0,0 +1,408 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the shared asset registry. Every image, sound and font in the game is loaded and converted through it exactly once, so spawning sprites never touches the disk after startup.
+"""
+
+import pygame
+import imageEffects
+from spriteAtlas import SpriteAtlas
+
+# Pixel formats an image can be requested in
+ALPHA = "alpha"  # convert_alpha() to the display format, keeps transparency
+OPAQUE = "opaque"  # convert() to the display format, no per-pixel alpha
+RAW = "raw"  # left exactly as decoded from the file
+
+ATLAS = "atlas"  # Marks the cache keys of sprite frames, which are ALPHA images packed into the sprite atlas
+
+
+class NullSound:
+    """
+    Description: A silent stand-in for pygame.mixer.Sound, used when the mixer is not initialized (headless runs).
+    """
+
+    def play(self, *args, **kwargs):
+        """
+        Description: Do nothing instead of playing a sound.
+        Parameters: Ignored
+        Returns: None
+        """
+        return None
+
+    def stop(self):
+        """
+        Description: Do nothing instead of stopping a sound.
+        Parameters: None
+        Returns: None
+        """
+
+    def set_volume(self, volume):
+        """
+        Description: Do nothing instead of changing the volume.
+        Parameters:
+            volume (float): Ignored.
+        Returns: None
+        """
+
+    def get_volume(self):
+        """
+        Description: Report a silent volume.
+        Parameters: None
+        Returns:
+            float: Always 0.0.
+        """
+        return 0.0
+
+    def get_length(self):
+        """
+        Description: Report an empty sound length.
+        Parameters: None
+        Returns:
+            float: Always 0.0.
+        """
+        return 0.0
+
+
+class AssetRegistry:
+    """
+    Description: A process-wide cache of images, sounds and fonts.
+
+    Images are keyed by path, target size, flip and pixel format. Transformed variants are built from the cached
+    source image, so a file is only ever decoded once no matter how many sizes are requested. Files decoded ahead
+    of time by assetLoader.AssetLoader are handed over with preload_image() and preload_sound(), and are only
+    converted to the display format when first requested. With an assetPack.AssetPack in use, baked images and
+    sounds are built from the pack instead of their files. Sprite frames asked for with sprite() are packed into
+    the sprite atlas.
+
+    Attributes:
+        images (dict): Cached surfaces keyed by (path, size, flip_x, flip_y, pixel_format).
+        loaded (set): The paths of images cached at their file's size, in any format.
+        masks (dict): Cached collision masks keyed by the surface they were built from.
+        flashes (dict): Cached hit-flash variants keyed by the surface they were built from.
+        sounds (dict): Cached sounds keyed by (path, volume).
+        sound_sources (dict): The first sound decoded from each path, used to copy other volumes from.
+        fonts (dict): Cached fonts keyed by (path, size).
+        preloaded_images (dict): Decoded but unconverted surfaces by path, waiting for their first request.
+        preloaded_sounds (dict): Decoded sounds by path, waiting for their first request.
+        pack (assetPack.AssetPack): The baked pack assets are built from when it has them, or None.
+        atlas (spriteAtlas.SpriteAtlas): The pages sprite frames are packed onto.
+        hits (int): Number of requests served from the cache.
+        misses (int): Number of requests that had to load or build an asset.
+    """
+
+    def __init__(self):
+        """
+        Description: Initialize an empty registry.
+        Parameters: None
+        Returns: None
+        """
+        self.images = {}
+        self.loaded = set()
+        self.masks = {}
+        self.flashes = {}
+        self.sounds = {}
+        self.sound_sources = {}
+        self.fonts = {}
+        self.preloaded_images = {}
+        self.preloaded_sounds = {}
+        self.pack = None
+        self.atlas = SpriteAtlas()
+        self.hits = 0
+        self.misses = 0
+
+    def use_pack(self, pack):
+        """
+        Description: Build assets from a baked pack from now on, or stop using one.
+
+        Parameters:
+            pack (assetPack.AssetPack): The pack, or None to load every asset from its file.
+
+        Returns: None
+        """
+        self.pack = pack
+
+    def preload_image(self, path, surface):
+        """
+        Description: Hand over an image decoded ahead of time, so its first request skips the disk.
+
+        Parameters:
+            path (str): The file path the image was decoded from.
+            surface (pygame.Surface): The decoded image, not yet converted to the display format.
+
+        Returns: None
+        """
+        self.preloaded_images[path] = surface
+
+    def preload_sound(self, path, sound):
+        """
+        Description: Hand over a sound decoded ahead of time, so its first request skips the disk.
+
+        Parameters:
+            path (str): The file path the sound was decoded from.
+            sound (pygame.mixer.Sound): The decoded sound.
+
+        Returns: None
+        """
+        if path not in self.sound_sources:
+            self.preloaded_sounds[path] = sound
+
+    def has(self, path):
+        """
+        Description: Check whether a file has already been loaded, preloaded or baked into the pack.
+
+        Parameters:
+            path (str): The file path.
+
+        Returns:
+            bool: True when requesting the file would not decode it again.
+        """
+        return (path in self.preloaded_images or path in self.preloaded_sounds or path in self.sound_sources
+                or path in self.loaded
+                or (self.pack is not None and self.pack.covers(path)))
+
+    def image(self, path, size=None, flip_x=False, flip_y=False, pixel_format=ALPHA):
+        """
+        Description: Get an image surface, loading and converting it on first use.
+
+        Parameters:
+            path (str): The file path to the image.
+            size (tuple, optional): The (width, height) to scale the image to. None keeps the file's size.
+            flip_x (bool, optional): Whether to flip the image horizontally.
+            flip_y (bool, optional): Whether to flip the image vertically.
+            pixel_format (str, optional): ALPHA, OPAQUE or RAW.
+
+        Returns:
+            pygame.Surface: The shared surface. Callers must not draw onto it.
+        """
+        # Conversion needs a display; without one every format falls back to the decoded pixels
+        if pixel_format != RAW and pygame.display.get_surface() is None:
+            pixel_format = RAW
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+
+        key = (path, size, flip_x, flip_y, pixel_format)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if flip_x or flip_y:
+            # Flip the variant of the same size, which may come straight from the pack
+            surface = pygame.transform.flip(self.image(path, size, pixel_format=pixel_format), flip_x, flip_y)
+        else:
+            surface = self.pack.image(path, size) if self.pack is not None else None
+            if surface is None and size is None:
+                surface = self.preloaded_images.pop(path, None)
+                if surface is None:
+                    surface = pygame.image.load(path)
+            if surface is None:
+                # Build the variant from the cached source so the file is decoded only once
+                surface = self.image(path, pixel_format=pixel_format)
+                if size != surface.get_size():
+                    surface = pygame.transform.scale(surface, size)
+            elif pixel_format == ALPHA:
+                surface = surface.convert_alpha()
+            elif pixel_format == OPAQUE:
+                surface = surface.convert()
+
+        self.images[key] = surface
+        if size is None:
+            self.loaded.add(path)
+        return surface
+
+    def sprite(self, path, size=None, flip_x=False, flip_y=False):
+        """
+        Description: Get a frame of a sprite, packed into the sprite atlas on first use.
+
+        The frame is a subsurface of an atlas page, so it is drawn, masked and sized like any other image while
+        every sprite frame shares a few surfaces. Without a display, or when it does not fit on a page, the frame
+        is the plain image instead.
+
+        Parameters:
+            path (str): The file path to the image.
+            size (tuple, optional): The (width, height) to scale the image to. None keeps the file's size.
+            flip_x (bool, optional): Whether to flip the image horizontally.
+            flip_y (bool, optional): Whether to flip the image vertically.
+
+        Returns:
+            pygame.Surface: The shared frame. Callers must not draw onto it.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, flip_x, flip_y, ATLAS)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.image(path, size, flip_x, flip_y)
+        if pygame.display.get_surface() is not None:
+            surface = self.atlas.add(surface) or surface
+        self.images[key] = surface
+        return surface
+
+    def flash(self, surface):
+        """
+        Description: Get the hit-flash variant of an image, building it the first time it is asked for.
+
+        The variant keeps the image's alpha, so its mask matches the image's. Like a sprite frame, it is packed into
+        the sprite atlas when there is a display.
+
+        Parameters:
+            surface (pygame.Surface): An image from this registry.
+
+        Returns:
+            pygame.Surface: The shared image flashed white. Callers must not draw onto it.
+        """
+        flashed = self.flashes.get(surface)
+        if flashed is not None:
+            self.hits += 1
+            return flashed
+
+        self.misses += 1
+        flashed = imageEffects.hit_flash(surface)
+        if pygame.display.get_surface() is not None:
+            flashed = self.atlas.add(flashed.convert_alpha()) or flashed
+        self.flashes[surface] = flashed
+        return flashed
+
+    def mask(self, surface):
+        """
+        Description: Get the collision mask of an image, building it the first time it is asked for.
+
+        Every animation frame, size and flip of an image is its own cached surface, so each of them gets its own
+        mask once and pixel-perfect tests never build one while the game runs.
+
+        Parameters:
+            surface (pygame.Surface): An image from this registry.
+
+        Returns:
+            pygame.mask.Mask: The shared mask of the image's opaque pixels. Callers must not change it.
+        """
+        mask = self.masks.get(surface)
+        if mask is not None:
+            self.hits += 1
+            return mask
+
+        self.misses += 1
+        mask = pygame.mask.from_surface(surface)
+        self.masks[surface] = mask
+        return mask
+
+    def image_size(self, path):
+        """
+        Description: Get the size of an image file, without decoding it when the pack knows it.
+
+        Parameters:
+            path (str): The file path to the image.
+
+        Returns:
+            tuple: The (width, height) of the image.
+        """
+        size = self.pack.image_size(path) if self.pack is not None else None
+        if size is None:
+            size = self.image(path).get_size()
+        return size
+
+    def sound(self, path, volume=1.0):
+        """
+        Description: Get a sound, decoding it on first use.
+
+        Each volume gets its own Sound object so setting one volume never changes another, but the file itself is
+        only decoded once and later volumes are copied from the decoded samples.
+
+        Parameters:
+            path (str): The file path to the sound.
+            volume (float, optional): The volume of the sound.
+
+        Returns:
+            pygame.mixer.Sound: The shared sound, or a NullSound when the mixer is not initialized.
+        """
+        if not pygame.mixer.get_init():
+            return NullSound()
+
+        key = (path, volume)
+        sound = self.sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        source = self.sound_sources.get(path)
+        if source is None:
+            sound = self.preloaded_sounds.pop(path, None)
+            if sound is None and self.pack is not None:
+                sound = self.pack.sound(path)
+            if sound is None:
+                sound = pygame.mixer.Sound(path)
+            self.sound_sources[path] = sound
+        else:
+            sound = pygame.mixer.Sound(buffer=source.get_raw())
+        sound.set_volume(volume)
+
+        self.sounds[key] = sound
+        return sound
+
+    def font(self, path, size):
+        """
+        Description: Get a font, opening it on first use.
+
+        Parameters:
+            path (str): The file path to the font.
+            size (int): The point size of the font.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = pygame.font.Font(path, size)
+        self.fonts[key] = font
+        return font
+
+    def stats(self):
+        """
+        Description: Report how well the cache is doing.
+        Parameters: None
+        Returns:
+            dict: Hit and miss counts, the number of cached images, masks, sounds and fonts, and the atlas pages.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "images": len(self.images),
+            "masks": len(self.masks),
+            "sounds": len(self.sounds),
+            "fonts": len(self.fonts),
+            "atlas_pages": len(self.atlas.pages),
+        }
+
+    def clear(self):
+        """
+        Description: Drop every cached asset and reset the counters.
+        Parameters: None
+        Returns: None
+        """
+        self.images.clear()
+        self.loaded.clear()
+        self.masks.clear()
+        self.flashes.clear()
+        self.sounds.clear()
+        self.sound_sources.clear()
+        self.fonts.clear()
+        self.preloaded_images.clear()
+        self.preloaded_sounds.clear()
+        self.atlas.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# The registry shared by the whole game
+ASSETS = AssetRegistry()
@@ -0,0 +1,323 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the batch simulator for balance and difficulty sweeps. It plays thousands of headless games over a grid of tuning values with a scripted or bot player, spread over every core with a process pool, and summarizes survival rate, boss-reach rate and time to the first upgrade for each point of the grid.
+
+Usage:
+    python batchSimulator.py --set boss_score=2000,2500,3000 --games 200
+    python batchSimulator.py --set sword_upgrade=5,10 --set obstacle_speed=8,10,12 --player reactive --csv sweep.csv
+"""
+
+import os
+import argparse
+import csv
+import itertools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import gameSimulation
+
+MAX_TICKS = 9000  # Five minutes of game time at 30 ticks per second
+GAMES = 100  # Games per point of the grid
+UPGRADE_EVENTS = ("shuriken_upgrade", "sword_upgrade", "dash_upgrade")
+
+# Columns of every game's result, in order
+RESULT_COLUMNS = ("seed", "result", "ticks", "score", "boss_reached", "upgrades", "first_upgrade_s")
+
+_simulation = None  # Each worker process reuses one simulation for all of its games
+
+
+def idle_player(seed):
+    """
+    Description: Make a player that never presses anything.
+
+    Parameters:
+        seed (int): The game's seed, unused.
+
+    Returns:
+        function: The input source.
+    """
+    return lambda simulation: ()
+
+
+def scripted_player(seed):
+    """
+    Description: Make a player that presses keys on a fixed rhythm, shooting, slashing and flipping gravity.
+
+    Parameters:
+        seed (int): The game's seed, unused.
+
+    Returns:
+        function: The input source.
+    """
+    def source(simulation):
+        actions = []
+        if simulation.tick % 15 == 0:
+            actions.append(gameSimulation.SHOOT)
+        if simulation.tick % 60 == 0:
+            actions.append(gameSimulation.SLASH)
+        if simulation.tick % 45 == 0:
+            actions.append(gameSimulation.GRAVITY)
+        return actions
+    return source
+
+
+class ReactivePlayer:
+    """
+    Description: A bot that shoots regularly and slashes, or flips gravity, when a car is about to hit it.
+
+    Attributes:
+        reach (int): How many pixels ahead of the player a car has to be before the bot reacts.
+    """
+
+    def __init__(self, reach=80):
+        """
+        Description: Initialize the bot.
+
+        Parameters:
+            reach (int, optional): How many pixels ahead of the player a car has to be before the bot reacts.
+
+        Returns: None
+        """
+        self.reach = reach
+
+    def __call__(self, simulation):
+        """
+        Description: Choose the keys to press on this tick.
+
+        Parameters:
+            simulation (gameSimulation.GameSimulation): The game being played.
+
+        Returns:
+            list: The actions.
+        """
+        actions = []
+        if simulation.tick % 15 == 0:
+            actions.append(gameSimulation.SHOOT)
+        player = simulation.player.rect
+        for obstacle in simulation.awake_obstacles:
+            ahead = obstacle.rect.left - player.right
+            if 0 <= ahead <= self.reach and obstacle.rect.top < player.bottom and obstacle.rect.bottom > player.top:
+                if simulation.player.slash_cooldown.ready:
+                    actions.append(gameSimulation.SLASH)
+                elif simulation.on_ground or simulation.on_ceil:
+                    actions.append(gameSimulation.GRAVITY)  # Flip once and let the jump play out
+                break
+        return actions
+
+
+# Player name -> function making the input source for a game from its seed
+PLAYERS = {
+    "idle": idle_player,
+    "scripted": scripted_player,
+    "reactive": lambda seed: ReactivePlayer(),
+}
+
+
+def init_worker():
+    """
+    Description: Prepare a worker process to run games with no window or audio device.
+    Parameters: None
+    Returns: None
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def run_game(job):
+    """
+    Description: Play one headless game. Runs in a worker process.
+
+    Parameters:
+        job (tuple): (tuning dict, seed, player name, tick limit).
+
+    Returns:
+        tuple: The game's values for RESULT_COLUMNS.
+    """
+    global _simulation
+    tuning, seed, player, max_ticks = job
+    if _simulation is None:
+        _simulation = gameSimulation.GameSimulation(seed, tuning=tuning)
+    else:
+        _simulation.tuning = dict(tuning)
+        _simulation.reset(seed)
+    simulation = _simulation
+
+    source = PLAYERS[player](seed)
+    boss_reached = False
+    upgrades = 0
+    first_upgrade = None
+    while not simulation.over and simulation.tick < max_ticks:
+        simulation.step(source(simulation))
+        boss_reached = boss_reached or simulation.boss_spawned
+        for event in simulation.events:
+            if event in UPGRADE_EVENTS:
+                upgrades += 1
+                if first_upgrade is None:
+                    first_upgrade = simulation.tick / simulation.tick_rate
+    return (seed, simulation.result, simulation.tick, simulation.score, boss_reached, upgrades, first_upgrade)
+
+
+def make_jobs(grid, games, player, max_ticks, first_seed=0):
+    """
+    Description: List every game of a sweep.
+
+    Parameters:
+        grid (dict): The values to try for each tuning name. Every combination is a point of the grid.
+        games (int): Games per point, each with its own seed. Every point uses the same seeds.
+        player (str): The name of the player in PLAYERS.
+        max_ticks (int): The most ticks a game may last.
+        first_seed (int, optional): The seed of the first game of each point.
+
+    Returns:
+        list: A (tuning dict, seed, player name, tick limit) job for each game.
+    """
+    names = sorted(grid)
+    jobs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        tuning = dict(zip(names, values))
+        for seed in range(first_seed, first_seed + games):
+            jobs.append((tuning, seed, player, max_ticks))
+    return jobs
+
+
+def run_batch(jobs, workers=None, progress=None):
+    """
+    Description: Play every game of a sweep, spread over a process pool.
+
+    Parameters:
+        jobs (list): The jobs from make_jobs.
+        workers (int, optional): The number of worker processes, every core when None. 1 plays in this process.
+        progress (function, optional): Called with the number of games finished so far as results stream in.
+
+    Returns:
+        dict: The results as columns: each tuning name and each of RESULT_COLUMNS, mapped to a list with one
+            value per game in job order.
+    """
+    workers = workers or os.cpu_count() or 1
+    names = sorted(jobs[0][0]) if jobs else []
+    columns = {name: [] for name in names + list(RESULT_COLUMNS)}
+
+    if workers == 1:
+        init_worker()
+        results = map(run_game, jobs)
+        executor = None
+    else:
+        # Hand games out in chunks so the pool is not dominated by messages for short games
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+        results = executor.map(run_game, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+
+    try:
+        for count, (job, result) in enumerate(zip(jobs, results), 1):
+            for name in names:
+                columns[name].append(job[0][name])
+            for name, value in zip(RESULT_COLUMNS, result):
+                columns[name].append(value)
+            if progress is not None:
+                progress(count)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return columns
+
+
+def summarize(columns, names):
+    """
+    Description: Summarize the games of each point of the grid.
+
+    Parameters:
+        columns (dict): The results from run_batch.
+        names (list): The tuning names that make up the grid.
+
+    Returns:
+        list: A dict per point with its tuning values, the number of games, survival rate (games not lost),
+            win rate, boss-reach rate, mean score and mean seconds to the first upgrade (None if no game got one).
+    """
+    points = {}
+    for index in range(len(columns["seed"])):
+        key = tuple(columns[name][index] for name in names)
+        points.setdefault(key, []).append(index)
+
+    summary = []
+    for key, indexes in points.items():
+        games = len(indexes)
+        upgrade_times = [columns["first_upgrade_s"][i] for i in indexes if columns["first_upgrade_s"][i] is not None]
+        row = dict(zip(names, key))
+        row.update({
+            "games": games,
+            "survival_rate": sum(columns["result"][i] != gameSimulation.LOST for i in indexes) / games,
+            "win_rate": sum(columns["result"][i] == gameSimulation.WON for i in indexes) / games,
+            "boss_reach_rate": sum(columns["boss_reached"][i] for i in indexes) / games,
+            "mean_score": sum(columns["score"][i] for i in indexes) / games,
+            "time_to_upgrade_s": sum(upgrade_times) / len(upgrade_times) if upgrade_times else None,
+        })
+        summary.append(row)
+    return summary
+
+
+def parse_values(text):
+    """
+    Description: Parse a comma-separated list of numbers from the command line.
+
+    Parameters:
+        text (str): Such as "5,10,15" or "0.5,1".
+
+    Returns:
+        list: The numbers, as ints where possible.
+    """
+    values = []
+    for part in text.split(","):
+        try:
+            values.append(int(part))
+        except ValueError:
+            values.append(float(part))
+    return values
+
+
+def main():
+    """
+    Description: Run a sweep from the command line.
+    Parameters: None
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Sweep METRO RUNNERS balance values over many headless games.")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=V1,V2",
+                        help="tuning value to sweep, such as boss_score=2000,2500; may be repeated")
+    parser.add_argument("--games", type=int, default=GAMES, help="games per point of the grid")
+    parser.add_argument("--ticks", type=int, default=MAX_TICKS, help="most ticks per game")
+    parser.add_argument("--player", choices=sorted(PLAYERS), default="reactive", help="who plays the games")
+    parser.add_argument("--workers", type=int, help="worker processes, every core by default")
+    parser.add_argument("--csv", metavar="PATH", help="also write every game's result to this file")
+    args = parser.parse_args()
+
+    grid = {}
+    for setting in args.set:
+        name, _, values = setting.partition("=")
+        if name not in gameSimulation.TUNABLES:
+            parser.error(f"unknown tuning value {name!r}, expected one of {', '.join(gameSimulation.TUNABLES)}")
+        grid[name] = parse_values(values)
+    names = sorted(grid)
+
+    jobs = make_jobs(grid, args.games, args.player, args.ticks)
+    start = time.perf_counter()
+    columns = run_batch(jobs, args.workers,
+                        lambda count: print(f"\r{count}/{len(jobs)} games", end="", file=sys.stderr))
+    seconds = time.perf_counter() - start
+    print(f"\r{len(jobs)} games in {seconds:.1f} s ({len(jobs) / seconds:.1f} games/s)", file=sys.stderr)
+
+    header = names + ["games", "survival_rate", "win_rate", "boss_reach_rate", "mean_score", "time_to_upgrade_s"]
+    print(" ".join(f"{name:>16}" for name in header))
+    for row in summarize(columns, names):
+        print(" ".join(f"{'-' if row[name] is None else round(row[name], 3):>16}" for name in header))
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(list(columns))
+            writer.writerows(zip(*columns.values()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the benchmark suite for METRO RUNNERS. It runs scripted stress scenarios with a fixed seed and fixed inputs on SDL's dummy video and audio drivers, reports ticks/sec, render frames/sec, allocations, peak memory and startup times, and compares them against a stored baseline.
+
+Usage:
+    python benchmark.py                      Run every scenario and compare against the baseline
+    python benchmark.py --scenario boss      Run one scenario
+    python benchmark.py --update-baseline    Run every scenario and store the results as the new baseline
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+import gameSimulation
+import frameRenderer
+import spawnScheduler
+import entityStore
+
+SEED = 1234
+TICKS = 600  # Ticks measured per scenario, 20 seconds of game time
+WARMUP_TICKS = 30  # Ticks run before measuring, so first-use asset loads are not timed
+ALLOCATION_TICKS = 120  # Ticks run under tracemalloc, which is too slow for the timed pass
+THRESHOLD = 0.20  # A metric more than 20% worse than the baseline is a regression
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# Whether a higher value of each metric is better
+HIGHER_IS_BETTER = {
+    "ticks_per_sec": True,
+    "frames_per_sec": True,
+    "peak_traced_kb": False,
+    "gc_collections": False,
+    "peak_rss_kb": False,
+    "time_to_first_frame_ms": False,
+    "time_to_interactive_ms": False,
+}
+
+
+def spawn_obstacles(count):
+    """
+    Description: Make a scenario setup that fills the screen with obstacles.
+
+    Parameters:
+        count (int): The number of obstacles on screen at once.
+
+    Returns:
+        function: The setup, called with the simulation.
+    """
+    def setup(sim):
+        for i in range(count - len(sim.obstacles)):
+            sim.spawn_obstacle(sim.rng.randint(0, 3000), sim.rng.randint(0, gameSimulation.SCREEN_HEIGHT - 50))
+    return setup
+
+
+def dense_waves(sim):
+    """
+    Description: Replace the run's schedule with waves of hundreds of obstacles and gems.
+
+    Parameters:
+        sim (gameSimulation.GameSimulation): The simulation to set up.
+
+    Returns: None
+    """
+    sim.spawner = spawnScheduler.SpawnScheduler(DENSE_WAVES, sim.clock.now())
+
+
+def upgrade_shurikens(sim):
+    """
+    Description: Upgrade the shuriken burst far enough that bursts overlap.
+
+    Parameters:
+        sim (gameSimulation.GameSimulation): The simulation to set up.
+
+    Returns: None
+    """
+    sim.player.total_shurikens = 30
+
+
+def start_boss_fight(sim):
+    """
+    Description: Skip straight to the boss fight, with an upgraded burst to fire at it.
+
+    Parameters:
+        sim (gameSimulation.GameSimulation): The simulation to set up.
+
+    Returns: None
+    """
+    sim.score = gameSimulation.BOSS_SCORE
+    sim.boss.health = 10 ** 9  # Keep the fight going for the whole scenario
+    sim.player.total_shurikens = 10
+
+
+def swarm(obstacles, projectiles):
+    """
+    Description: Make an input source that keeps the screen full of obstacles and throws a wall of projectiles at
+        them every tick, far more than bursts can.
+
+    Parameters:
+        obstacles (int): The number of obstacles kept alive.
+        projectiles (int): Projectiles thrown per tick.
+
+    Returns:
+        function: The input source.
+    """
+    refill = spawn_obstacles(obstacles)
+
+    def source(sim):
+        sim.boss.health = 10 ** 9  # Car kills reach the boss quickly; keep the fight from ending the scenario
+        refill(sim)
+        for i in range(projectiles):
+            projectile = sim.pools["projectiles"].acquire(sim.rng.randint(0, 300),
+                                                          sim.rng.randint(0, gameSimulation.SCREEN_HEIGHT - 25))
+            sim.player.projectiles.add(projectile)
+        return ()
+    return source
+
+
+def every(ticks, *actions):
+    """
+    Description: Make an input source that presses some actions on a fixed tick interval.
+
+    Parameters:
+        ticks (int): The interval in ticks.
+        actions (str): The actions to press.
+
+    Returns:
+        function: The input source.
+    """
+    def source(sim):
+        return actions if sim.tick % ticks == 0 else ()
+    return source
+
+
+def no_input(sim):
+    """
+    Description: An input source that never presses anything.
+
+    Parameters:
+        sim (gameSimulation.GameSimulation): Ignored.
+
+    Returns:
+        tuple: No actions.
+    """
+    return ()
+
+
+# The run's waves that keep one car and one gem alive, without its timed waves, so each scenario runs only the
+# sprites it sets up
+STEADY_WAVES = [wave for wave in gameSimulation.WAVES if "keep" in wave]
+
+# Waves for the dense_waves scenario: long lanes and trails every second, on top of a long idle schedule
+DENSE_WAVES = [
+    {"kind": spawnScheduler.OBSTACLE, "pattern": spawnScheduler.LANE, "count": 200, "spacing": 120, "every": 1000},
+    {"kind": spawnScheduler.GEM, "pattern": spawnScheduler.TRAIL, "count": 200, "spacing": 40, "every": 1000},
+] + [{"kind": spawnScheduler.GEM, "at": 10 ** 7 + i} for i in range(1000)]
+
+# Scenario name -> (setup, input source)
+SCENARIOS = {
+    "obstacles_1": (spawn_obstacles(1), no_input),
+    "obstacles_50": (spawn_obstacles(50), no_input),
+    "obstacles_500": (spawn_obstacles(500), no_input),
+    "shuriken_bursts": (upgrade_shurikens, every(1, gameSimulation.SHOOT)),
+    "boss": (start_boss_fight, every(1, gameSimulation.SHOOT)),
+    "gravity_flips": (spawn_obstacles(5), every(5, gameSimulation.GRAVITY)),
+    "dense_waves": (dense_waves, every(10, gameSimulation.SHOOT)),
+    "swarm_sprites": (spawn_obstacles(1000), swarm(1000, 50)),
+    "swarm_store": (spawn_obstacles(1000), swarm(1000, 50)),
+}
+
+# Scenarios run with obstacles, gems and projectiles in an entity store
+ENTITY_STORE_SCENARIOS = {"swarm_store"}
+
+
+def make_game(name):
+    """
+    Description: Create a game on the dummy display with a scenario set up.
+
+    Parameters:
+        name (str): The scenario name.
+
+    Returns:
+        tuple: (game, input source)
+    """
+    import main  # Imported here so the SDL dummy drivers are set before the display is created
+
+    setup, source = SCENARIOS[name]
+    game = main.MetroRunnersGame(seed=SEED, render_mode=frameRenderer.DIRTY,
+                                 entity_store=name in ENTITY_STORE_SCENARIOS)
+    game.render(0.0)  # The home menu, which records the time to first frame
+    game.load_game_scene()
+    game.game_active = True
+    game.sim.spawner = spawnScheduler.SpawnScheduler(STEADY_WAVES, game.sim.clock.now())
+    setup(game.sim)
+    return game, source
+
+
+def run_ticks(game, source, ticks, render):
+    """
+    Description: Run a number of ticks, keeping the player alive so the scenario never ends early.
+
+    Parameters:
+        game (main.MetroRunnersGame): The game to run.
+        source (function): The scenario's input source.
+        ticks (int): The number of ticks to run.
+        render (bool): Whether to render a frame after each tick.
+
+    Returns:
+        tuple: (seconds spent ticking, seconds spent rendering)
+    """
+    tick_time = 0.0
+    render_time = 0.0
+    for i in range(ticks):
+        game.sim.player.health = 100
+        game.actions = set(source(game.sim))
+
+        start = time.perf_counter()
+        game.update_game()
+        tick_time += time.perf_counter() - start
+
+        if render:
+            start = time.perf_counter()
+            game.render(1.0)
+            render_time += time.perf_counter() - start
+    return tick_time, render_time
+
+
+def run_scenario(name, ticks=TICKS):
+    """
+    Description: Measure one scenario in this process.
+
+    Parameters:
+        name (str): The scenario name.
+        ticks (int, optional): The number of ticks to measure.
+
+    Returns:
+        dict: The scenario's metrics.
+    """
+    game, source = make_game(name)
+    run_ticks(game, source, WARMUP_TICKS, True)
+
+    # Timed pass
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    tick_time, render_time = run_ticks(game, source, ticks, True)
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+
+    # Allocation pass
+    tracemalloc.start()
+    run_ticks(game, source, ALLOCATION_TICKS, True)
+    peak_traced = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+    return {
+        "ticks_per_sec": round(ticks / tick_time, 1),
+        "frames_per_sec": round(ticks / render_time, 1),
+        "peak_traced_kb": round(peak_traced / 1024, 1),
+        "gc_collections": collections,
+        "peak_rss_kb": peak_rss,
+        "time_to_first_frame_ms": game.startup["time_to_first_frame_ms"],
+        "time_to_interactive_ms": game.startup["time_to_interactive_ms"],
+        "obstacles": len(game.sim.obstacles),
+        "projectiles": len(game.sim.player.projectiles),
+    }
+
+
+def run_isolated(name, ticks):
+    """
+    Description: Measure one scenario in a fresh process, so peak memory is not shared between scenarios.
+
+    Parameters:
+        name (str): The scenario name.
+        ticks (int): The number of ticks to measure.
+
+    Returns:
+        dict: The scenario's metrics.
+    """
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--scenario", name, "--ticks", str(ticks), "--json"],
+        check=True, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def check_car_hits_player():
+    """
+    Description: Check that a car driven into the player still hurts it, with a fixed seed. The player is shoved
+        out of cars as it updates, so a collision test that misses the strip left over would never report a hit.
+    Parameters: None
+    Returns:
+        bool: True if the car emitted a hit before the check ran out of ticks.
+    """
+    sim = gameSimulation.GameSimulation(seed=SEED)
+    for i in range(60):  # Let the player land first, so the car is driven along the row it stays on
+        if sim.on_ground:
+            break
+        sim.step(())
+    for obstacle in list(sim.obstacles):
+        obstacle.kill()
+    sim.spawn_obstacle(sim.player.rect.right + 40, sim.player.rect.bottom - 50, loop=False)
+    for i in range(60):
+        sim.step(())
+        if "hit" in sim.events:
+            return True
+        if sim.over:
+            break
+    return False
+
+
+def compare_entity_store(results, threshold):
+    """
+    Description: Check that the entity store runs the swarm faster than the sprites it stands in for. Both run
+        the same swarm, so the store has to tick faster, and draws the same sprites, so it may not draw slower by
+        more than the threshold.
+
+    Parameters:
+        results (dict): Metrics by scenario.
+        threshold (float): How much slower, as a fraction, the store may draw.
+
+    Returns:
+        list: A description of each way the store fell behind; empty when the swarm scenarios were not run or
+            NumPy is missing, so the store fell back to sprites.
+    """
+    sprites, store = results.get("swarm_sprites"), results.get("swarm_store")
+    if sprites is None or store is None or entityStore.numpy is None:
+        return []
+    failures = []
+    if store["ticks_per_sec"] <= sprites["ticks_per_sec"]:
+        failures.append(f"swarm_store ticks no faster than swarm_sprites: "
+                        f"{store['ticks_per_sec']} <= {sprites['ticks_per_sec']} ticks/s")
+    if store["frames_per_sec"] < sprites["frames_per_sec"] * (1 - threshold):
+        failures.append(f"swarm_store draws slower than swarm_sprites: "
+                        f"{store['frames_per_sec']} < {sprites['frames_per_sec']} frames/s")
+    return failures
+
+
+def compare(results, baseline, threshold):
+    """
+    Description: Find the metrics that regressed against the baseline.
+
+    Parameters:
+        results (dict): Metrics by scenario.
+        baseline (dict): Baseline metrics by scenario.
+        threshold (float): How much worse, as a fraction, a metric may get before it counts as a regression.
+
+    Returns:
+        list: A description of each regression.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            old = baseline.get(name, {}).get(metric)
+            new = metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    """
+    Description: Run the benchmark from the command line.
+    Parameters: None
+    Returns:
+        int: The exit code, 1 when a metric regressed.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark METRO RUNNERS with scripted stress scenarios.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), help="run only this scenario")
+    parser.add_argument("--ticks", type=int, default=TICKS, help="ticks measured per scenario")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed regression as a fraction")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON only")
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(run_scenario(args.scenario, args.ticks)))
+        return 0
+
+    if not check_car_hits_player():
+        print("FAILED a car driven into the player did not hurt it")
+        return 1
+
+    names = [args.scenario] if args.scenario else list(SCENARIOS)
+    results = {}
+    for name in names:
+        results[name] = run_isolated(name, args.ticks)
+        metrics = results[name]
+        print(f"{name:<16} {metrics['ticks_per_sec']:>9.1f} ticks/s {metrics['frames_per_sec']:>9.1f} frames/s "
+              f"{metrics['peak_traced_kb']:>9.1f} KB traced {metrics['gc_collections']:>5} GCs "
+              f"{metrics['peak_rss_kb']:>8} KB RSS {metrics['time_to_first_frame_ms']:>7.1f} ms TTFF "
+              f"{metrics['time_to_interactive_ms']:>7.1f} ms TTI")
+
+    failures = compare_entity_store(results, args.threshold)
+    for failure in failures:
+        print("FAILED", failure)
+    if failures:
+        return 1
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("No baseline stored yet, run with --update-baseline to create one.")
+        return 0
+    with open(BASELINE_PATH) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print("REGRESSION", regression)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
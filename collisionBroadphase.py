@@ -0,0 +1,408 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the collision broadphase. Once per tick it takes a snapshot of a group's sprites and their rects, then answers every collision query against that group with pygame's C rect-list tests, sorting a busy snapshot along x so each query tests only the sprites near it. Exact queries then test the pixels of only the pairs whose rects overlap, with masks cached by the asset registry. Movers too fast for a per-tick overlap test are swept over their whole move instead, which reports when during the tick they first touch something.
+"""
+
+import bisect
+import math
+from operator import attrgetter
+import pygame
+from assetRegistry import ASSETS
+
+EMPTY_RECT = pygame.Rect(0, 0, 0, 0)  # Stands in for removed sprites; an empty rect never collides
+RECT = attrgetter("rect")
+LEFT = attrgetter("left")
+WIDTH = attrgetter("width")
+SWEEP_SIZE = 64  # The fewest sprites a snapshot sorts along x; smaller ones are quicker to scan whole
+SWEEP_QUERIES = 8  # The queries a snapshot answers by scanning before it is sorted along x
+
+
+def collide_mask(left, right):
+    """
+    Description: Check whether the drawn pixels of two sprites overlap, like pygame.sprite.collide_mask, but with
+        the masks of their current images taken from the asset registry instead of built on every call.
+
+    Parameters:
+        left (pygame.sprite.Sprite): A sprite whose image is drawn at its rect's top left.
+        right (pygame.sprite.Sprite): Another such sprite.
+
+    Returns:
+        bool: True if an opaque pixel of one covers an opaque pixel of the other.
+    """
+    left_rect, right_rect = left.rect, right.rect
+    offset = (right_rect.x - left_rect.x, right_rect.y - left_rect.y)
+    return ASSETS.mask(left.image).overlap(ASSETS.mask(right.image), offset) is not None
+
+
+def axis_times(start, end, move, low, high):
+    """
+    Description: Find when a moving span overlaps a still one along one axis.
+
+    Parameters:
+        start (int): The low edge of the moving span.
+        end (int): The high edge of the moving span.
+        move (float): How far the moving span travels.
+        low (int): The low edge of the still span.
+        high (int): The high edge of the still span.
+
+    Returns:
+        tuple: The (entry, exit) times as fractions of the move, or None if the spans never overlap.
+    """
+    if move > 0:
+        return (low - end) / move, (high - start) / move
+    if move < 0:
+        return (high - start) / move, (low - end) / move
+    if start < high and end > low:
+        return -math.inf, math.inf
+    return None
+
+
+def sweep(rect, dx, dy, obstacle):
+    """
+    Description: Sweep a moving rect over its whole move against a still one, so a move longer than either rect
+        cannot pass straight through the other.
+
+    Rects that only touch do not collide, as with pygame.Rect.colliderect, so a rect resting against another can
+    slide along it but not move into it.
+
+    Parameters:
+        rect (pygame.Rect): The moving rect where its move starts.
+        dx (float): How far it moves to the right.
+        dy (float): How far it moves down.
+        obstacle (pygame.Rect): The still rect.
+
+    Returns:
+        tuple: The time of impact as a fraction of the move from 0 up to 1, and the (x, y) normal of the face hit,
+            pointing back at the mover. None when the move ends before touching the obstacle, never comes near
+            it, or starts inside it.
+    """
+    x_times = axis_times(rect.left, rect.right, dx, obstacle.left, obstacle.right)
+    y_times = axis_times(rect.top, rect.bottom, dy, obstacle.top, obstacle.bottom)
+    if x_times is None or y_times is None:
+        return None
+    entry = max(x_times[0], y_times[0])
+    if entry < 0 or entry >= 1 or entry >= min(x_times[1], y_times[1]):
+        return None
+    if x_times[0] > y_times[0]:
+        return entry, (-1 if dx > 0 else 1, 0)
+    return entry, (0, -1 if dy > 0 else 1)
+
+
+def first_impact(rect, dx, dy, sprites):
+    """
+    Description: Find the first of several sprites a moving rect runs into.
+
+    Parameters:
+        rect (pygame.Rect): The moving rect where its move starts.
+        dx (float): How far it moves to the right.
+        dy (float): How far it moves down.
+        sprites (iterable): The still sprites that may be in the way.
+
+    Returns:
+        tuple: The (time of impact, normal, sprite) of the earliest hit, the first in order on a tie, or None.
+    """
+    first = None
+    for sprite in sprites:
+        impact = sweep(rect, dx, dy, sprite.rect)
+        if impact is not None and (first is None or impact[0] < first[0]):
+            first = (impact[0], impact[1], sprite)
+    return first
+
+
+class TrackedGroup(pygame.sprite.Group):
+    """
+    Description: A sprite group that counts the changes to its members, so a broadphase can keep the sprites and
+        rects it took from the group until they change. Sprites keep their Rect objects for life, so the rects it
+        kept still show where they are.
+
+    Attributes:
+        changes (int): The sprites added to or removed from the group so far.
+    """
+
+    def __init__(self, *sprites):
+        """
+        Description: Initialize a group.
+
+        Parameters:
+            *sprites (pygame.sprite.Sprite): The sprites to start with.
+
+        Returns: None
+        """
+        self.changes = 0
+        pygame.sprite.Group.__init__(self, *sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Description: Add a sprite to the group, counting the change. Called by pygame.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+            layer (int, optional): Unused, as the group has no layers.
+
+        Returns: None
+        """
+        self.changes += 1
+        pygame.sprite.Group.add_internal(self, sprite, layer)
+
+    def remove_internal(self, sprite):
+        """
+        Description: Remove a sprite from the group, counting the change. Called by pygame.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+
+        Returns: None
+        """
+        self.changes += 1
+        pygame.sprite.Group.remove_internal(self, sprite)
+
+
+class Broadphase:
+    """
+    Description: A per-tick snapshot of one group used for all of its collision queries, sorted along x once it is
+        queried enough that each query should only test the sprites that could reach it (sort and sweep).
+
+    The snapshot holds the sprites' own Rect objects. A rect can only collide with another that starts left of its
+    right edge and no further left of its left edge than the widest rect in the snapshot, so once the rects are
+    ordered by their left edges a query bisects for that run of the order and tests just those rects. Its cost then
+    follows how many sprites are near it rather than how many are in the snapshot. Sorting costs about as much as
+    SWEEP_QUERIES scans of the whole snapshot, so the first queries after a sync scan every rect with one C call,
+    and snapshots of fewer than SWEEP_SIZE sprites are never sorted. The order is taken from where the sprites are,
+    so a caller that moves them between queries calls refresh first; spawns and deaths mid-tick are put in with add
+    and remove. Results come back in group order, so they match what pygame.sprite.spritecollide and
+    spritecollideany would find. Exact queries keep only the rect hits whose pixels overlap as well, so the mask
+    test runs for a handful of pairs rather than all of them. The sprites and rects of a TrackedGroup are kept from
+    one sync to the next until its members change, so a sync of an unchanged group only culls them.
+
+    Attributes:
+        sprites (list): The group's sprites when last synced, in group order.
+        rects (list): The rect of each sprite, or EMPTY_RECT once it has been removed.
+        indices (dict): Maps each sprite in the snapshot to its index in sprites and rects, or None until the
+            first removal needs it.
+        scans (int): The queries answered by scanning every rect since the last sync.
+        order (list): The index of each sprite, sorted by the left edge of its rect, or None until sorted.
+        lefts (list): The left edge of each rect in that order, as of when it was sorted.
+        sorted_rects (list): The rect at each place in that order, or EMPTY_RECT once removed.
+        reach (int): The width of the widest rect in the snapshot once sorted.
+        group (TrackedGroup): The tracked group last synced, or None.
+        changes (int): The group's change count when its sprites and rects were kept.
+        group_sprites (list): The kept sprites of the group, in group order.
+        group_rects (list): The kept rect of each of those sprites.
+    """
+
+    def __init__(self):
+        """
+        Description: Initialize an empty broadphase.
+        Parameters: None
+        Returns: None
+        """
+        self.sprites = []
+        self.rects = []
+        self.indices = None
+        self.scans = 0
+        self.order = None
+        self.lefts = []
+        self.sorted_rects = []
+        self.reach = 0
+        self.group = None
+        self.changes = None
+        self.group_sprites = []
+        self.group_rects = []
+
+    def sync(self, group, area=None):
+        """
+        Description: Take a new snapshot of a group after sprites spawned or died.
+
+        Parameters:
+            group (pygame.sprite.Group): The group to snapshot, or a list of some of its sprites in group order.
+            area (pygame.Rect, optional): Keep only the sprites whose rects collide with it, such as the viewport.
+
+        Returns: None
+        """
+        changes = getattr(group, "changes", None)
+        if changes is None:
+            # A group's sprites() is a new list already, and skips the Python-level __iter__ that list(group) runs
+            self.sprites = group.sprites() if isinstance(group, pygame.sprite.AbstractGroup) else list(group)
+            self.rects = list(map(RECT, self.sprites))
+        else:
+            if group is not self.group or changes != self.changes:
+                self.group_sprites = group.sprites()
+                self.group_rects = list(map(RECT, self.group_sprites))
+                self.group, self.changes = group, changes
+            self.sprites, self.rects = self.group_sprites, self.group_rects  # Copied by add and remove before changing
+        if area is not None:
+            inside = area.collidelistall(self.rects)
+            if len(inside) < len(self.rects):
+                self.sprites = list(map(self.sprites.__getitem__, inside))
+                self.rects = list(map(self.rects.__getitem__, inside))
+        self.indices = None
+        self.scans = 0
+        self.order = None
+
+    def sort(self):
+        """
+        Description: Order the snapshot along x by where its rects are now.
+        Parameters: None
+        Returns: None
+        """
+        rects = self.rects
+        lefts = list(map(LEFT, rects))
+        if self.order is None:
+            self.order = list(range(len(rects)))
+            self.reach = max(map(WIDTH, rects))
+        self.order.sort(key=lefts.__getitem__)  # After a refresh it is nearly in order, which the sort runs through
+        self.lefts = list(map(lefts.__getitem__, self.order))
+        self.sorted_rects = list(map(rects.__getitem__, self.order))
+
+    def refresh(self):
+        """
+        Description: Sort the snapshot along x again after its sprites moved, if it has been sorted.
+        Parameters: None
+        Returns: None
+        """
+        if self.order is not None:
+            self.sort()
+
+    def add(self, sprite):
+        """
+        Description: Put a sprite spawned since the last sync into the snapshot.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+
+        Returns: None
+        """
+        index = len(self.sprites)
+        rect = sprite.rect
+        if self.rects is self.group_rects:
+            self.sprites, self.rects = self.sprites[:], self.rects[:]
+        if self.indices is not None:
+            self.indices[sprite] = index
+        self.sprites.append(sprite)
+        self.rects.append(rect)
+        if self.order is not None:
+            place = bisect.bisect_right(self.lefts, rect.x)
+            self.order.insert(place, index)
+            self.lefts.insert(place, rect.x)
+            self.sorted_rects.insert(place, rect)
+            self.reach = max(self.reach, rect.width)
+
+    def remove(self, sprite):
+        """
+        Description: Take a sprite out of the snapshot, such as right after it is killed mid-tick.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+
+        Returns: None
+        """
+        if self.indices is None:
+            self.indices = dict(zip(self.sprites, range(len(self.sprites))))
+        index = self.indices.get(sprite)
+        if index is None or self.rects[index] is EMPTY_RECT:
+            return
+        if self.rects is self.group_rects:
+            self.sprites, self.rects = self.sprites[:], self.rects[:]
+        self.rects[index] = EMPTY_RECT
+        if self.order is not None:
+            self.sorted_rects[self.order.index(index)] = EMPTY_RECT  # A few per tick, so a search beats an inverse
+
+    def hits(self, rect):
+        """
+        Description: Find the index of every sprite in the snapshot whose rect collides with an area.
+
+        Parameters:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            list: The indices in sprites, in group order.
+        """
+        if self.order is None:
+            if self.scans < SWEEP_QUERIES or len(self.rects) < SWEEP_SIZE:
+                self.scans += 1
+                return rect.collidelistall(self.rects)
+            self.sort()
+        low = bisect.bisect_right(self.lefts, rect.left - self.reach)
+        high = bisect.bisect_left(self.lefts, rect.right, low)
+        order = self.order
+        return sorted([order[low + place] for place in rect.collidelistall(self.sorted_rects[low:high])])
+
+    def collide(self, sprite, exact=False):
+        """
+        Description: Find every sprite in the snapshot that collides with a sprite, like pygame.sprite.spritecollide.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite to test.
+            exact (bool, optional): Whether to count only sprites whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            list: The colliding sprites, in group order.
+        """
+        hits = [self.sprites[index] for index in self.hits(sprite.rect)]
+        if exact:
+            hits = [hit for hit in hits if collide_mask(sprite, hit)]
+        return hits
+
+    def overlaps(self, rect):
+        """
+        Description: Check whether an area overlaps any sprite in the snapshot.
+
+        Parameters:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            bool: True if some sprite's rect collides with the area.
+        """
+        return len(self.hits(rect)) > 0
+
+    def within(self, rect):
+        """
+        Description: Find every sprite in the snapshot that collides with an area, such as the path of a sweep.
+            Sprites that have left their groups since the snapshot, such as cars that drove off the screen, are
+            left out.
+
+        Parameters:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            list: The sprites, in group order.
+        """
+        sprites = [self.sprites[index] for index in self.hits(rect)]
+        return [sprite for sprite in sprites if sprite.alive()]
+
+    def collide_any(self, sprite, exact=False):
+        """
+        Description: Find the first sprite in the snapshot that collides with a sprite, like
+            pygame.sprite.spritecollideany.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite to test.
+            exact (bool, optional): Whether to count only sprites whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            pygame.sprite.Sprite: The first colliding sprite in group order, or None.
+        """
+        for index in self.hits(sprite.rect):
+            if not exact or collide_mask(sprite, self.sprites[index]):
+                return self.sprites[index]
+        return None
+
+    def first_hits(self, sprites, exact=False):
+        """
+        Description: Pair each of several sprites with the first sprite in the snapshot it collides with.
+
+        Pairs are found one sprite at a time as they are asked for, so a sprite removed from the snapshot after
+        an earlier pair is not hit again.
+
+        Parameters:
+            sprites (iterable): The sprites to test, in the order to resolve them.
+            exact (bool, optional): Whether to count only sprites whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            generator: (sprite, sprite hit) pairs.
+        """
+        for sprite in sprites:
+            hit = self.collide_any(sprite, exact)
+            if hit is not None:
+                yield sprite, hit
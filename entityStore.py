@@ -0,0 +1,647 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the array-backed entity store. Obstacles, gems and projectiles keep their positions, speeds, sizes and types in NumPy arrays, so moving, culling and collision testing all of them is a handful of array operations per tick instead of a Python update() per sprite. Each entity is drawn through a thin sprite view whose rect the store moves along with the arrays.
+"""
+
+import random
+import pygame
+from movingSprites import PooledSprite, SCREEN_WIDTH, SCREEN_HEIGHT
+from animationClip import AnimationClip
+from assetRegistry import ASSETS
+from collisionBroadphase import Broadphase, collide_mask
+
+try:
+    import numpy
+except ImportError:  # The simulation falls back to sprites that move themselves without NumPy
+    numpy = None
+
+# Entity types
+OBSTACLE = 0
+GEM = 1
+PROJECTILE = 2
+DIRECTION = (-1, -1, 1)  # Obstacles and gems move left, projectiles move right
+
+OBSTACLE_IMAGE = "01. Visual Assets/05. Other Sprites/flying car.png"
+GEM_IMAGES = ("01. Visual Assets/04. Gem Sprites/gem1.png", "01. Visual Assets/04. Gem Sprites/gem2.png",
+              "01. Visual Assets/04. Gem Sprites/gem3.png", "01. Visual Assets/04. Gem Sprites/gem4.png")
+PROJECTILE_IMAGES = ("01. Visual Assets/01. Projectile Sprites/shuriken1.png",
+                     "01. Visual Assets/01. Projectile Sprites/shuriken2.png",
+                     "01. Visual Assets/01. Projectile Sprites/shuriken3.png",
+                     "01. Visual Assets/01. Projectile Sprites/shuriken4.png")
+PROJECTILE_SPEED = 15
+PROJECTILE_FRAME_DELAY = 2  # Updates between frame changes, as for movingSprites.Projectile
+
+
+def to_pixel(value):
+    """
+    Description: Round a coordinate to a pixel the way assigning it to a pygame.Rect edge does.
+
+    Parameters:
+        value (float): The coordinate.
+
+    Returns:
+        int: The pixel.
+    """
+    rect = pygame.Rect(0, 0, 0, 0)
+    rect.x = value
+    return rect.x
+
+
+WRAP_LEFT = to_pixel(SCREEN_WIDTH)  # Where looping obstacles come back in
+
+
+class EntityStore:
+    """
+    Description: Struct-of-arrays storage for every obstacle, gem and projectile of a run.
+
+    Each entity has a slot, the same index into every array. Freed slots are reused, so the arrays only grow to
+    the most entities alive at once. Entities also get a serial number when they spawn, and anything done to
+    several of them at once (wrapping, killing, query results) happens in serial order, which is the order their
+    sprite groups hold them in.
+
+    Attributes:
+        capacity (int): The length of the arrays.
+        size (int): Slots in use or freed so far; slots past it have never been used.
+        x (numpy.ndarray): The left edge of each entity in pixels.
+        y (numpy.ndarray): The top edge of each entity in pixels.
+        w (numpy.ndarray): The width of each entity.
+        h (numpy.ndarray): The height of each entity.
+        speed (numpy.ndarray): Pixels moved per update at 30 ticks per second.
+        remainder (numpy.ndarray): The fraction of a pixel carried over to the next update.
+        kind (numpy.ndarray): OBSTACLE, GEM or PROJECTILE.
+        alive (numpy.ndarray): Whether the slot holds a live entity.
+        loop (numpy.ndarray): Whether an obstacle wraps back to the right edge instead of leaving the screen.
+        serial (numpy.ndarray): The spawn order of each entity.
+        animation_count (numpy.ndarray): Updates since the entity's last frame change.
+        frame (numpy.ndarray): The animation frame each entity shows.
+        views (list): The sprite view of each slot.
+        free (list): Freed slots ready for reuse.
+        spawned (int): Entities added so far, which numbers the next serial.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Description: Initialize an empty store.
+
+        Parameters:
+            capacity (int, optional): Slots to allocate up front; the arrays double whenever they fill.
+
+        Returns: None
+        """
+        self.capacity = capacity
+        self.size = 0
+        self.x = numpy.zeros(capacity, numpy.int32)
+        self.y = numpy.zeros(capacity, numpy.int32)
+        self.w = numpy.zeros(capacity, numpy.int32)
+        self.h = numpy.zeros(capacity, numpy.int32)
+        self.speed = numpy.zeros(capacity, numpy.float64)
+        self.remainder = numpy.zeros(capacity, numpy.float64)
+        self.kind = numpy.zeros(capacity, numpy.int8)
+        self.alive = numpy.zeros(capacity, bool)
+        self.loop = numpy.zeros(capacity, bool)
+        self.serial = numpy.zeros(capacity, numpy.int64)
+        self.animation_count = numpy.zeros(capacity, numpy.float64)
+        self.frame = numpy.zeros(capacity, numpy.int64)
+        self.views = [None] * capacity
+        self.free = []
+        self.spawned = 0
+
+    def __len__(self):
+        """
+        Description: Count the live entities.
+        Parameters: None
+        Returns:
+            int: The number of live entities.
+        """
+        return int(self.alive[:self.size].sum())
+
+    def grow(self):
+        """
+        Description: Double the length of every array.
+        Parameters: None
+        Returns: None
+        """
+        for name in ("x", "y", "w", "h", "speed", "remainder", "kind", "alive", "loop", "serial",
+                     "animation_count", "frame"):
+            old = getattr(self, name)
+            new = numpy.zeros(self.capacity * 2, old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.views.extend([None] * self.capacity)
+        self.capacity *= 2
+
+    def add(self, view, kind, x, y, width, height, speed, loop=False):
+        """
+        Description: Give an entity a slot.
+
+        Parameters:
+            view (EntityView): The sprite that draws the entity.
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+            x (float): The left edge. Rounded to a pixel the way pygame.Rect rounds.
+            y (float): The top edge. Rounded the same way.
+            width (int): The width.
+            height (int): The height.
+            speed (float): Pixels moved per update at 30 ticks per second.
+            loop (bool, optional): Whether an obstacle wraps back to the right edge instead of leaving the screen.
+
+        Returns:
+            int: The slot.
+        """
+        x, y = to_pixel(x), to_pixel(y)
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.size == self.capacity:
+                self.grow()
+            slot = self.size
+            self.size += 1
+        self.x[slot] = x
+        self.y[slot] = y
+        self.w[slot] = width
+        self.h[slot] = height
+        self.speed[slot] = speed
+        self.remainder[slot] = 0.0
+        self.kind[slot] = kind
+        self.alive[slot] = True
+        self.loop[slot] = loop
+        self.serial[slot] = self.spawned
+        self.animation_count[slot] = 0.0
+        self.frame[slot] = 0
+        self.views[slot] = view
+        self.spawned += 1
+        view.rect.update(x, y, width, height)
+        return slot
+
+    def remove(self, slot):
+        """
+        Description: Free an entity's slot.
+
+        Parameters:
+            slot (int): The slot.
+
+        Returns: None
+        """
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self.views[slot] = None
+            self.free.append(slot)
+
+    def slots(self, kind):
+        """
+        Description: Find the live entities of a type.
+
+        Parameters:
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+
+        Returns:
+            numpy.ndarray: Their slots, in serial order.
+        """
+        size = self.size
+        slots = numpy.flatnonzero(self.alive[:size] & (self.kind[:size] == kind))
+        return slots[numpy.argsort(self.serial[slots], kind="stable")]
+
+    def update(self, step, kind, frames=1):
+        """
+        Description: Move every live entity of a type one update, then wrap or kill those that left the screen.
+
+        Like movingSprites.carry, each entity moves in whole pixels and carries the fraction to its next update.
+        The views' rects are moved to match in one pass, and the images of views whose animation turned are set
+        to their new frames, so drawing and collision code read them like any sprite's. Looping obstacles that left come back in at the right edge at a random height; everything
+        else that left is killed through its view, so it returns to its pool.
+
+        Parameters:
+            step (float): The length of this tick as a fraction of a 30 FPS frame.
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+            frames (int, optional): The number of animation frames the type cycles through.
+
+        Returns: None
+        """
+        slots = self.slots(kind)
+        if not len(slots):
+            return
+
+        views = self.views
+        if frames > 1:
+            count = self.animation_count[slots] + step
+            turn = count >= PROJECTILE_FRAME_DELAY
+            count[turn] = 0
+            self.animation_count[slots] = count
+            turned = slots[turn]
+            self.frame[turned] = (self.frame[turned] + 1) % frames
+            for slot, frame in zip(turned.tolist(), self.frame[turned].tolist()):
+                views[slot].image = views[slot].images[frame]
+
+        amount = self.speed[slots] * step + self.remainder[slots]
+        whole = amount.astype(numpy.int64)  # Truncates like int()
+        self.remainder[slots] = amount - whole
+        x = self.x[slots] + DIRECTION[kind] * whole
+        self.x[slots] = x
+        for slot, left in zip(slots.tolist(), x.tolist()):
+            views[slot].rect.x = left
+
+        if kind == PROJECTILE:
+            gone = slots[x > SCREEN_WIDTH]
+        else:
+            gone = slots[x + self.w[slots] < 0]
+        if not len(gone):
+            return
+
+        # Rare enough to handle one by one, in spawn order so the random heights come out the same every run
+        for slot in gone.tolist():
+            view = self.views[slot]
+            if kind == OBSTACLE and self.loop[slot]:
+                top = view.rng.randint(50, SCREEN_HEIGHT - 50) - view.rect.height
+                self.x[slot] = WRAP_LEFT
+                self.y[slot] = top
+                view.rect.topleft = (WRAP_LEFT, top)
+            else:
+                view.kill()
+
+    def hits(self, kind, rect, skip=None):
+        """
+        Description: Find the live entities of a type that collide with an area, like pygame.Rect.collidelistall.
+
+        Parameters:
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+            rect (pygame.Rect): The area.
+            skip (int, optional): A slot to leave out, such as the entity asking.
+
+        Returns:
+            numpy.ndarray: Their slots, in serial order.
+        """
+        slots = self.slots(kind)
+        if rect.width <= 0 or rect.height <= 0 or not len(slots):
+            return slots[:0]
+        x, y = self.x[slots], self.y[slots]
+        touching = ((x < rect.right) & (x + self.w[slots] > rect.left)
+                    & (y < rect.bottom) & (y + self.h[slots] > rect.top))
+        if skip is not None:
+            touching &= slots != skip
+        return slots[touching]
+
+    def first_hits(self, kind, views, exact=False):
+        """
+        Description: Pair each of several entities with the first live entity of a type it collides with.
+
+        Every pair of rects is tested at once. The pairs are handed out one at a time and an entity killed by an
+        earlier pair is passed over, so each can only be hit once.
+
+        Parameters:
+            kind (int): The type to test against.
+            views (iterable): The views of the entities to test, in the order to resolve them.
+            exact (bool, optional): Whether to count only entities whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            generator: (view, view hit) pairs.
+        """
+        views = [view for view in views if view.slot is not None]
+        targets = self.slots(kind)
+        if not views or not len(targets):
+            return
+        sources = numpy.array([view.slot for view in views])
+        ax, ay = self.x[sources][:, None], self.y[sources][:, None]
+        bx, by = self.x[targets][None, :], self.y[targets][None, :]
+        touching = ((ax < bx + self.w[targets][None, :]) & (ax + self.w[sources][:, None] > bx)
+                    & (ay < by + self.h[targets][None, :]) & (ay + self.h[sources][:, None] > by))
+        for row in numpy.flatnonzero(touching.any(axis=1)).tolist():
+            if views[row].slot is None:
+                continue  # Killed by an earlier pair
+            for slot in targets[touching[row]].tolist():
+                if self.alive[slot] and (not exact or collide_mask(views[row], self.views[slot])):
+                    yield views[row], self.views[slot]
+                    break
+
+
+class EntityBroadphase(Broadphase):
+    """
+    Description: The collision queries of one entity type, answered straight from the store's arrays.
+
+    It stands in for a collisionBroadphase.Broadphase, so the simulation and player run the same collision code
+    either way. The arrays are always current, so there is nothing to sync, and killed entities leave the store
+    at once. A view is never reported as colliding with itself.
+
+    Attributes:
+        store (EntityStore): The store.
+        kind (int): OBSTACLE, GEM or PROJECTILE.
+    """
+
+    def __init__(self, store, kind):
+        """
+        Description: Initialize the queries of a type.
+
+        Parameters:
+            store (EntityStore): The store.
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+
+        Returns: None
+        """
+        Broadphase.__init__(self)
+        self.store = store
+        self.kind = kind
+
+    def sync(self, group, area=None):
+        """
+        Description: Nothing to do; the store is always current.
+
+        Parameters:
+            group (pygame.sprite.Group): Ignored.
+            area (pygame.Rect, optional): Ignored.
+
+        Returns: None
+        """
+
+    def refresh(self):
+        """
+        Description: Nothing to do; the arrays move with the entities.
+        Parameters: None
+        Returns: None
+        """
+
+    def add(self, sprite):
+        """
+        Description: Nothing to do; the sprite's entity joined the store when it spawned.
+
+        Parameters:
+            sprite (EntityView): Ignored.
+
+        Returns: None
+        """
+
+    def remove(self, sprite):
+        """
+        Description: Nothing to do; the sprite's entity left the store when it was killed.
+
+        Parameters:
+            sprite (EntityView): Ignored.
+
+        Returns: None
+        """
+
+    def collide(self, sprite, exact=False):
+        """
+        Description: Find every entity of this type that collides with a sprite.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite to test.
+            exact (bool, optional): Whether to count only entities whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            list: The colliding views, in spawn order.
+        """
+        views = self.store.views
+        hits = [views[slot] for slot in self.store.hits(self.kind, sprite.rect, getattr(sprite, "slot", None))]
+        if exact:
+            hits = [hit for hit in hits if collide_mask(sprite, hit)]
+        return hits
+
+    def overlaps(self, rect):
+        """
+        Description: Check whether an area overlaps any entity of this type.
+
+        Parameters:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            bool: True if some entity collides with the area.
+        """
+        return len(self.store.hits(self.kind, rect)) > 0
+
+    def within(self, rect):
+        """
+        Description: Find every entity of this type that collides with an area.
+
+        Parameters:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            list: The views, in spawn order.
+        """
+        return [self.store.views[slot] for slot in self.store.hits(self.kind, rect).tolist()]
+
+    def collide_any(self, sprite, exact=False):
+        """
+        Description: Find the first entity of this type that collides with a sprite.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite to test.
+            exact (bool, optional): Whether to count only entities whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            EntityView: The first colliding view in spawn order, or None.
+        """
+        slots = self.store.hits(self.kind, sprite.rect, getattr(sprite, "slot", None))
+        if not exact:
+            return self.store.views[slots[0]] if len(slots) else None
+        for slot in slots.tolist():
+            if collide_mask(sprite, self.store.views[slot]):
+                return self.store.views[slot]
+        return None
+
+    def first_hits(self, sprites, exact=False):
+        """
+        Description: Pair each of several sprites with the first entity of this type it collides with.
+
+        Parameters:
+            sprites (iterable): Views of other entities in the store, in the order to resolve them.
+            exact (bool, optional): Whether to count only entities whose drawn pixels overlap, not just their rects.
+
+        Returns:
+            generator: (sprite, view hit) pairs.
+        """
+        return self.store.first_hits(self.kind, sprites, exact)
+
+
+class EntityView(PooledSprite):
+    """
+    Description: A thin sprite that draws one entity of the store.
+
+    The view keeps one rect for good, which the store moves along with the entity's place in the arrays, so
+    update() does nothing. Killing the view frees its slot and returns it to its pool, leaving the rect where the
+    entity was last.
+
+    Attributes:
+        store (EntityStore): The store holding the entity.
+        slot (int): The entity's slot, or None while the view is not in use.
+        image (pygame.Surface): The image to draw.
+        rect (pygame.Rect): The entity's rect, read like any sprite's but only moved by the store.
+    """
+
+    def __init__(self, store, image):
+        """
+        Description: Initialize a view that is not in use yet.
+
+        Parameters:
+            store (EntityStore): The store.
+            image (pygame.Surface): The image to draw.
+
+        Returns: None
+        """
+        PooledSprite.__init__(self)
+        self.store = store
+        self.slot = None
+        self.image = image
+        self.rect = image.get_rect()
+
+    def place(self, kind, x, y, speed, loop=False):
+        """
+        Description: Give the view a new entity in the store.
+
+        Parameters:
+            kind (int): OBSTACLE, GEM or PROJECTILE.
+            x (float): The left edge.
+            y (float): The top edge.
+            speed (float): Pixels moved per update at 30 ticks per second.
+            loop (bool, optional): Whether an obstacle wraps back to the right edge instead of leaving the screen.
+
+        Returns: None
+        """
+        self.release()
+        width, height = self.image.get_size()
+        self.slot = self.store.add(self, kind, x, y, width, height, speed, loop)
+
+    def release(self):
+        """
+        Description: Free the view's slot, if it has one.
+        Parameters: None
+        Returns: None
+        """
+        if self.slot is not None:
+            self.store.remove(self.slot)
+            self.slot = None
+
+    def deactivate(self):
+        """
+        Description: Mark the view as free and give up its slot.
+        Parameters: None
+        Returns: None
+        """
+        PooledSprite.deactivate(self)
+        self.release()
+
+    def kill(self):
+        """
+        Description: Remove the view from all groups, free its slot and return it to its pool.
+        Parameters: None
+        Returns: None
+        """
+        PooledSprite.kill(self)
+        self.release()
+
+    def update(self, step=1.0):
+        """
+        Description: Nothing to do; the store moves every entity at once.
+
+        Parameters:
+            step (float, optional): Ignored.
+
+        Returns: None
+        """
+
+
+class ObstacleView(EntityView):
+    """
+    Description: The view of an obstacle, reset like a movingSprites.Obstacle.
+
+    Attributes:
+        rng (random.Random): The random number generator used to pick a new height when the obstacle wraps.
+    """
+
+    def __init__(self, store):
+        """
+        Description: Initialize an obstacle view.
+
+        Parameters:
+            store (EntityStore): The store.
+
+        Returns: None
+        """
+        EntityView.__init__(self, store, ASSETS.sprite(OBSTACLE_IMAGE, (100, 50)))
+        self.rng = random
+
+    def reset(self, x, y, speed, rng=random, loop=True):
+        """
+        Description: Place the obstacle for a new use.
+
+        Parameters:
+            x (float): The x-coordinate of the obstacle.
+            y (float): The y-coordinate of the obstacle.
+            speed (int): The speed at which the obstacle moves.
+            rng (random.Random, optional): The random number generator to use. Defaults to the global one.
+            loop (bool, optional): Whether it wraps back to the right edge instead of leaving the screen.
+
+        Returns: None
+        """
+        self.rng = rng
+        self.place(OBSTACLE, x, y, speed, loop)
+
+
+class GemView(EntityView):
+    """
+    Description: The view of a gem, reset like a movingSprites.Gems.
+
+    Attributes:
+        scaled_images (list): The four gem looks.
+    """
+
+    def __init__(self, store):
+        """
+        Description: Initialize a gem view.
+
+        Parameters:
+            store (EntityStore): The store.
+
+        Returns: None
+        """
+        self.scaled_images = [ASSETS.sprite(path, (35, 35)) for path in GEM_IMAGES]
+        EntityView.__init__(self, store, self.scaled_images[0])
+
+    def reset(self, x, y, speed, image_index):
+        """
+        Description: Place the gem for a new use.
+
+        Parameters:
+            x (float): The x-coordinate of the gem.
+            y (float): The y-coordinate of the gem.
+            speed (int): The speed at which the gem moves.
+            image_index (int): The index to choose the gem image.
+
+        Returns: None
+        """
+        self.image = self.scaled_images[image_index]
+        self.place(GEM, x, y, speed)
+
+
+class ProjectileView(EntityView):
+    """
+    Description: The view of a projectile, reset like a movingSprites.Projectile. Its image follows the
+        animation frame kept in the store.
+
+    Attributes:
+        images (list): The projectile animation, pre-scaled to 25x25.
+    """
+
+    def __init__(self, store):
+        """
+        Description: Initialize a projectile view.
+
+        Parameters:
+            store (EntityStore): The store.
+
+        Returns: None
+        """
+        self.images = AnimationClip(PROJECTILE_IMAGES, (25, 25)).frames()
+        EntityView.__init__(self, store, self.images[0])
+
+    def reset(self, x, y):
+        """
+        Description: Place the projectile for a new throw.
+
+        Parameters:
+            x (float): The x-coordinate of the projectile.
+            y (float): The y-coordinate of the projectile.
+
+        Returns: None
+        """
+        self.image = self.images[0]
+        self.place(PROJECTILE, x, y, PROJECTILE_SPEED)
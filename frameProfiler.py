@@ -0,0 +1,284 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the frame profiler. Named scopes time each phase of a frame into fixed-size ring buffers, which can be shown as an on-screen overlay of percentiles and dumped to CSV or JSON. When disabled, a scope costs one method call.
+"""
+
+import pygame
+import time
+import json
+import csv
+
+SAMPLE_COUNT = 300  # Samples kept per phase, about 10 seconds of frames at 30 FPS
+OVERLAY_REFRESH = 15  # Frames between overlay redraws
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 170)
+
+
+class RingBuffer:
+    """
+    Description: A fixed-size buffer that overwrites its oldest value once full.
+
+    Attributes:
+        values (list): The stored values, preallocated to the buffer size.
+        index (int): Where the next value goes.
+        count (int): How many values have been stored, up to the buffer size.
+    """
+
+    def __init__(self, size):
+        """
+        Description: Initialize an empty ring buffer.
+
+        Parameters:
+            size (int): The number of values to keep.
+
+        Returns: None
+        """
+        self.values = [0.0] * size
+        self.index = 0
+        self.count = 0
+
+    def append(self, value):
+        """
+        Description: Store a value, overwriting the oldest one when full.
+
+        Parameters:
+            value (float): The value to store.
+
+        Returns: None
+        """
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        if self.count < len(self.values):
+            self.count += 1
+
+    def samples(self):
+        """
+        Description: Get the stored values, oldest first.
+        Parameters: None
+        Returns:
+            list: The stored values.
+        """
+        if self.count < len(self.values):
+            return self.values[:self.count]
+        return self.values[self.index:] + self.values[:self.index]
+
+    def percentile(self, fraction):
+        """
+        Description: Get a percentile of the stored values.
+
+        Parameters:
+            fraction (float): The percentile as a fraction, such as 0.95.
+
+        Returns:
+            float: The value at that percentile, or 0.0 when empty.
+        """
+        if not self.count:
+            return 0.0
+        ordered = sorted(self.values[:self.count])
+        return ordered[min(self.count - 1, int(fraction * self.count))]
+
+
+class NullScope:
+    """
+    Description: A scope that does nothing, returned while the profiler is disabled.
+    """
+
+    def __enter__(self):
+        """Description: Do nothing on entering the scope."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Description: Do nothing on leaving the scope."""
+        return False
+
+
+NULL_SCOPE = NullScope()
+
+
+class Scope:
+    """
+    Description: Times one named phase each time it is entered.
+
+    Attributes:
+        buffer (RingBuffer): The phase's recent durations in milliseconds.
+        start (float): When the phase was last entered.
+    """
+
+    def __init__(self, size):
+        """
+        Description: Initialize a scope.
+
+        Parameters:
+            size (int): The number of samples to keep.
+
+        Returns: None
+        """
+        self.buffer = RingBuffer(size)
+        self.start = 0.0
+
+    def __enter__(self):
+        """Description: Start timing the phase."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Description: Record how long the phase took."""
+        self.buffer.append((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class FrameProfiler:
+    """
+    Description: Collects per-phase frame timings and entity counts.
+
+    Usage: with PROFILER.scope("collision"): ...
+
+    Attributes:
+        enabled (bool): Whether scopes record anything.
+        show_overlay (bool): Whether the overlay should be drawn.
+        scopes (dict): The Scope of each phase name, in the order first seen.
+        counts (dict): The latest value of each counter, such as the number of obstacles.
+        sample_count (int): The number of samples kept per phase.
+        overlay (pygame.Surface): The last rendered overlay.
+        overlay_age (int): Frames since the overlay was rendered.
+    """
+
+    def __init__(self, enabled=False, sample_count=SAMPLE_COUNT):
+        """
+        Description: Initialize the profiler.
+
+        Parameters:
+            enabled (bool, optional): Whether to start recording straight away.
+            sample_count (int, optional): The number of samples kept per phase.
+
+        Returns: None
+        """
+        self.enabled = enabled
+        self.show_overlay = False
+        self.sample_count = sample_count
+        self.scopes = {}
+        self.counts = {}
+        self.overlay = None
+        self.overlay_font = None
+        self.overlay_age = OVERLAY_REFRESH
+
+    def scope(self, name):
+        """
+        Description: Get the timing scope of a phase.
+
+        Parameters:
+            name (str): The phase name.
+
+        Returns:
+            Scope: A context manager that times the phase, or a shared no-op scope when disabled.
+        """
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = Scope(self.sample_count)
+        return scope
+
+    def count(self, name, value):
+        """
+        Description: Record the latest value of a counter.
+
+        Parameters:
+            name (str): The counter name.
+            value (int): Its current value.
+
+        Returns: None
+        """
+        if self.enabled:
+            self.counts[name] = value
+
+    def toggle_overlay(self):
+        """
+        Description: Show or hide the overlay, enabling the profiler when it is shown.
+        Parameters: None
+        Returns: None
+        """
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enabled = True
+        self.overlay_age = OVERLAY_REFRESH
+
+    def summary(self):
+        """
+        Description: Summarize every phase.
+        Parameters: None
+        Returns:
+            dict: p50, p95 and p99 in milliseconds for each phase.
+        """
+        return {
+            name: {
+                "p50": round(scope.buffer.percentile(0.50), 3),
+                "p95": round(scope.buffer.percentile(0.95), 3),
+                "p99": round(scope.buffer.percentile(0.99), 3),
+            }
+            for name, scope in self.scopes.items()
+        }
+
+    def overlay_surface(self):
+        """
+        Description: Get the overlay showing the percentiles of each phase and the entity counts.
+
+        The overlay is only re-rendered every OVERLAY_REFRESH frames, so showing it costs little.
+
+        Parameters: None
+        Returns:
+            pygame.Surface: The overlay.
+        """
+        self.overlay_age += 1
+        if self.overlay is not None and self.overlay_age < OVERLAY_REFRESH:
+            return self.overlay
+        self.overlay_age = 0
+
+        if self.overlay_font is None:
+            self.overlay_font = pygame.font.Font(None, 18)
+        font = self.overlay_font
+        lines = ["phase            p50    p95    p99 ms"]
+        for name, values in self.summary().items():
+            lines.append(f"{name:<14}{values['p50']:>7.2f}{values['p95']:>7.2f}{values['p99']:>7.2f}")
+        lines.append(", ".join(f"{name} {value}" for name, value in self.counts.items()))
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 10
+        self.overlay = pygame.Surface((width, line_height * len(lines) + 10), pygame.SRCALPHA)
+        self.overlay.fill(OVERLAY_BACKGROUND)
+        for i, line in enumerate(lines):
+            self.overlay.blit(font.render(line, True, OVERLAY_COLOR), (5, 5 + i * line_height))
+        return self.overlay
+
+    def dump(self, path):
+        """
+        Description: Write every recorded sample to a file.
+
+        Parameters:
+            path (str): The file to write. A .csv path gets one row per sample, anything else gets JSON with the
+                samples, percentiles and counts.
+
+        Returns: None
+        """
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["phase", "sample", "ms"])
+                for name, scope in self.scopes.items():
+                    for i, value in enumerate(scope.buffer.samples()):
+                        writer.writerow([name, i, round(value, 4)])
+        else:
+            data = {
+                "phases": {
+                    name: dict(percentiles, samples=[round(value, 4) for value in self.scopes[name].buffer.samples()])
+                    for name, percentiles in self.summary().items()
+                },
+                "counts": self.counts,
+            }
+            with open(path, "w") as file:
+                json.dump(data, file, indent=2)
+
+
+# The profiler shared by the whole game
+PROFILER = FrameProfiler()
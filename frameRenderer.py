@@ -0,0 +1,232 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the frame renderer. It keeps the last frame's display list, redraws only the parts of the screen that changed and pushes just those rects to the display, falling back to a full redraw when most of the screen is dirty.
+"""
+
+import pygame
+import time
+from collections import deque
+
+WHITE = (255, 255, 255)
+
+# Render modes
+FULL = "full"  # Redraw everything and flip the whole display every frame
+DIRTY = "dirty"  # Redraw and update only the rects that changed since the last frame
+
+FULL_REDRAW_FRACTION = 0.5  # Redraw everything when more than this fraction of the screen is dirty
+TIMING_SAMPLES = 600  # Frame timings kept per mode
+
+
+class FrameRenderer:
+    """
+    Description: A retained-mode renderer that tracks dirty rects between frames.
+
+    Each frame the game lists what to draw, in order, with blit() and draw(). Every item has a key, so it can be
+    matched with the same item last frame; an item is dirty when its surface, position or state changed, and both
+    its old and new rects are redrawn. A surface that is changed in place, such as a HUD panel, reports the
+    changed area with mark_dirty(). Frames are timed separately for full and dirty-rect presents. Frames from a
+    sprite atlas are drawn straight from their page.
+
+    Attributes:
+        screen (pygame.Surface): The display surface.
+        mode (str): FULL or DIRTY.
+        items (list): The display list being built for this frame.
+        marked (list): Areas reported dirty for this frame with mark_dirty().
+        previous (dict): Last frame's items by key.
+        atlas (spriteAtlas.SpriteAtlas): The atlas whose frames are blitted from their pages, or None.
+        invalidated (bool): Whether the next frame must be a full redraw.
+        timings (dict): Recent frame times in milliseconds for each mode.
+        frames (dict): Number of frames presented in each mode.
+    """
+
+    def __init__(self, screen, mode=DIRTY, background_color=WHITE, atlas=None):
+        """
+        Description: Initialize the renderer.
+
+        Parameters:
+            screen (pygame.Surface): The display surface.
+            mode (str, optional): FULL or DIRTY.
+            background_color (tuple, optional): The colour drawn under everything.
+            atlas (spriteAtlas.SpriteAtlas, optional): Blit frames of this atlas from their pages, which skips
+                locking the page for every subsurface blit.
+
+        Returns: None
+        """
+        self.screen = screen
+        self.mode = mode
+        self.background_color = background_color
+        self.items = []
+        self.marked = []
+        self.previous = {}
+        self.atlas = atlas
+        self.invalidated = True
+        self.frame_start = 0.0
+        self.timings = {FULL: deque(maxlen=TIMING_SAMPLES), DIRTY: deque(maxlen=TIMING_SAMPLES)}
+        self.frames = {FULL: 0, DIRTY: 0}
+
+    def begin(self):
+        """
+        Description: Start building a new frame.
+        Parameters: None
+        Returns: None
+        """
+        self.frame_start = time.perf_counter()
+        self.items = []
+        self.marked = []
+
+    def blit(self, key, surface, position, area=None):
+        """
+        Description: Add a surface, or part of one, to the frame.
+
+        Parameters:
+            key (object): Identifies the item between frames, such as the sprite drawn.
+            surface (pygame.Surface): The surface to draw. Changes made to it in place while it is on screen must be
+                reported with mark_dirty().
+            position (tuple): The (x, y) of its top left corner.
+            area (pygame.Rect, optional): The part of the surface to draw, all of it when None.
+
+        Returns: None
+        """
+        position = (int(position[0]), int(position[1]))
+        if area is None and self.atlas is not None:
+            surface, area = self.atlas.regions.get(surface, (surface, None))
+        if area is None:
+            rect = surface.get_rect(topleft=position)
+        else:
+            rect = pygame.Rect(position, area.size)
+        self.items.append((key, rect, surface, position, area))  # A blit's state is its area
+
+    def draw(self, key, rect, state, function):
+        """
+        Description: Add a drawing function, such as a health bar, to the frame.
+
+        Parameters:
+            key (object): Identifies the item between frames.
+            rect (pygame.Rect): The area the function draws inside.
+            state (object): The values the drawing depends on. The item is only redrawn when this changes.
+            function (function): Called with the surface to draw on.
+
+        Returns: None
+        """
+        self.items.append((key, pygame.Rect(rect), function, None, state))
+
+    def mark_dirty(self, rect):
+        """
+        Description: Redraw an area this frame, after a surface already on screen was changed in place.
+
+        Parameters:
+            rect (pygame.Rect): The area that changed.
+
+        Returns: None
+        """
+        self.marked.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """
+        Description: Force the next frame to be a full redraw, after something drew on the screen directly.
+        Parameters: None
+        Returns: None
+        """
+        self.invalidated = True
+
+    def dirty_rects(self):
+        """
+        Description: Find the rects that changed since the last frame.
+        Parameters: None
+        Returns:
+            list: The dirty rects, each one the old or new area of a changed item.
+        """
+        rects = list(self.marked)
+        seen = set()
+        for key, rect, content, position, state in self.items:
+            seen.add(key)
+            old = self.previous.get(key)
+            if old is None:
+                rects.append(rect)
+            elif old[2] is not content or old[1] != rect or old[4] != state:
+                rects.append(old[1])
+                rects.append(rect)
+        for key, old in self.previous.items():
+            if key not in seen:
+                rects.append(old[1])
+        screen_rect = self.screen.get_rect()
+        return [rect.clip(screen_rect) for rect in rects if rect.colliderect(screen_rect)]
+
+    def draw_items(self, area=None):
+        """
+        Description: Draw the display list, optionally only the items touching one area.
+
+        Blits are sent to the screen in batches with a single Surface.blits call per run of blits, so the cost per
+        sprite stays in C. Drawing functions end a batch, keeping everything in list order.
+
+        Parameters:
+            area (pygame.Rect, optional): Only draw inside this area. The whole screen when None.
+
+        Returns: None
+        """
+        self.screen.fill(self.background_color, area)
+        batch = []
+        for key, rect, content, position, state in self.items:
+            if area is not None and not rect.colliderect(area):
+                continue
+            if position is None:
+                if batch:
+                    self.screen.blits(batch, False)
+                    batch = []
+                content(self.screen)
+            else:
+                batch.append((content, position, state))
+        if batch:
+            self.screen.blits(batch, False)
+
+    def present(self):
+        """
+        Description: Draw the frame and push it to the display.
+        Parameters: None
+        Returns:
+            str: The mode the frame was presented in.
+        """
+        if self.mode == FULL or self.invalidated:
+            mode = FULL
+        else:
+            rects = self.dirty_rects()
+            dirty_area = sum(rect.width * rect.height for rect in rects)
+            screen_area = self.screen.get_width() * self.screen.get_height()
+            mode = FULL if dirty_area > screen_area * FULL_REDRAW_FRACTION else DIRTY
+
+        if mode == FULL:
+            self.draw_items()
+            pygame.display.flip()
+        else:
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self.draw_items(rect)
+            self.screen.set_clip(None)
+            if rects:
+                pygame.display.update(rects)
+
+        self.previous = {item[0]: item for item in self.items}
+        self.invalidated = False
+        self.timings[mode].append((time.perf_counter() - self.frame_start) * 1000)
+        self.frames[mode] += 1
+        return mode
+
+    def report(self):
+        """
+        Description: Summarize the frame timings of each mode.
+        Parameters: None
+        Returns:
+            dict: For each mode, the number of frames and the mean and worst recent frame time in milliseconds.
+        """
+        summary = {}
+        for mode, samples in self.timings.items():
+            if samples:
+                summary[mode] = {
+                    "frames": self.frames[mode],
+                    "mean_ms": round(sum(samples) / len(samples), 3),
+                    "max_ms": round(max(samples), 3),
+                }
+            else:
+                summary[mode] = {"frames": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return summary
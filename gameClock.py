@@ -0,0 +1,164 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the game clocks. Game time only moves when a clock is advanced and can be paused or scaled. The window's clock is fed by real time, while the simulation's clock moves one fixed tick at a time, so headless runs never read the wall clock.
+"""
+
+import pygame
+
+
+class GameClock:
+    """
+    Description: Game time that moves only when it is advanced, and can be paused or run faster or slower.
+
+    Attributes:
+        time_ms (float): The game time in milliseconds.
+        scale (float): Game milliseconds per real millisecond, 1 for real speed.
+        paused (bool): Whether game time is standing still.
+    """
+
+    def __init__(self, scale=1.0):
+        """
+        Description: Initialize a clock at time zero.
+
+        Parameters:
+            scale (float, optional): Game milliseconds per real millisecond.
+
+        Returns: None
+        """
+        self.time_ms = 0.0
+        self.scale = scale
+        self.paused = False
+
+    def now(self):
+        """
+        Description: Get the game time.
+        Parameters: None
+        Returns:
+            float: The game time in milliseconds.
+        """
+        return self.time_ms
+
+    def advance(self, real_ms):
+        """
+        Description: Let some real time pass.
+
+        Parameters:
+            real_ms (float): The real time in milliseconds.
+
+        Returns:
+            float: The game time that passed with it, 0 while paused.
+        """
+        if self.paused:
+            return 0.0
+        elapsed = real_ms * self.scale
+        self.time_ms += elapsed
+        return elapsed
+
+    def pause(self):
+        """
+        Description: Stop game time.
+        Parameters: None
+        Returns: None
+        """
+        self.paused = True
+
+    def resume(self):
+        """
+        Description: Start game time again.
+        Parameters: None
+        Returns: None
+        """
+        self.paused = False
+
+    def toggle_pause(self):
+        """
+        Description: Pause a running clock or resume a paused one.
+        Parameters: None
+        Returns: None
+        """
+        self.paused = not self.paused
+
+
+class WallClock(GameClock):
+    """
+    Description: A game clock fed by real time, for playing in the window.
+
+    Attributes:
+        clock (pygame.time.Clock): Measures the real time between frames and caps the frame rate.
+        max_fps (int): The frame rate cap, 0 for uncapped.
+    """
+
+    def __init__(self, max_fps=0, scale=1.0):
+        """
+        Description: Initialize a clock at time zero.
+
+        Parameters:
+            max_fps (int, optional): The frame rate cap, 0 for uncapped.
+            scale (float, optional): Game milliseconds per real millisecond.
+
+        Returns: None
+        """
+        GameClock.__init__(self, scale)
+        self.clock = pygame.time.Clock()
+        self.max_fps = max_fps
+
+    def tick(self):
+        """
+        Description: Wait out the frame rate cap, then let the real time since the last frame pass.
+        Parameters: None
+        Returns:
+            float: The game time that passed, to be spent on simulation ticks.
+        """
+        return self.advance(self.clock.tick(self.max_fps))
+
+
+class VirtualClock(GameClock):
+    """
+    Description: A game clock that moves one fixed tick at a time, for the simulation.
+
+    Its time is worked out from the tick count rather than added up, so it never drifts. Scale does not apply;
+    a virtual clock runs faster by being stepped more often.
+
+    Attributes:
+        tick_rate (int): Ticks per second.
+        ticks (int): The ticks stepped so far.
+    """
+
+    def __init__(self, tick_rate):
+        """
+        Description: Initialize a clock at time zero.
+
+        Parameters:
+            tick_rate (int): Ticks per second.
+
+        Returns: None
+        """
+        GameClock.__init__(self)
+        self.tick_rate = tick_rate
+        self.ticks = 0
+
+    def advance(self, real_ms):
+        """
+        Description: Step the clock as many whole ticks as fit in some time.
+
+        Parameters:
+            real_ms (float): The time in milliseconds.
+
+        Returns:
+            float: The game time that passed.
+        """
+        start = self.time_ms
+        for tick in range(int(real_ms * self.tick_rate / 1000)):
+            self.step()
+        return self.time_ms - start
+
+    def step(self):
+        """
+        Description: Move on one tick, unless paused.
+        Parameters: None
+        Returns: None
+        """
+        if not self.paused:
+            self.ticks += 1
+            self.time_ms = self.ticks * 1000 / self.tick_rate
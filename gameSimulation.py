@@ -0,0 +1,772 @@
+"""
+Authors: METRO RUNNERS contributors, from game rules by Eric Chen & Ryan Chen
+Date: October 17 2026 (rules originally in main.py, June 17 2024)
+Description: This program file contains the game simulation core for METRO RUNNERS. It owns the game state and rules (spawning, collisions, scoring, upgrades, the boss and death) and runs with no window, no audio and no real-time clock, so games can be stepped as fast as the CPU allows.
+"""
+
+import pygame
+import random
+import zlib
+import playerSprites
+import movingSprites
+import staticSprites
+import entityStore
+from frameProfiler import PROFILER
+from objectPool import ObjectPool
+from gameClock import VirtualClock
+from timerWheel import TimerWheel, Cooldown
+from collisionBroadphase import Broadphase, TrackedGroup
+from viewport import Viewport
+from spawnScheduler import SpawnScheduler, OBSTACLE, GEM, LANE, TRAIL
+
+SCREEN_WIDTH = 923.72
+SCREEN_HEIGHT = 480
+TICK_RATE = 30  # Default simulation ticks per second; speeds and damage are defined per tick at this rate
+BOSS_SCORE = 2500  # Score at which the final boss appears
+
+# Sprites created up front for each pool, so spawning never has to build one mid-run
+POOL_SIZES = {"obstacles": 8, "gems": 8, "projectiles": 32}
+
+# What spawns and when; see spawnScheduler.Wave for the keys
+WAVES = (
+    {"kind": OBSTACLE, "keep": 1, "loop": True},  # The car that keeps looping across the screen
+    {"kind": GEM, "keep": 1, "before_boss": True},  # A new gem whenever the last one is gone
+    {"kind": GEM, "pattern": TRAIL, "count": 5, "spacing": 60, "at": 10000, "every": 12000, "before_boss": True},
+    {"kind": OBSTACLE, "pattern": LANE, "count": 2, "spacing": 450, "at": 20000, "every": 20000},
+)
+
+# Values a balance sweep may replace, all numbers set by game_variables at the start of every run
+TUNABLES = ("max_gravity_switches", "damage_cooldown_ms", "projectile_upgrade", "sword_upgrade", "dash_upgrade",
+            "boss_score", "obstacle_speed", "gem_speed")
+
+# Player actions, one per key
+GRAVITY = "gravity"  # SPACE
+SHOOT = "shoot"  # D
+DASH = "dash"  # E
+SLASH = "slash"  # F
+ACTIONS = (GRAVITY, SHOOT, DASH, SLASH)
+
+# Results of a finished game
+LOST = "lost"
+WON = "won"
+
+
+class ScriptedInput:
+    """
+    Description: An input source that plays back a fixed script of actions.
+
+    Attributes:
+        script (dict): Maps a tick number to the actions pressed on that tick.
+    """
+
+    def __init__(self, script):
+        """
+        Description: Initialize the scripted input.
+
+        Parameters:
+            script (dict or list): Either a dict of tick -> actions, or a list of (tick, action) pairs.
+
+        Returns: None
+        """
+        if isinstance(script, dict):
+            self.script = {tick: tuple(actions) for tick, actions in script.items()}
+        else:
+            self.script = {}
+            for tick, action in script:
+                self.script[tick] = self.script.get(tick, ()) + (action,)
+
+    def __call__(self, simulation):
+        """
+        Description: Get the actions pressed on the simulation's current tick.
+
+        Parameters:
+            simulation (GameSimulation): The simulation asking for input.
+
+        Returns:
+            tuple: The actions for this tick.
+        """
+        return self.script.get(simulation.tick, ())
+
+
+class GameSimulation:
+    """
+    Description: The headless game state and rules of one METRO RUNNERS run.
+
+    Any callable that takes the simulation and returns the actions for the current tick can be used as an input
+    source, so games can be scripted or driven by a bot. Sounds are reported as event names in events instead of
+    being played.
+
+    Attributes:
+        seed (int): The seed of the random number generator for this run.
+        rng (random.Random): The random number generator used for all spawning.
+        tick_rate (int): Simulation ticks per second.
+        step_scale (float): The length of one tick as a fraction of a tick at the default 30 ticks per second.
+        tick (int): The number of ticks simulated so far.
+        clock (gameClock.VirtualClock): The game time, moved on one tick at a time.
+        timers (timerWheel.TimerWheel): Every cooldown and animation timer of the run, advanced each tick.
+        events (list): The sound events raised during the last tick.
+        over (bool): Whether the run has ended.
+        result (str): LOST or WON once the run has ended, otherwise None.
+        player (playerSprites.Player): The player.
+        sword (pygame.sprite.Group): Group for the swinging sword.
+        obstacles (pygame.sprite.Group): Group for obstacles.
+        gems_group (pygame.sprite.Group): Group for gems.
+        awake_obstacles (TrackedGroup): The obstacles that are not sleeping, which are the ones updated, in
+            the order they spawned.
+        awake_gems (TrackedGroup): The gems that are not sleeping, which are the ones updated, in the order
+            they spawned.
+        all_sprites (pygame.sprite.OrderedUpdates): Boundaries, awake obstacles and gems and the boss, in draw order.
+        viewport (viewport.Viewport): The part of the world on screen. Sprites outside it are not collision tested.
+        sleep (bool): Whether obstacles and gems that spawn out of view sleep until they come into view.
+        sleeping (dict): Maps each sleeping sprite to the count of sprite updates its position is current for.
+        sprite_updates (int): The number of times the sprites have been updated this run.
+        boss (movingSprites.Boss): The final boss.
+        boss_spawned (bool): Whether the boss fight has started.
+        store (entityStore.EntityStore): The arrays obstacles, gems and projectiles live in, or None when they
+            are sprites that move themselves.
+        pools (dict): The ObjectPool of obstacles, gems and projectiles, kept across runs.
+        waves (list): The wave description of every run.
+        tuning (dict): Values replacing the game_variables defaults on every run.
+        boss_score (int): Score at which the final boss appears.
+        obstacle_speed (int): How fast new obstacles move.
+        gem_speed (int): How fast new gems move.
+        spawner (spawnScheduler.SpawnScheduler): Decides what spawns on each tick of this run.
+        rejected_spawns (int): Spawns skipped this run because they would overlap a sprite of their kind.
+        obstacle_broadphase (collisionBroadphase.Broadphase): Collision snapshot of the obstacles.
+        gem_broadphase (collisionBroadphase.Broadphase): Collision snapshot of the gems.
+        projectile_broadphase (collisionBroadphase.Broadphase): Collision snapshot of the player's projectiles.
+        score (int): Current score.
+        gems_collected (int): Gems collected towards the next upgrade.
+        cycle (int): Which upgrade comes next (1 projectiles, 2 sword, 3 dash).
+        damage_cooldown_ms (int): How long after a hit further hits are not counted, in milliseconds.
+        damage_cooldown (timerWheel.Cooldown): The window after a hit in which further hits are not counted.
+    """
+
+    def __init__(self, seed=None, tick_rate=TICK_RATE, screen=None, pool_sizes=None, waves=WAVES, tuning=None,
+                 entity_store=False, sleep=True):
+        """
+        Description: Initialize a simulation and start a new run.
+
+        Parameters:
+            seed (int, optional): The seed for the run. A random seed is picked when None.
+            tick_rate (int, optional): Simulation ticks per second.
+            screen (pygame.Surface, optional): The game window, used by the player for its bounds and HUD layout.
+                An off-screen surface of the same size is used when None.
+            pool_sizes (dict, optional): Sprites to create up front for each pool, by pool name. POOL_SIZES when
+                None.
+            waves (list, optional): The wave description of every run, WAVES by default.
+            tuning (dict, optional): Values that replace the defaults set by game_variables on every run, such as
+                {"boss_score": 2000, "sword_upgrade": 5}. Every name must be one of TUNABLES.
+            entity_store (bool, optional): Keep obstacles, gems and projectiles in an entityStore.EntityStore,
+                moved and collided as whole arrays, instead of as sprites that update themselves. Ignored
+                without NumPy.
+            sleep (bool, optional): Let obstacles and gems that spawn out of view sleep, neither updated nor
+                tested, until they can come into view. A run plays out the same either way. Ignored with an entity
+                store, which moves every entity at once.
+
+        Returns: None
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()  # Fonts are loaded by the sprites, but nothing is drawn
+
+        self.tick_rate = tick_rate
+        self.step_scale = TICK_RATE / tick_rate
+        self.waves = waves
+        self.tuning = dict(tuning or {})
+        self.screen = screen if screen is not None else pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        sizes = dict(POOL_SIZES, **(pool_sizes or {}))
+        self.store = None
+        if entity_store and entityStore.numpy is not None:
+            self.store = store = entityStore.EntityStore()
+            self.pools = {
+                "obstacles": ObjectPool(lambda: entityStore.ObstacleView(store), sizes["obstacles"]),
+                "gems": ObjectPool(lambda: entityStore.GemView(store), sizes["gems"]),
+                "projectiles": ObjectPool(lambda: entityStore.ProjectileView(store), sizes["projectiles"]),
+            }
+        else:
+            self.pools = {
+                "obstacles": ObjectPool(lambda: movingSprites.Obstacle(0, 0, 30, 30, 10), sizes["obstacles"]),
+                "gems": ObjectPool(lambda: movingSprites.Gems(0, 0, 10, 0), sizes["gems"]),
+                "projectiles": ObjectPool(lambda: movingSprites.Projectile(0, 0), sizes["projectiles"]),
+            }
+        self.sleep = sleep and self.store is None
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        Description: Start a new run from a clean state.
+
+        Parameters:
+            seed (int, optional): The seed for the run. A random seed is picked when None.
+
+        Returns: None
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Hand the last run's sprites back to their pools
+        if hasattr(self, "player"):
+            for group in (self.obstacles, self.gems_group, self.player.projectiles):
+                for sprite in group.sprites():
+                    sprite.kill()
+
+        self.tick = 0
+        self.clock = VirtualClock(self.tick_rate)
+        self.timers = TimerWheel(self.tick_rate)
+        self.events = []
+        self.over = False
+        self.result = None
+
+        self.game_variables()
+        self.sprite_entities()
+
+    def game_variables(self):
+        """
+        Description: Initialize game control variables and settings.
+        Parameters: None
+        Returns: None
+        """
+        self.on_ground = True
+        self.on_ceil = False
+        self.boss_spawned = False
+
+        self.gravity_switches = 0
+        self.max_gravity_switches = 2
+
+        # Hits within a second of the last one still hurt but are not counted again
+        self.damage_cooldown_ms = 1000
+
+        # Upgrades and game cycle
+        self.projectile_upgrade = 10
+        self.sword_upgrade = 10
+        self.dash_upgrade = 10
+        self.cycle = 1
+
+        # Score and gem count
+        self.score = 0
+        self.score_remainder = 0.0
+        self.gems_collected = 0
+
+        # Pace of the run
+        self.boss_score = BOSS_SCORE
+        self.obstacle_speed = 10
+        self.gem_speed = 10
+
+        # Balance changes being tried out replace the defaults above
+        for name, value in self.tuning.items():
+            if name not in TUNABLES:
+                raise ValueError(f"Unknown tuning value {name!r}, expected one of {', '.join(TUNABLES)}")
+            setattr(self, name, value)
+        self.damage_cooldown = Cooldown(self.timers, self.damage_cooldown_ms)
+
+    def sprite_entities(self):
+        """
+        Description: Initialize the boundaries, player, obstacles, gems and boss.
+        Parameters: None
+        Returns: None
+        """
+        self.boundary_top = staticSprites.Boundary(0, 0, SCREEN_WIDTH, 1)
+        self.boundary_bottom = staticSprites.Boundary(0, SCREEN_HEIGHT - 5, SCREEN_WIDTH, 1)
+        self.all_sprites = pygame.sprite.OrderedUpdates(self.boundary_top, self.boundary_bottom)
+
+        self.player = playerSprites.Player(self.screen, self.timers, self.pools["projectiles"])
+        self.sword = pygame.sprite.Group()
+
+        self.obstacles = pygame.sprite.Group()
+        self.gems_group = pygame.sprite.Group()
+        self.awake_obstacles = TrackedGroup()  # Tracked, so the broadphase only rebuilds its snapshot after changes
+        self.awake_gems = TrackedGroup()
+        self.sleeping = {}
+        self.sprite_updates = 0
+        if self.store is not None:
+            self.obstacle_broadphase = entityStore.EntityBroadphase(self.store, entityStore.OBSTACLE)
+            self.gem_broadphase = entityStore.EntityBroadphase(self.store, entityStore.GEM)
+            self.projectile_broadphase = entityStore.EntityBroadphase(self.store, entityStore.PROJECTILE)
+        else:
+            self.obstacle_broadphase = Broadphase()
+            self.gem_broadphase = Broadphase()
+            self.projectile_broadphase = Broadphase()
+        self.spawner = SpawnScheduler(self.waves)
+        self.rejected_spawns = 0
+        self.spawn_due()
+
+        self.boss = movingSprites.Boss(self.timers)
+
+    def checksum(self):
+        """
+        Description: Fingerprint the state of the run, so a replay can prove it reproduced the run exactly.
+        Parameters: None
+        Returns:
+            int: A CRC-32 of the tick, score, upgrades, health, every sprite's position and the random state.
+        """
+        self.catch_up_sleepers()
+        state = (
+            self.tick, self.score, self.gems_collected, self.cycle, self.result,
+            self.player.health, tuple(self.player.rect), self.boss.health,
+            [tuple(sprite.rect) for sprite in self.obstacles],
+            [tuple(sprite.rect) for sprite in self.gems_group],
+            [tuple(sprite.rect) for sprite in self.player.projectiles],
+            self.rng.getstate(),
+        )
+        return zlib.crc32(repr(state).encode("utf-8"))
+
+    def pool_stats(self):
+        """
+        Description: Report how each sprite pool is being used.
+        Parameters: None
+        Returns:
+            dict: The stats of each pool, by pool name.
+        """
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+    def run(self, input_source, max_ticks):
+        """
+        Description: Step the simulation until the run ends or a tick limit is reached.
+
+        Parameters:
+            input_source (function): Called with the simulation each tick, returns the actions for that tick.
+            max_ticks (int): The most ticks to simulate.
+
+        Returns:
+            str: LOST or WON if the run ended, otherwise None.
+        """
+        while not self.over and self.tick < max_ticks:
+            self.step(input_source(self))
+        return self.result
+
+    def step(self, actions=()):
+        """
+        Description: Advance the game by one tick.
+
+        Parameters:
+            actions (iterable, optional): The actions pressed on this tick.
+
+        Returns: None
+        """
+        self.events = []
+        if self.over:
+            return
+
+        self.handle_actions(actions)
+
+        with PROFILER.scope("spawning"):
+            self.spawn_due()
+
+        with PROFILER.scope("collision"):
+            self.detect_collision()
+
+        # Increase score over time, one point per 30 FPS tick
+        points, self.score_remainder = movingSprites.carry(self.step_scale, self.score_remainder)
+        self.score += points
+
+        if self.score >= self.boss_score and not self.boss_spawned and not self.over:
+            self.final_boss()  # Trigger final boss battle if score reaches threshold
+
+        if not self.over:
+            with PROFILER.scope("sprites"):
+                self.update_sprites()
+            self.check_off_map()
+            self.check_death()
+
+        self.tick += 1
+        self.clock.step()
+        self.timers.advance()
+
+        if PROFILER.enabled:  # Counting the groups costs a call each
+            PROFILER.count("obstacles", len(self.obstacles))
+            PROFILER.count("gems", len(self.gems_group))
+            PROFILER.count("projectiles", len(self.player.projectiles))
+            PROFILER.count("sleeping", len(self.sleeping))
+
+    def handle_actions(self, actions):
+        """
+        Description: Apply the player's actions for this tick. The player's abilities check their own cooldowns.
+
+        Parameters:
+            actions (iterable): The actions pressed on this tick.
+
+        Returns: None
+        """
+        if GRAVITY in actions and self.gravity_switches < self.max_gravity_switches:
+            self.player.switch_gravity()
+            self.gravity_switches += 1
+        if SHOOT in actions and self.player.shoot():
+            self.events.append("shoot")
+        if DASH in actions and self.player.dash():
+            self.events.append("dash")
+        if SLASH in actions and self.player.slash():
+            self.events.append("slash")
+            self.sword.add(self.player.sword)
+
+    def spawn_due(self):
+        """
+        Description: Spawn the obstacles and gems the spawn scheduler has due on this tick.
+
+        A sprite that would overlap one of its kind already alive is not spawned; the check is a single
+        query against the broadphase, which does not hold the new sprite yet (an entity store leaves it out).
+        Spawns land out of view, so sleeping sprites are caught up first and every sprite is in the snapshot.
+
+        Parameters: None
+        Returns: None
+        """
+        population = {OBSTACLE: len(self.obstacles), GEM: len(self.gems_group)}
+        spawns = self.spawner.due(self.clock.now(), self.rng, population, self.boss_spawned)
+        if not spawns:
+            return
+
+        self.catch_up_sleepers()
+        self.obstacle_broadphase.sync(self.obstacles)
+        self.gem_broadphase.sync(self.gems_group)
+        for kind, x, y, loop in spawns:
+            if kind == OBSTACLE:
+                sprite, broadphase = self.spawn_obstacle(x, y, loop), self.obstacle_broadphase
+            else:
+                sprite, broadphase = self.spawn_gem(x, y), self.gem_broadphase
+            if broadphase.collide_any(sprite) is not None:
+                self.sleeping.pop(sprite, None)
+                sprite.kill()
+                self.rejected_spawns += 1
+            else:
+                broadphase.add(sprite)
+
+    def spawn_obstacle(self, x, y, loop=True):
+        """
+        Description: Place an obstacle from the pool.
+
+        Parameters:
+            x (float): The x-coordinate of the obstacle.
+            y (float): The y-coordinate of the obstacle.
+            loop (bool, optional): Whether it loops back to the right edge instead of leaving the screen.
+
+        Returns:
+            movingSprites.Obstacle: The obstacle.
+        """
+        obstacle = self.pools["obstacles"].acquire(x, y, self.obstacle_speed, self.rng, loop)
+        self.obstacles.add(obstacle)
+        # Looping cars wrap in update order, drawing from the run's random numbers, so they never sleep
+        self.place(obstacle, self.awake_obstacles, self.sleep and not loop)
+        return obstacle
+
+    def spawn_gem(self, x, y):
+        """
+        Description: Place a gem from the pool, with a random look.
+
+        Parameters:
+            x (float): The x-coordinate of the gem.
+            y (float): The y-coordinate of the gem.
+
+        Returns:
+            movingSprites.Gems: The gem.
+        """
+        gem = self.pools["gems"].acquire(x, y, self.gem_speed, self.rng.randrange(0, 4))
+        self.gems_group.add(gem)
+        self.place(gem, self.awake_gems, self.sleep)
+        return gem
+
+    def place(self, sprite, awake_group, sleep):
+        """
+        Description: Put a sprite that just spawned to sleep if it cannot come into view for a while, otherwise
+            start updating and drawing it.
+
+        A sleeping sprite is woken by a timer on the tick it could first come into view, and is then moved to
+        where the updates it missed would have taken it.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): An obstacle or gem.
+            awake_group (pygame.sprite.Group): The group of its kind that is updated.
+            sleep (bool): Whether it may sleep.
+
+        Returns: None
+        """
+        ticks = 0
+        if sleep:
+            # Updated twice a tick, each time by its speed plus at most the pixel its carried fraction adds up to
+            ticks = self.viewport.ticks_until_visible(sprite.rect, 2 * (sprite.speed * self.step_scale + 1))
+        if ticks > 0:
+            self.sleeping[sprite] = self.sprite_updates
+            self.timers.schedule(ticks, lambda: self.wake(sprite, awake_group))
+        else:
+            awake_group.add(sprite)
+            self.all_sprites.add(sprite)
+
+    def wake(self, sprite, awake_group):
+        """
+        Description: Wake a sleeping sprite, so it is updated and drawn again. Called by its timer.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+            awake_group (pygame.sprite.Group): The group of its kind that is updated.
+
+        Returns: None
+        """
+        if sprite not in self.sleeping:
+            return  # Killed while asleep
+        self.catch_up(sprite)
+        del self.sleeping[sprite]
+        # Sprites that spawned after it go back behind it, so the group stays in the order of its full group
+        later = [other for other in awake_group if other.serial > sprite.serial]
+        awake_group.remove(later)
+        awake_group.add(sprite, later)
+        self.all_sprites.add(sprite)
+
+    def catch_up(self, sprite):
+        """
+        Description: Move a sleeping sprite to where the updates it missed would have taken it.
+
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite.
+
+        Returns: None
+        """
+        sprite.fast_forward(2 * (self.sprite_updates - self.sleeping[sprite]), self.step_scale)
+        self.sleeping[sprite] = self.sprite_updates
+
+    def catch_up_sleepers(self):
+        """
+        Description: Bring every sleeping sprite's position up to date without waking it, before anything reads
+            the positions of all sprites.
+        Parameters: None
+        Returns: None
+        """
+        for sprite in self.sleeping:
+            self.catch_up(sprite)
+
+    def detect_collision(self):
+        """
+        Description: Detect collisions between game entities and handle interactions accordingly.
+
+        Every pair is found through the broadphase snapshots, which are taken once per tick here and only hold
+        awake sprites in view, as nothing on screen can reach the rest. Sprites killed part way through are taken
+        out of their snapshot straight away. Hits that kill or collect are exact: a pair whose rects overlap only
+        counts once their drawn pixels overlap too. Cars hurt the player on their rects instead, as the player is
+        shoved out of any car it overlaps every update and only the car's last move of transparent padding is
+        left to overlap here.
+
+        Parameters: None
+        Returns: None
+        """
+        self.obstacle_broadphase.sync(self.awake_obstacles, self.viewport.area)
+        self.gem_broadphase.sync(self.awake_gems, self.viewport.area)
+
+        # Check for collisions with the top and bottom boundaries
+        if pygame.sprite.collide_rect(self.player, self.boundary_top):
+            self.on_ceil = True
+            self.on_ground = False
+        elif pygame.sprite.collide_rect(self.player, self.boundary_bottom):
+            self.on_ground = True
+            self.on_ceil = False
+        else:
+            self.on_ground = False
+            self.on_ceil = False
+
+        # Reset gravity switches if the player touches the ground
+        if self.on_ground or self.on_ceil:
+            self.gravity_switches = 0
+
+        # Check for player collision with obstacles
+        obstacle_hit = self.obstacle_broadphase.collide_any(self.player)
+        if obstacle_hit:
+            if self.player.rect.x < obstacle_hit.rect.x:
+                self.player.health -= 2 * self.step_scale
+                if self.damage_cooldown.trigger():
+                    self.events.append("hit")
+                    self.player.flash()
+                    if self.player.health <= -10:
+                        self.end_run(LOST)
+                        return
+
+        if self.player.projectiles:  # Without any, neither check below can find a hit
+            # Check for collisions between player projectiles and obstacles
+            for projectile, obstacle_hit in self.obstacle_broadphase.first_hits(self.player.projectiles, exact=True):
+                # Remove the obstacle and projectile when they collide
+                self.score += 40
+                obstacle_hit.kill()
+                self.obstacle_broadphase.remove(obstacle_hit)
+                projectile.kill()
+                self.events.append("car_kill")
+
+            # Collision between projectile and boss
+            self.projectile_broadphase.sync(self.player.projectiles)
+            obstacle_hit_boss = self.projectile_broadphase.collide(self.boss, exact=True)
+            for projectile in obstacle_hit_boss:
+                projectile.kill()
+                self.projectile_broadphase.remove(projectile)
+            if obstacle_hit_boss:
+                self.boss.health -= 4
+                self.events.append("monster")
+                if self.boss.health <= -4:
+                    self.boss_spawned = False
+                    self.boss.kill()
+                    self.end_run(WON)
+                    return
+
+        # Check for player collision with gems, collecting every gem touched with one query
+        for gem_collect in self.gem_broadphase.collide(self.player, exact=True):
+            gem_collect.kill()
+            self.gem_broadphase.remove(gem_collect)
+            self.gems_collected += 1
+            self.events.append("gem")
+            self.check_upgrades()
+
+        # Check for sword collisions with obstacles
+        for sword in self.sword:
+            obstacle_hit = self.obstacle_broadphase.collide_any(sword, exact=True)
+            if obstacle_hit:
+                self.score += 40
+                obstacle_hit.kill()
+                self.obstacle_broadphase.remove(obstacle_hit)
+                self.events.append("car_kill")
+
+    def check_upgrades(self):
+        """
+        Description: Give the next upgrade in the cycle once enough gems have been collected for it.
+        Parameters: None
+        Returns: None
+        """
+        if self.cycle == 1 and self.gems_collected >= self.projectile_upgrade:
+            self.gems_collected = 0
+            self.projectile_upgrade += 5
+            self.cycle += 1
+            self.events.append("upgrade")
+            self.events.append("shuriken_upgrade")
+            self.upgrade_projectiles()
+        if self.cycle == 2 and self.gems_collected >= self.sword_upgrade:
+            self.gems_collected = 0
+            self.sword_upgrade += 5
+            self.cycle += 1
+            self.events.append("upgrade")
+            self.events.append("sword_upgrade")
+            self.upgrade_sword()
+        if self.cycle == 3 and self.gems_collected >= self.dash_upgrade:
+            self.gems_collected = 0
+            self.dash_upgrade += 5
+            self.cycle = 1
+            self.events.append("dash_upgrade")
+            self.upgrade_dash()
+
+    def update_sprites(self):
+        """
+        Description: Update the positions and animations of every awake sprite. Obstacles and gems are updated
+            twice per tick; sleeping ones make up for it when they wake.
+        Parameters: None
+        Returns: None
+        """
+        step = self.step_scale
+        self.sprite_updates += 1
+        if self.store is not None:
+            self.update_store(step)
+            return
+        self.awake_obstacles.update(step)
+        self.obstacle_broadphase.refresh()  # The player is swept against where the obstacles have moved to
+        self.awake_gems.update(step)
+        if self.boss.alive():
+            self.boss.update(step)
+        with PROFILER.scope("player"):
+            self.player.update(self.obstacle_broadphase, step)
+        self.awake_gems.update(step)
+        self.player.projectiles.update(step)
+        self.awake_obstacles.update(step)
+
+    def update_store(self, step):
+        """
+        Description: Update every sprite when obstacles, gems and projectiles live in the entity store.
+
+        Each type is moved as a whole array, in the same order and as many times per tick as the sprite groups
+        update them in update_sprites, so a run plays out the same either way.
+
+        Parameters:
+            step (float): The length of this tick as a fraction of a 30 FPS frame.
+
+        Returns: None
+        """
+        store = self.store
+        store.update(step, entityStore.OBSTACLE)  # As part of all_sprites
+        store.update(step, entityStore.GEM)
+        if self.boss.alive():
+            self.boss.update(step)
+        with PROFILER.scope("player"):
+            self.player.update(self.obstacle_broadphase, step)
+        frames = len(entityStore.PROJECTILE_IMAGES)
+        store.update(step, entityStore.PROJECTILE, frames)  # By the player
+        store.update(step, entityStore.GEM)
+        store.update(step, entityStore.PROJECTILE, frames)
+        store.update(step, entityStore.OBSTACLE)
+
+    def check_off_map(self):
+        """
+        Description: Damage the player when they are knocked off the map or run too far ahead.
+        Parameters: None
+        Returns: None
+        """
+        if self.player.rect.centerx <= 0:
+            self.player.health -= 10 * self.step_scale
+            if self.player.health <= -10:
+                self.end_run(LOST)
+                return
+
+        if self.player.rect.centerx >= 650:
+            self.player.health -= 5 * self.step_scale
+
+    def check_death(self):
+        """
+        Description: Check if the player's health drops below zero, indicating game over.
+        Parameters: None
+        Returns: None
+        """
+        if self.player.health <= -10:
+            self.end_run(LOST)
+
+    def end_run(self, result):
+        """
+        Description: End the run.
+
+        Parameters:
+            result (str): LOST or WON.
+
+        Returns: None
+        """
+        if self.over:
+            return
+        self.over = True
+        self.result = result
+        self.events.append("win" if result == WON else "death")
+
+    def upgrade_projectiles(self):
+        """
+        Description: Upgrade the player's projectile abilities.
+        Parameters: None
+        Returns: None
+        """
+        self.player.total_shurikens += 1
+
+    def upgrade_dash(self):
+        """
+        Description: Upgrade the player's dash ability.
+        Parameters: None
+        Returns: None
+        """
+        self.player.dash_cooldown.duration_ms -= 1500
+        self.player.dash_distance += 25
+
+    def upgrade_sword(self):
+        """
+        Description: Upgrade the player's sword.
+        Parameters: None
+        Returns: None
+        """
+        self.player.size += 50
+        self.player.sword.resize(self.player.size)
+
+    def final_boss(self):
+        """
+        Description: Spawns the final boss
+        Parameters: None
+        Returns: None
+        """
+        self.all_sprites.add(self.boss)
+        self.boss.start_animation()
+        self.boss_spawned = True
@@ -5,6 +5,15 @@ Description: This file contains the sprites on the home menu screen, such as the
 """
 
 import pygame
+from assetRegistry import ASSETS, OPAQUE
+from parallaxBackground import ParallaxBackground, ParallaxLayer
+
+BUTTON_IMAGE = "01. Visual Assets/05. Other Sprites/gamestart.png"
+INSTRUCTIONS_IMAGE = "01. Visual Assets/05. Other Sprites/instruction.png"
+LOGO_IMAGE = "01. Visual Assets/05. Other Sprites/metro runners.png"
+CITY_IMAGE = "01. Visual Assets/05. Other Sprites/city background.png"
+CITY_REPEAT_WIDTH = 1200  # The skyline repeats every 1200 pixels once scaled to 2400x500
+HOME_IMAGES = (CITY_IMAGE, LOGO_IMAGE, BUTTON_IMAGE, INSTRUCTIONS_IMAGE)  # Everything the home menu shows
 
 class ImageButton(pygame.sprite.Sprite):
     """
@@ -16,7 +25,7 @@ class ImageButton(pygame.sprite.Sprite):
         image_path (str): The file path to the image of the button.
     """
 
-    def __init__(self, x, y, image_path="01. Visual Assets/05. Other Sprites/gamestart.png"):
+    def __init__(self, x, y, image_path=BUTTON_IMAGE):
         """
         Initialize the image button.
 
@@ -28,7 +37,7 @@ class ImageButton(pygame.sprite.Sprite):
         Returns: None
         """
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(pygame.image.load(image_path).convert_alpha(), (287, 62))
+        self.image = ASSETS.image(image_path, (287, 62))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
 
@@ -54,7 +63,7 @@ class Instructions(pygame.sprite.Sprite):
         image_path (str): The file path to the image of the instructions.
     """
 
-    def __init__(self, x, y, image_path="01. Visual Assets/05. Other Sprites/instruction.png"):
+    def __init__(self, x, y, image_path=INSTRUCTIONS_IMAGE):
         """
         Initialize the instructions image.
 
@@ -66,7 +75,7 @@ class Instructions(pygame.sprite.Sprite):
         Returns: None
         """
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(pygame.image.load(image_path).convert_alpha(), (250, 250))
+        self.image = ASSETS.image(image_path, (250, 250))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
 
@@ -80,7 +89,7 @@ class MetroRunners(pygame.sprite.Sprite):
         image_path (str): The file path to the image of the Metro Runners logo.
     """
 
-    def __init__(self, x, y, image_path="01. Visual Assets/05. Other Sprites/Metro Runners.png"):
+    def __init__(self, x, y, image_path=LOGO_IMAGE):
         """
         Description: Initialize the Metro Runners logo.
 
@@ -92,49 +101,27 @@ class MetroRunners(pygame.sprite.Sprite):
         Returns: None
         """
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(pygame.image.load(image_path).convert_alpha(), (300, 300))
+        self.image = ASSETS.image(image_path, (300, 300))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
 
-class CityBackground(pygame.sprite.Sprite):
+class CityBackground(ParallaxBackground):
     """
     Description: A class to represent the city background in the game.
 
     Attributes:
-        x (float): The x-coordinate of the city background.
-        y (float): The y-coordinate of the city background.
-        image_path (str): The file path to the image of the background.
+        city (ParallaxLayer): The slowly scrolling city layer.
     """
 
-    def __init__(self, x, y, image_path="01. Visual Assets/05. Other Sprites/city background.png"):
+    def __init__(self, size, image_path=CITY_IMAGE):
         """
         Initialize the city background.
 
         Parameters:
-            x (float): The x-coordinate of the city background.
-            y (float): The y-coordinate of the city background.
+            size (tuple): The (width, height) of the window.
             image_path (str, optional): The file path to the image of the background. Defaults to "city background.png".
         
         Returns: None
         """
-        pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(pygame.image.load(image_path).convert_alpha(), (2400, 500))
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (x, y)
-        self.speed = 1  # Background movement speed
-
-    def update(self):
-        """
-        Description: Update the city background's position.
-
-        Move the background horizontally.
-        When it reaches the end, reset its position to continue the loop.
-        
-        Returns: None
-        """
-        # Move 1 pixel to the left on each frame
-        self.rect.left -= 1
-
-        # If we run out of image on the right, reset the left side again
-        if self.rect.right <= 923:
-            self.rect.left = 0 
+        self.city = ParallaxLayer(ASSETS.image(image_path, (2400, 500), pixel_format=OPAQUE), 1, CITY_REPEAT_WIDTH)
+        ParallaxBackground.__init__(self, [self.city], size)
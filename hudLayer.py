@@ -0,0 +1,136 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the retained HUD layer. HUD widgets are painted onto a few cached panel surfaces and only repainted when the value they show changes, so an unchanged HUD costs one blit per panel and no dirty rects.
+"""
+
+import pygame
+
+CLEAR = (0, 0, 0, 0)
+
+
+class HudWidget:
+    """
+    Description: One part of the HUD, such as the score or a cooldown icon.
+
+    Attributes:
+        rect (pygame.Rect): The screen area the widget paints inside.
+        state (function): Returns the values the widget shows. The widget is hidden while it returns None.
+        paint (function): Called with the panel surface and the widget's (x, y) on it to paint the widget.
+        drawn_state (object): The state the widget was last painted with.
+    """
+
+    def __init__(self, rect, state, paint):
+        """
+        Description: Initialize a widget that has not been painted yet.
+
+        Parameters:
+            rect (pygame.Rect): The screen area the widget paints inside.
+            state (function): Returns the values the widget shows, or None to hide it.
+            paint (function): Paints the widget, called with (surface, x, y).
+
+        Returns: None
+        """
+        self.rect = pygame.Rect(rect)
+        self.state = state
+        self.paint = paint
+        self.drawn_state = None
+
+
+class HudPanel:
+    """
+    Description: A cached surface holding a group of nearby widgets.
+
+    Widgets paint onto the transparent panel with ordinary blits. pygame keeps the panel in straight alpha, so
+    it can be put on screen with an ordinary blit too.
+
+    Attributes:
+        name (str): Identifies the panel to the frame renderer.
+        widgets (list): The widgets on the panel.
+        rect (pygame.Rect): The screen area covered by the panel, the union of its widgets.
+        surface (pygame.Surface): The panel's cached image.
+    """
+
+    def __init__(self, name, widgets):
+        """
+        Description: Initialize an empty panel around its widgets.
+
+        Parameters:
+            name (str): Identifies the panel to the frame renderer.
+            widgets (list): The widgets on the panel.
+
+        Returns: None
+        """
+        self.name = name
+        self.widgets = widgets
+        self.rect = widgets[0].rect.unionall([widget.rect for widget in widgets[1:]])
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.surface.fill(CLEAR)
+
+    def refresh(self):
+        """
+        Description: Repaint the widgets whose state changed since they were last painted.
+
+        Overlapping widgets are repainted too, in order, inside the changed area, so the panel always looks as if
+        every widget had been painted from scratch.
+
+        Parameters: None
+        Returns:
+            list: The screen rects of the changed widgets.
+        """
+        changed = []
+        for widget in self.widgets:
+            state = widget.state()
+            if state != widget.drawn_state:
+                widget.drawn_state = state
+                changed.append(widget.rect)
+        if not changed:
+            return changed
+
+        area = changed[0].unionall(changed[1:]).move(-self.rect.x, -self.rect.y)
+        self.surface.fill(CLEAR, area)
+        self.surface.set_clip(area)
+        for widget in self.widgets:
+            if widget.drawn_state is not None:
+                local = widget.rect.move(-self.rect.x, -self.rect.y)
+                if local.colliderect(area):
+                    widget.paint(self.surface, local.x, local.y)
+        self.surface.set_clip(None)
+        return changed
+
+
+class HudLayer:
+    """
+    Description: The whole HUD, drawn through the frame renderer.
+
+    Attributes:
+        panels (list): The HUD's panels.
+        repaints (int): Widget repaints so far.
+    """
+
+    def __init__(self, panels):
+        """
+        Description: Initialize the HUD.
+
+        Parameters:
+            panels (list): The HUD's panels.
+
+        Returns: None
+        """
+        self.panels = panels
+        self.repaints = 0
+
+    def draw(self, renderer):
+        """
+        Description: Bring every panel up to date and add it to the frame, reporting the areas that changed.
+
+        Parameters:
+            renderer (frameRenderer.FrameRenderer): The renderer building this frame.
+
+        Returns: None
+        """
+        for panel in self.panels:
+            for rect in panel.refresh():
+                renderer.mark_dirty(rect)
+                self.repaints += 1
+            renderer.blit(("hud", panel.name), panel.surface, panel.rect.topleft)
@@ -0,0 +1,143 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the image effects used by the HUD and sprites, such as brightness, tint and hit-flash. Effects work on whole pixel arrays at once through pygame.surfarray instead of touching one pixel at a time.
+"""
+
+import pygame
+
+try:
+    import numpy
+except ImportError:  # surfarray needs NumPy; fall back to pygame's blend modes without it
+    numpy = None
+
+WHITE = (255, 255, 255)
+
+
+def _rgba_copy(surface):
+    """
+    Description: Make a 32-bit copy of a surface that keeps its alpha, so its pixels can be edited as arrays.
+
+    Parameters:
+        surface (pygame.Surface): The surface to copy.
+
+    Returns:
+        pygame.Surface: A new 32-bit surface with per-pixel alpha.
+    """
+    if surface.get_bitsize() == 32 and surface.get_flags() & pygame.SRCALPHA:
+        return surface.copy()
+    result = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+    result.blit(surface, (0, 0))
+    return result
+
+
+def brightness(surface, factor):
+    """
+    Description: Scale the colour of every pixel by a brightness factor, keeping alpha untouched.
+
+    Parameters:
+        surface (pygame.Surface): The surface to adjust. It is not modified.
+        factor (float): 0 gives black, 1 leaves the colours as they are, above 1 brightens.
+
+    Returns:
+        pygame.Surface: The adjusted copy.
+    """
+    result = _rgba_copy(surface)
+    if numpy is not None:
+        pixels = pygame.surfarray.pixels3d(result)
+        scaled = pixels * float(factor)
+        numpy.clip(scaled, 0, 255, out=scaled)
+        pixels[...] = scaled.astype(numpy.uint8)
+        del pixels  # Unlock the surface
+    else:
+        level = min(255, max(0, int(255 * factor)))
+        result.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+    return result
+
+
+def tint(surface, color, amount):
+    """
+    Description: Blend the colour of every pixel towards a tint colour, keeping alpha untouched.
+
+    Parameters:
+        surface (pygame.Surface): The surface to tint. It is not modified.
+        color (tuple): The (r, g, b) tint colour.
+        amount (float): 0 leaves the colours as they are, 1 paints every pixel the tint colour.
+
+    Returns:
+        pygame.Surface: The tinted copy.
+    """
+    amount = min(1.0, max(0.0, float(amount)))
+    result = _rgba_copy(surface)
+    if numpy is not None:
+        pixels = pygame.surfarray.pixels3d(result)
+        blended = pixels * (1.0 - amount) + numpy.array(color[:3], dtype=numpy.float64) * amount
+        pixels[...] = blended.astype(numpy.uint8)
+        del pixels  # Unlock the surface
+    else:
+        keep = int(255 * (1.0 - amount))
+        result.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+        result.fill([int(c * amount) for c in color[:3]], special_flags=pygame.BLEND_RGB_ADD)
+    return result
+
+
+def hit_flash(surface, amount=1.0):
+    """
+    Description: Flash a sprite white, as when it takes damage.
+
+    Parameters:
+        surface (pygame.Surface): The surface to flash. It is not modified.
+        amount (float, optional): How far towards white to go, from 0 to 1.
+
+    Returns:
+        pygame.Surface: The flashed copy.
+    """
+    return tint(surface, WHITE, amount)
+
+
+class BrightnessLevels:
+    """
+    Description: A set of brightness levels of one image, precomputed at load time.
+
+    Looking up a level is a list index, so fading an icon every frame costs nothing once the levels are built.
+
+    Attributes:
+        surfaces (list): The image at each brightness level, from darkest (black) to the original colours.
+    """
+
+    def __init__(self, image, levels=32):
+        """
+        Description: Precompute the brightness levels of an image.
+
+        Parameters:
+            image (pygame.Surface): The image to fade.
+            levels (int, optional): How many brightness levels to precompute. Must be at least 2.
+
+        Returns: None
+        """
+        self.surfaces = [brightness(image, i / (levels - 1)) for i in range(levels)]
+
+    def level_index(self, factor):
+        """
+        Description: Find the quantized level for a brightness factor.
+
+        Parameters:
+            factor (float): The brightness factor, clamped to 0..1.
+
+        Returns:
+            int: The level index. Only a factor of 1 reaches the top level.
+        """
+        factor = min(1.0, max(0.0, factor))
+        return int(factor * (len(self.surfaces) - 1))
+
+    def get(self, factor):
+        """
+        Description: Get the image at the level closest below a brightness factor.
+
+        Parameters:
+            factor (float): The brightness factor, clamped to 0..1.
+
+        Returns:
+            pygame.Surface: The precomputed surface.
+        """
+        return self.surfaces[self.level_index(factor)]
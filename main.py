@@ -1,95 +1,307 @@
 """
 Authors: Eric Chen & Ryan Chen
 Date: June 17 2024
-Description: This is the main program file for METRO RUNNERS. This follows the IDEA/ALTER framework. 
+Description: This is the main program file for METRO RUNNERS. This follows the IDEA/ALTER framework.
 """
 
 import pygame
-import playerSprites
+import argparse
+import time
 import movingSprites
 import staticSprites
 import homePageSprites
-import random
-import time
+import gameSimulation
+import frameRenderer
+import hudLayer
+import assetLoader
+import assetPack
+import soundBus
+import replayLog
+import gameClock
+from frameProfiler import PROFILER
+from assetRegistry import ASSETS
+from textRenderer import TEXT
+
+MAX_TICKS_PER_FRAME = 5  # Ticks one frame may run to catch up before the rest of the backlog is dropped
+TELEPORT_DISTANCE = 100  # Sprites that move further than this in one tick are drawn at their new position
+
+# The sound file, volume and priority of each simulation sound event
+SOUND_EVENTS = {
+    "death": ("00. Sounds/death.mp3", 0.3, soundBus.CRITICAL),
+    "win": ("00. Sounds/Victory sound effects (no copyright).mp3", 0.3, soundBus.CRITICAL),
+    "upgrade": ("00. Sounds/Upgrade Sound Effect.mp3", 0.3, soundBus.HIGH),
+    "shuriken_upgrade": ("00. Sounds/Upgrade shurikan.mp3", 1.5, soundBus.HIGH),
+    "sword_upgrade": ("00. Sounds/upgrade sword.mp3", 1.5, soundBus.HIGH),
+    "dash_upgrade": ("00. Sounds/Upgrade dash.mp3", 1.5, soundBus.HIGH),
+    "hit": ("00. Sounds/hit.mp3", 0.4, soundBus.HIGH),
+    "shoot": ("00. Sounds/shurikens.mp3", 2, soundBus.NORMAL),
+    "dash": ("00. Sounds/dash.wav", 0.2, soundBus.NORMAL),
+    "slash": ("00. Sounds/slashing.wav", 0.2, soundBus.NORMAL),
+    "car_kill": ("00. Sounds/car.mp3", 0.5, soundBus.NORMAL),
+    "monster": ("00. Sounds/monster.mp3", 0.1, soundBus.LOW),
+    "gem": ("00. Sounds/Gem Sound Effect 1.mp3", 0.1, soundBus.LOW),
+}
 
 class MetroRunnersGame:
     """
-    Description: Class representing the main game logic and interaction for Metro Runners.
+    Description: Class representing the window, input and rendering for Metro Runners.
+
+    The game state and rules live in gameSimulation.GameSimulation; this class reads the keyboard, steps the
+    simulation, plays its sounds and draws it. The simulation runs on a fixed timestep while frames are rendered
+    as fast as allowed, drawing sprites part way between their last two tick positions.
+
+    Only the home menu's images are loaded before the first frame. Everything else is decoded in the background
+    while the menu is shown, and the game scene is built once it is ready, or straight away if Play is clicked
+    first.
 
     Attributes:
         SCREEN_WIDTH (int): Width of the game screen.
         SCREEN_HEIGHT (int): Height of the game screen.
-        player (playerSprites.Player): Instance of the player character.
-        sword (pygame.sprite.Group): Group for sword projectiles.
-        obstacles (pygame.sprite.Group): Group for obstacles in the game.
-        gems_group (pygame.sprite.Group): Group for gems collectibles.
-        all_sprites (pygame.sprite.Group): Group containing all sprites for rendering.
-        projectile_upgrade (int): Upgrade level for projectiles.
-        sword_upgrade (int): Upgrade level for sword.
-        dash_upgrade (int): Upgrade level for dash ability.
-        cycle (int): Cycle count for upgrades.
-        boss (movingSprites.Boss): Instance of the boss character.
-        score (int): Current score in the game.
-        start_time (float): Time when the game started.
-        gems_collected (int): Number of gems collected.
+        sim (gameSimulation.GameSimulation): The game state and rules, None until the game scene is loaded.
+        loader (assetLoader.AssetLoader): Decodes the game's assets in the background during the home menu.
+        scene_ready (bool): Whether the game scene has been built.
+        startup (dict): Time to first frame and time to interactive in milliseconds, None until reached.
+        renderer (frameRenderer.FrameRenderer): Draws each frame and pushes only the changed rects to the display.
+        max_fps (int): The render frame rate cap, 0 for uncapped.
+        speed (float): Game seconds per real second, 1 for real speed.
+        game_clock (gameClock.WallClock): Turns real time into game time to spend on ticks; P pauses it.
+        skipped_frames (int): Render frames skipped to run catch-up ticks.
+        dropped_ticks (int): Simulation ticks dropped because the game fell too far behind.
+        actions (set): The actions pressed since the last simulation step.
+        audio (soundBus.SoundBus): Plays the simulation's sound events on a fixed budget of mixer channels.
+        bg (staticSprites.Background): The scrolling in-game background.
         gem_icon (pygame.Surface): Icon representing collected gems.
         gem_icon_rect (pygame.Rect): Rectangle representing the position of the gem icon.
+        hud (hudLayer.HudLayer): The score, gem counter, health bars and cooldown icons.
+        recording (replayLog.Replay): The seed of the current run, and its inputs when they are being recorded.
+        record_path (str): The file each finished run's replay is named after, or None.
+        runs_recorded (int): The number of replays written so far.
+        replay (replayLog.Replay): The replay being played back instead of the keyboard, or None.
+        entity_store (bool): Whether each run keeps obstacles, gems and projectiles in an entity store.
     """
 
-    def __init__(self):
-        """Initialize the game."""
-        
+    def __init__(self, seed=None, tick_rate=gameSimulation.TICK_RATE, max_fps=0, vsync=False,
+                 render_mode=frameRenderer.DIRTY, profile_path=None, pack_path=assetPack.PACK_PATH,
+                 record_path=None, replay=None, entity_store=False, speed=1.0):
+        """
+        Initialize the game.
+
+        Parameters:
+            seed (int, optional): The seed for the first run. A random seed is picked when None.
+            tick_rate (int, optional): Simulation ticks per second.
+            max_fps (int, optional): The render frame rate cap, 0 for uncapped.
+            vsync (bool, optional): Whether to pace rendering to the display's refresh rate.
+            render_mode (str, optional): frameRenderer.DIRTY to update only changed rects, or frameRenderer.FULL.
+            profile_path (str, optional): Record per-phase frame timings and write them to this .json or .csv
+                file on exit. F3 shows the timings on screen either way.
+            pack_path (str, optional): The baked asset pack to build assets from, used when it exists and is up to
+                date. None loads every asset from its file.
+            record_path (str, optional): Write a replay of each run when it ends, to this path numbered by run,
+                such as run-1.replay and run-2.replay for run.replay.
+            replay (replayLog.Replay, optional): Play this replay back at real speed instead of reading the keys.
+                Its seed and tick rate replace the ones given, and the game closes when it ends.
+            entity_store (bool, optional): Keep obstacles, gems and projectiles in NumPy arrays instead of sprites
+                that move themselves. Runs play out the same either way.
+            speed (float, optional): Game seconds per real second, such as 0.5 for slow motion.
+
+        Returns: None
+        """
+
+        self.start_time = time.perf_counter()
+
         # Define screen dimensions and colors
         self.SCREEN_WIDTH = 923.72
         self.SCREEN_HEIGHT = 480
         self.WHITE = (255, 255, 255)
         self.GREEN = (0, 255, 0)
+        self.BLACK = (0, 0, 0)
+
+        if replay is not None:
+            seed, tick_rate = replay.seed, replay.tick_rate
+        self.record_path = record_path
+        self.runs_recorded = 0
+        self.replay = replay
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.entity_store = entity_store
+        self.step_scale = gameSimulation.TICK_RATE / tick_rate
+        self.max_fps = max_fps
+        self.speed = speed
+        self.profile_path = profile_path
+        if profile_path:
+            PROFILER.enabled = True
 
         pygame.init()
-        
-        # Initialize sounds, game variables, and create the display
-        self.sound()
+
+        # Initialize game variables and create the display
         self.game_variables()
 
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        if vsync:
+            self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+        else:
+            self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption("Metro Runners")
-        
-        # Initialize background and sprite entities
+        self.renderer = frameRenderer.FrameRenderer(self.screen, render_mode, self.WHITE, ASSETS.atlas)
+
+        # Build baked assets straight from the pack, then decode the rest in the background, home menu first
+        ASSETS.use_pack(assetPack.open_pack(pack_path) if pack_path else None)
+        self.loader = assetLoader.AssetLoader()
+        self.loader.queue(homePageSprites.HOME_IMAGES)
+        self.loader.queue(assetLoader.find_assets(assetLoader.IMAGE_FOLDER, assetLoader.IMAGE_EXTENSIONS))
+        self.loader.queue(assetLoader.find_assets(assetLoader.SOUND_FOLDER, assetLoader.SOUND_EXTENSIONS))
+
+        # Only the home menu is needed for the first frame
+        self.loader.wait(homePageSprites.HOME_IMAGES)
         self.backgound_entities()
-        self.sprite_entities()
-        
+
+        # A replay skips the home menu and starts its run straight away
+        if self.replay is not None:
+            self.start_run()
+
+    def load_game_scene(self):
+        """
+        Description: Build the sounds, background, simulation and HUD of the game, waiting for any assets that
+            are still decoding.
+        Parameters: None
+        Returns: None
+        """
+        if self.scene_ready:
+            return
+        self.loader.wait()
+        self.sound()
+        self.bg = staticSprites.Background(self.screen)
+        self.sprite_entities(self.seed)
+        self.scene_ready = True
+        self.startup["time_to_interactive_ms"] = round((time.perf_counter() - self.start_time) * 1000, 1)
+        PROFILER.count("time_to_interactive_ms", self.startup["time_to_interactive_ms"])
+
+    def start_run(self):
+        """
+        Description: Leave the home menu and start playing, loading the game scene first if it is not ready.
+        Parameters: None
+        Returns: None
+        """
+        self.load_game_scene()  # Only waits if the background loading has not finished yet
+        self.end_game = False
+        self.button.kill()
+        self.logo.kill()
+        self.game_active = True
+
+    def finish_run(self):
+        """
+        Description: Close the current run's replay, saving it when recording, or checking it when playing one back.
+        Parameters: None
+        Returns: None
+        """
+        self.recording.finish(self.sim)
+        if self.record_path:
+            self.runs_recorded += 1
+            self.recording.save(replayLog.run_path(self.record_path, self.runs_recorded))
+        if self.replay is not None:
+            matched = self.recording.checksum == self.replay.checksum
+            print("Replay:", "matches the recording" if matched else "DOES NOT match the recording")
+            self.running = False
+
     def alter(self):
-        """Main game loop."""
-        
-        self.clock = pygame.time.Clock()
-        
+        """
+        Description: Main game loop.
+
+        Game time from the game clock, which is real time scaled by the speed and stopped while paused, is added to
+        an accumulator and spent in fixed simulation ticks, then one frame is rendered with the leftover fraction of
+        a tick used for interpolation. When the game falls behind, frames are skipped to
+        run up to MAX_TICKS_PER_FRAME ticks in a row; only a backlog beyond that is dropped.
+
+        Parameters: None
+        Returns: None
+        """
+
+        self.game_clock = gameClock.WallClock(self.max_fps, self.speed)
+        tick_ms = 1000 / self.tick_rate
+        accumulator = 0.0
+
         while self.running:
-            self.clock.tick(30)  # Cap the frame rate at 30 FPS
+            accumulator += self.game_clock.tick()  # Game time since the last frame, none while paused
+
+            if not self.scene_ready:
+                self.loader.pump()
+                if self.loader.done():
+                    self.load_game_scene()
+
+            with PROFILER.scope("frame"):
+                with PROFILER.scope("events"):
+                    self.handle_events()  # Handle user input events
+
+                ticks = 0
+                while accumulator >= tick_ms and self.running:
+                    if ticks == MAX_TICKS_PER_FRAME:
+                        # Still behind after skipping as many frames as allowed: drop the rest of the backlog
+                        self.dropped_ticks += int(accumulator // tick_ms)
+                        accumulator %= tick_ms
+                        break
+                    with PROFILER.scope("tick"):
+                        self.update_game()  # Update game state and logic
+                    accumulator -= tick_ms
+                    ticks += 1
+                if ticks > 1:
+                    self.skipped_frames += ticks - 1
+
+                with PROFILER.scope("audio"):
+                    self.audio.flush()  # Play each sound raised by this frame's ticks once
+
+                self.render(accumulator / tick_ms)
+
+        if self.game_active and self.replay is None:
+            self.finish_run()  # Keep the replay of a run cut short by closing the window
+
+        print("Startup:", self.startup)
+        print("Audio:", self.audio.stats())
+        print("Frame timings:", self.renderer.report())
+        self.loader.shutdown()
+        if self.profile_path:
+            PROFILER.dump(self.profile_path)
+        pygame.quit()  # Quit pygame when game loop ends
+
+    def render(self, alpha):
+        """
+        Description: Draw one frame.
 
-            self.handle_events()  # Handle user input events
+        Parameters:
+            alpha (float): How far between the last two ticks to draw moving sprites, from 0 to 1.
 
-            self.update_game()  # Update game state and logic
-            
-            # Draw home page when game is not active
-            if not self.game_active:
-                if not self.end_game:
-                    self.home_menu()
+        Returns: None
+        """
+        # The end screen stays on the display until a key is pressed
+        if self.end_game:
+            return
 
-            # Draw cooldown images and refresh display when game is active
-            if self.game_active:
-                self.screen.blit(self.player.brightened_cooldown_image, self.player.cooldown_image_rect)
-                self.screen.blit(self.player.brightened_dash_cooldown_image, self.player.dash_cooldown_image_rect)
-                self.screen.blit(self.player.brightened_slash_cooldown_image, self.player.slash_cooldown_image_rect)
+        self.renderer.begin()
 
-            pygame.display.flip()  # Update the full display surface
+        # Draw home page when game is not active
+        if not self.game_active:
+            self.home_menu()
 
-        pygame.quit()  # Quit pygame when game loop ends
+        # Draw sprites, HUD and cooldown images when game is active
+        else:
+            with PROFILER.scope("draw"):
+                self.update_sprites(alpha)
+            with PROFILER.scope("hud"):
+                self.hud.draw(self.renderer)
+
+        if PROFILER.show_overlay:
+            self.renderer.blit("profiler", PROFILER.overlay_surface(), (10, 90))
+
+        with PROFILER.scope("present"):
+            self.renderer.present()  # Update the changed parts of the display
+
+        if self.startup["time_to_first_frame_ms"] is None:
+            self.startup["time_to_first_frame_ms"] = round((time.perf_counter() - self.start_time) * 1000, 1)
+            PROFILER.count("time_to_first_frame_ms", self.startup["time_to_first_frame_ms"])
 
     def handle_events(self):
         """
         Description: Handle events (keyboard, mouse, etc.) during the game.
         Parameters: None
-        Returns: None 
+        Returns: None
         """
 
         for event in pygame.event.get():
@@ -98,151 +310,144 @@ class MetroRunnersGame:
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Check if the start button is clicked to begin the game
                 if self.button.is_clicked(pygame.mouse.get_pos()):
-                    self.end_game = False
-                    self.button.kill()
-                    self.logo.kill()
-                    self.background_home.kill()
-                    self.game_active = True
+                    self.start_run()
             elif event.type == pygame.KEYDOWN:
-                # Handle key presses during gameplay
-                current_time = pygame.time.get_ticks()
-                if event.key == pygame.K_SPACE and self.gravity_switches < self.max_gravity_switches:
-                    self.player.switch_gravity()
-                    self.gravity_switches += 1
-                    self.gravity_last_used = current_time
-                if event.key == pygame.K_d and current_time - self.shoot_last_used >= self.shoot_cooldown_time and self.game_active == True:
-                    self.player.shoot()
-                    self.shoot_last_used = current_time
-                if event.key == pygame.K_e and current_time - self.dash_last_used >= self.dash_cooldown_time and self.game_active == True:
-                    self.player.dash()
-                    self.dash_last_used = current_time
-                if event.key == pygame.K_f and current_time - self.slash_last_used >= self.slash_cooldown_time and self.game_active == True:
-                    self.player.slash()
-                    self.sword.add(self.player.sword)
-                    self.slash_last_used = current_time
+                if event.key == pygame.K_F3:
+                    PROFILER.toggle_overlay()  # Show or hide the frame timing overlay
+                if event.key == pygame.K_p and self.game_active:
+                    self.game_clock.toggle_pause()  # Freeze or resume the run; frames keep being drawn
+                # Queue key presses for the next simulation step, which checks the cooldowns
+                if self.game_active and event.key in self.key_actions:
+                    self.actions.add(self.key_actions[event.key])
                 if self.end_game:
                     if event.key == pygame.K_RETURN:
-                        self.end_game = False
-                        self.home_menu()
+                        self.end_game = False  # The home menu is drawn from the next frame
                     if event.key == pygame.K_q:
                         self.running = False
 
     def update_game(self):
         """
-        Description: Update game elements
+        Description: Update game elements by one simulation tick
         Parameters: None
         Returns: None
         """
 
-        self.background_home.update()  # Update moving background
-        
+        step = self.step_scale
+        self.background_home.update(step)  # Update moving background
+
         if self.game_active:
-            self.generate_obstacle()  # Generate obstacles
-            self.generate_gems()  # Generate gems
-            
-            self.detect_collision()  # Check for collisions
-            
-            self.score += 1  # Increase score over time
-
-            if self.score >= 2500:
-                self.final_boss()  # Trigger final boss battle if score reaches threshold
-            
-            self.update_sprites()  # Update and draw all sprites
-            
-            self.check_off_map()
-            self.check_death()
-                    
-            
-            self.ScoreKeeper()  # Display current score and gems collected
-            
-    def check_off_map(self): 
-        # Check if player is knocked off the map
-        if self.player.rect.centerx <= 0:
-            self.player.health -= 10
-            if self.player.health <= -10:
-                self.death_sound.play()
-                self.game_active = False
-                self.end_game = True
-                if self.end_game == True:
-                    staticSprites.End_Screen(self.screen, "You lost!")
-                    self.reset_game()
-                    
-        if self.player.rect.centerx >= 650: 
-            self.player.health -= 5
-
-    def update_sprites(self):
-        """
-        Description: Update sprite positions and draw them on the screen.
+            self.remember_positions()
+            self.bg.update(step)
+
+            if self.replay is not None:
+                self.actions = set(self.replay.actions(self.sim.tick))
+            if self.record_path:
+                self.recording.record(self.sim.tick, self.actions)  # Only a saved replay needs the inputs
+            self.sim.step(self.actions)  # Update game state and logic
+            self.actions = set()
+            self.play_sounds()
+
+            if self.sim.over:
+                self.game_over()
+                return
+            if self.replay is not None and self.sim.tick >= self.replay.ticks:
+                self.finish_run()  # The recording stopped before the run ended
+                return
+
+            if self.sim.boss_spawned:
+                self.bg.boss_fight()  # Switch to the boss background once the final boss appears
+
+    def remember_positions(self):
+        """
+        Description: Record where every drawn sprite is before a tick, so frames can interpolate from there.
         Parameters: None
         Returns: None
         """
+        sim = self.sim
+        sim.player.previous_topleft = sim.player.rect.topleft
+        for group in (sim.all_sprites, sim.player.projectiles, sim.sword):
+            for sprite in group:
+                sprite.previous_topleft = sprite.rect.topleft
 
-        if not self.end_game:
-            self.all_sprites.update()
-            self.player.update(self.obstacles, self.on_ground, self.on_ceil)
-
-            self.screen.fill(self.WHITE)
-
-            self.all_sprites.draw(self.screen)
-            self.screen.blit(self.player.image, self.player.rect)
-
-            self.gems_group.update()
-            self.gems_group.draw(self.screen)
-
-            self.player.projectiles.update()
-            self.player.projectiles.draw(self.screen)
-
-            self.sword.draw(self.screen)
+    def draw_interpolated(self, sprite, alpha):
+        """
+        Description: Draw a sprite part way between its position before and after the last tick.
 
-            self.obstacles.update()
+        Parameters:
+            sprite (pygame.sprite.Sprite): The sprite to draw.
+            alpha (float): How far between the two positions to draw it, from 0 to 1.
 
-            self.player.draw_health_bar(self.screen, 650, 20, self.player.health, (124, 252, 0))
+        Returns: None
+        """
+        x, y = sprite.rect.topleft
+        previous = getattr(sprite, "previous_topleft", None)
+        if previous is not None and abs(x - previous[0]) + abs(y - previous[1]) <= TELEPORT_DISTANCE:
+            x = previous[0] + (x - previous[0]) * alpha
+            y = previous[1] + (y - previous[1]) * alpha
+        self.renderer.blit(sprite, sprite.image, (x, y))
 
-            if self.boss_spawned:
-                self.boss.draw_health_bar(self.screen, 650, 40, self.boss.health, (138, 43, 226))
+    def play_sounds(self):
+        """
+        Description: Post the sound events raised during the last simulation step. They are played at the end of
+            the frame, once each however many ticks raised them.
+        Parameters: None
+        Returns: None
+        """
+        for event in self.sim.events:
+            self.audio.post(event)
 
-    def sound(self):
+    def game_over(self):
         """
-        Description: Load and initialize game sounds and music
+        Description: Show the end screen for the finished run and prepare the next one.
         Parameters: None
         Returns: None
         """
+        self.game_active = False
+        self.end_game = True
+        if self.sim.result == gameSimulation.WON:
+            staticSprites.End_Screen(self.screen, "CONGRATS! YOU WON!")
+        else:
+            staticSprites.End_Screen(self.screen, "You lost!")
+        self.renderer.invalidate()  # The end screen was drawn straight onto the display
+        self.finish_run()
+        self.reset_game()
+
+    def update_sprites(self, alpha=1.0):
+        """
+        Description: Draw every sprite in view at its interpolated position. Sleeping sprites are not in
+            all_sprites, and the viewport's margin keeps anything drawn part way back to its last position.
+
+        Parameters:
+            alpha (float, optional): How far between the last two ticks to draw moving sprites, from 0 to 1.
 
-        self.death_sound = pygame.mixer.Sound("00. Sounds/death.mp3")
-        self.death_sound.set_volume(0.3)
+        Returns: None
+        """
 
-        self.car_kill = pygame.mixer.Sound("00. Sounds/car.mp3")
-        self.car_kill.set_volume(0.5)
+        sim = self.sim
 
-        self.player_hit = pygame.mixer.Sound("00. Sounds/hit.mp3")
-        self.player_hit.set_volume(0.4)
+        self.bg.draw(self.renderer, alpha)
 
-        self.gem_sfx = pygame.mixer.Sound("00. Sounds/Gem Sound Effect 1.mp3")
-        self.gem_sfx.set_volume(0.1)
+        for sprite in sim.viewport.visible(sim.all_sprites):
+            self.draw_interpolated(sprite, alpha)
+        self.draw_interpolated(sim.player, alpha)
 
-        self.win = pygame.mixer.Sound("00. Sounds/Victory sound effects (no copyright).mp3")
-        self.win.set_volume(0.3)
-        
-        self.hit = pygame.mixer.Sound("00. Sounds/hit.mp3")
-        self.hit.set_volume(0.4)
-        
-        self.monster = pygame.mixer.Sound("00. Sounds/monster.mp3")
-        self.monster.set_volume(0.1)
+        for group in (sim.awake_gems, sim.player.projectiles, sim.sword):
+            for sprite in sim.viewport.visible(group):
+                self.draw_interpolated(sprite, alpha)
 
-        self.dashu_sound = pygame.mixer.Sound("00. Sounds/Upgrade dash.mp3")
-        self.dashu_sound.set_volume(1.5)
-        self.swordu_sound = pygame.mixer.Sound("00. Sounds/upgrade sword.mp3")
-        self.swordu_sound.set_volume(1.5)
-        self.shurikenu_sound = pygame.mixer.Sound("00. Sounds/Upgrade shurikan.mp3")
-        self.shurikenu_sound.set_volume(1.5)
+    def sound(self):
+        """
+        Description: Load the game's sound effects onto the sound bus and start the music
+        Parameters: None
+        Returns: None
+        """
 
-        self.upgrade = pygame.mixer.Sound("00. Sounds/Upgrade Sound Effect.mp3")
-        self.upgrade.set_volume(0.3)
+        # Sound effects are fully decoded up front; each event gets a priority for the channel budget
+        for event, (path, volume, priority) in SOUND_EVENTS.items():
+            self.audio.register(event, ASSETS.sound(path, volume), priority)
 
-        # Background Music
-        pygame.mixer.music.load("00. Sounds/SongBG.mp3")
-        pygame.mixer.music.set_volume(0.1)
-        pygame.mixer.music.play(-1)
+        # Background Music (optional, the game runs without it when the file or audio device is missing)
+        self.audio.play_music("00. Sounds/SongBG.mp3", 0.1)
 
     def game_variables(self):
         """
@@ -253,33 +458,24 @@ class MetroRunnersGame:
 
         self.running = True
         self.game_active = False
-        self.gravity_switch_allowed = True
-        self.slash_allowed = True
-        self.shoot_allowed = True
-        self.dash_allowed = True
-        self.on_ground = True
-        self.on_ceil = False
         self.end_game = False
-        self.boss_spawned = False
-
-        self.gravity_switches = 0
-        self.max_gravity_switches = 2
-
-        self.gravity_cooldown_time = 3000
-        self.slash_cooldown_time = 2000
-        self.shoot_cooldown_time = 1000
-        self.dash_cooldown_time = 1000
-        
-        # Add damage cooldown variables
-        self.damage_cooldown_time = 1000  # 1 second cooldown
-        self.last_damage_time = 0
-
-        self.gravity_last_used = -self.gravity_cooldown_time
-        self.slash_last_used = -self.slash_cooldown_time
-        self.shoot_last_used = -self.shoot_cooldown_time
-        self.dash_last_used = -self.dash_cooldown_time
-
-        self.font = pygame.font.Font("Migae.otf", 25)
+        self.scene_ready = False
+        self.sim = None
+        self.audio = soundBus.SoundBus()
+        self.startup = {"time_to_first_frame_ms": None, "time_to_interactive_ms": None}
+
+        # Frame pacing counters
+        self.skipped_frames = 0
+        self.dropped_ticks = 0
+
+        # Keys mapped to the simulation actions they trigger
+        self.key_actions = {
+            pygame.K_SPACE: gameSimulation.GRAVITY,
+            pygame.K_d: gameSimulation.SHOOT,
+            pygame.K_e: gameSimulation.DASH,
+            pygame.K_f: gameSimulation.SLASH,
+        }
+        self.actions = set()
 
     def backgound_entities(self):
         """
@@ -293,250 +489,82 @@ class MetroRunnersGame:
         self.background.fill(self.WHITE)
         self.screen.blit(self.background, (0, 0))
 
-        self.boundary_top = staticSprites.Boundary(0, 0, self.SCREEN_WIDTH, 1)
-        self.boundary_bottom = staticSprites.Boundary(0, self.SCREEN_HEIGHT - 5, self.SCREEN_WIDTH, 1)
-        self.bg = staticSprites.Background(self.screen)
-
-        self.all_sprites = pygame.sprite.OrderedUpdates(self.bg, self.boundary_top, self.boundary_bottom)
-
         # Create home menu sprites
         self.button = homePageSprites.ImageButton(310, 300)
         self.instructions = homePageSprites.Instructions(630, 120)
         self.logo = homePageSprites.MetroRunners(300, 10)
-        self.background_home = homePageSprites.CityBackground(0, 0)
-        
-    def sprite_entities(self):
+        self.background_home = homePageSprites.CityBackground(self.screen.get_size())
+
+    def sprite_entities(self, seed=None):
         """
-        Description: Initialize various game sprites and entities.
-        Parameters: None
+        Description: Initialize the game simulation and the HUD sprites.
+
+        Parameters:
+            seed (int, optional): The seed for the first run.
+
         Returns: None
         """
         # E - ENTITIES
+        self.sim = gameSimulation.GameSimulation(seed, self.tick_rate, screen=self.screen,
+                                                 entity_store=self.entity_store)
+        self.recording = replayLog.Replay(self.sim.seed, self.tick_rate)
 
-        # initiate player sprite
-        self.player = playerSprites.Player(self.screen)
-        self.sword = pygame.sprite.Group()
-
-        # Add obstacles
-        self.obstacles = pygame.sprite.Group()
-        self.obstacle = movingSprites.Obstacle(self.SCREEN_WIDTH + random.randint(100, 500),
-                                               random.randint(self.SCREEN_HEIGHT // 2, self.SCREEN_HEIGHT - 50),
-                                               30, 30, 10)
-        self.obstacles.add(self.obstacle)
-        self.all_sprites.add(self.obstacle)
-
-        # Add Gems
-        self.gems_group = pygame.sprite.Group()
-        self.gem = movingSprites.Gems(self.SCREEN_WIDTH + random.randint(100, 500),
-                                      random.randint(self.SCREEN_HEIGHT // 2, self.SCREEN_HEIGHT - 50), 10,
-                                      random.randrange(0, 4))
-        self.gems_group.add(self.gem)
-        self.all_sprites.add(self.gem)
-
-        # Initialize upgrades and game cycle
-        self.projectile_upgrade = 10
-        self.sword_upgrade = 10
-        self.dash_upgrade = 10
-        self.cycle = 1
-
-        # Boss
-        self.boss = movingSprites.Boss()
-
-        # Score and gem count
-        self.score = 0
-        self.start_time = time.time()
-        self.gems_collected = 0
+        # Warm the asset registry with the shuriken frames so the first burst never decodes images mid-frame
+        movingSprites.Projectile(0, 0)
+        # and with the player's hit flash, so the first hit does not tint every running frame mid-tick
+        self.sim.player.running_clip.flashed()
 
         # Load gem icon for display
-        self.gem_icon = pygame.transform.scale(pygame.image.load("01. Visual Assets/04. Gem Sprites/gem1.png").convert_alpha(), (25, 25))
+        self.gem_icon = ASSETS.image("01. Visual Assets/04. Gem Sprites/gem1.png", (25, 25))
         self.gem_icon_rect = self.gem_icon.get_rect()
         self.gem_icon_rect.topleft = (10, 50)
 
-    def generate_obstacle(self):
-        """
-        Description: Generate obstacles in the game if there are none currently on screen.
-        Parameters: None
-        Returns: None
-        """
-        # Check if there are any obstacles on the screen
-        if not self.obstacles:
-            # Generate a new obstacle
-
-            self.obstacle = movingSprites.Obstacle(
-                self.SCREEN_WIDTH + random.randint(100, 500),
-                random.randint(self.SCREEN_HEIGHT // 2, self.SCREEN_HEIGHT - 50),
-                30, 30, 10
-            )
-            
-            if not pygame.sprite.spritecollideany(self.obstacle, self.obstacles):
-                self.obstacles.add(self.obstacle)
-                self.all_sprites.add(self.obstacle)
+        self.hud_entities()
 
-    def generate_gems(self):
+    def hud_entities(self):
         """
-        Description: Generate gems in the game if there are none currently on screen.
-        Parameters: None
-        Returns: None
-        """
-        # Check if there are any gems on the screen
-        if not self.gems_group and not self.boss_spawned:
-            # Generate a new gem
-            self.gem = movingSprites.Gems(
-                self.SCREEN_WIDTH + random.randint(100, 500),
-                random.randint(self.SCREEN_HEIGHT // 2, self.SCREEN_HEIGHT - 50), 10, random.randrange(0, 4))
-            self.gems_group.add(self.gem)
-            self.all_sprites.add(self.gem)
-
-    def detect_collision(self):
-        """
-        Description: Detect collisions between game entities and handle interactions accordingly.
-        Parameters: None
-        Returns: None
-        """
-        # Check for collisions with the top and bottom boundaries
-        if pygame.sprite.collide_rect(self.player, self.boundary_top):
-            self.on_ceil = True
-            self.on_ground = False
-        elif pygame.sprite.collide_rect(self.player, self.boundary_bottom):
-            self.on_ground = True
-            self.on_ceil = False
-        else:
-            self.on_ground = False
-            self.on_ceil = False
-
-        # Reset gravity switches if the player touches the ground
-        if self.on_ground or self.on_ceil:
-            self.gravity_switches = 0
-            
-        # Check for player collision with obstacles
-        current_time = pygame.time.get_ticks()
-        if pygame.sprite.spritecollideany(self.player, self.obstacles):
-            if self.player.rect.x < self.obstacle.rect.x:
-                self.player.health -= 2
-                if current_time - self.last_damage_time >= self.damage_cooldown_time:
-                    
-                    # Handle collision
-                    self.hit.play()
-                    self.last_damage_time = current_time
-                    if self.player.health <= -10:
-                        self.death_sound.play()
-                        self.game_active = False
-                        self.end_game = True
-                        if self.end_game == True:
-                            staticSprites.End_Screen(self.screen, "You lost!")
-                            self.reset_game()
-
-        # Check for collisions between player projectiles and obstacles
-        for projectile in self.player.projectiles:
-            obstacle_hit = pygame.sprite.spritecollideany(projectile, self.obstacles)
-            if obstacle_hit:
-                # Remove the obstacle and projectile when they collide
-                self.score += 40
-                obstacle_hit.kill()
-                projectile.kill()
-                self.car_kill.play()
-
-        # Collision between projectile and boss
-        obstacle_hit_boss = pygame.sprite.spritecollide(self.boss, self.player.projectiles, True)
-        if obstacle_hit_boss:
-            self.boss.health -= 4
-            self.monster.play()
-            if self.boss.health <= -4:
-                self.boss_spawned = False
-                self.boss.kill()
-                self.game_active = False
-                self.end_game = True
-                self.reset_game()
-                staticSprites.End_Screen(self.screen, "CONGRATS! YOU WON!")
-                self.win.play()
-
-        # Check for player collision with gems
-        for gem in self.gems_group:
-            gem_collect = pygame.sprite.spritecollideany(self.player, self.gems_group)
-            if gem_collect:
-                gem_collect.kill()
-                self.gems_collected += 1
-                self.gem_sfx.play()
-            if self.cycle == 1 and self.gems_collected >= self.projectile_upgrade:
-                self.gems_collected = 0
-                self.projectile_upgrade += 5
-                self.cycle += 1
-                self.upgrade.play()
-                self.shurikenu_sound.play()
-                self.upgrade_projectiles()
-            if self.cycle == 2 and self.gems_collected >= self.sword_upgrade:
-                self.gems_collected = 0
-                self.sword_upgrade += 5
-                self.cycle += 1
-                self.upgrade.play()
-                self.swordu_sound.play()
-                self.upgrade_sword()
-            if self.cycle == 3 and self.gems_collected >= self.dash_upgrade:
-                self.gems_collected = 0
-                self.dash_upgrade += 5
-                self.cycle = 1
-                self.dashu_sound.play()
-                self.upgrade_dash()
-
-        # Check for sword collisions with obstacles
-        for sword in self.sword:
-            obstacle_hit = pygame.sprite.spritecollideany(sword, self.obstacles)
-            if obstacle_hit:
-                self.score += 40
-                obstacle_hit.kill()
-                self.car_kill.play()
-
-    def ScoreKeeper(self):
-        """
-        Description: Display the current score and number of gems collected on the game screen.
-        Parameters: None
-        Returns: None
-        """
-        # Draw score and gems collected
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
-        gems_text = self.font.render(f"x{self.gems_collected}", True, self.WHITE)
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(self.gem_icon, self.gem_icon_rect)
-        self.screen.blit(gems_text, (self.gem_icon_rect.right + 10, self.gem_icon_rect.top))
+        Description: Build the HUD: the score and gem counter, the health bars and the cooldown icons.
 
-    def check_death(self):
-        """
-        Description: Check if the player's health drops below zero, indicating game over.
-        Parameters: None
-        Returns: None
-        """
-        if self.player.health <= -10:
-            self.death_sound.play()
-            self.game_active = False
-            self.end_game = True
-            if self.end_game == True:
-                staticSprites.End_Screen(self.screen, "You lost!")
-                self.reset_game()
+        Each widget reads the current run through self.sim, so the HUD carries over when the run is reset. The
+        cooldown icons are repainted only when their precomputed brightness level changes.
 
-    def upgrade_projectiles(self):
-        """
-        Description: Upgrade the player's projectile abilities.
         Parameters: None
         Returns: None
         """
-        self.player.total_shurikens += 1
-
-    def upgrade_dash(self):
-        """
-        Description: Upgrade the player's dash ability.
-        Parameters: None
-        Returns: None
-        """
-        self.player.dash_cooldown -= 1.5
-        self.player.dash_distance += 25
-
-    def upgrade_sword(self):
-        """
-        Description: Upgrade the player's sword.
-        Parameters: None
-        Returns: None
-        """
-        self.player.size += 50
+        player = self.sim.player
+        boss = self.sim.boss
+        text_height = TEXT.size("0")[1]
+        gems_x = self.gem_icon_rect.right + 10
+
+        score_panel = hudLayer.HudPanel("score", [
+            hudLayer.HudWidget((10, 10, 400, text_height), lambda: self.sim.score,
+                               lambda surface, x, y: TEXT.draw(surface, f"Score: {self.sim.score}", (x, y), self.WHITE)),
+            hudLayer.HudWidget(self.gem_icon_rect, lambda: True,
+                               lambda surface, x, y: surface.blit(self.gem_icon, (x, y))),
+            hudLayer.HudWidget((gems_x, self.gem_icon_rect.top, 100, text_height), lambda: self.sim.gems_collected,
+                               lambda surface, x, y: surface.blit(TEXT.render(f"x{self.sim.gems_collected}", self.WHITE), (x, y))),
+        ])
+
+        health_panel = hudLayer.HudPanel("health", [
+            hudLayer.HudWidget(player.health_bar_rect(650, 20), lambda: int(max(self.sim.player.health, 0)),
+                               lambda surface, x, y: self.sim.player.draw_health_bar(
+                                   surface, x, y, self.sim.player.health, (124, 252, 0))),
+            hudLayer.HudWidget(boss.health_bar_rect(650, 40),
+                               lambda: int(max(self.sim.boss.health, 0)) if self.sim.boss_spawned else None,
+                               lambda surface, x, y: self.sim.boss.draw_health_bar(
+                                   surface, x, y, self.sim.boss.health, (138, 43, 226))),
+        ])
+
+        cooldown_panel = hudLayer.HudPanel("cooldowns", [
+            hudLayer.HudWidget(player.cooldown_image_rect, lambda: self.sim.player.brightened_cooldown_image,
+                               lambda surface, x, y: surface.blit(self.sim.player.brightened_cooldown_image, (x, y))),
+            hudLayer.HudWidget(player.dash_cooldown_image_rect, lambda: self.sim.player.brightened_dash_cooldown_image,
+                               lambda surface, x, y: surface.blit(self.sim.player.brightened_dash_cooldown_image, (x, y))),
+            hudLayer.HudWidget(player.slash_cooldown_image_rect, lambda: self.sim.player.brightened_slash_cooldown_image,
+                               lambda surface, x, y: surface.blit(self.sim.player.brightened_slash_cooldown_image, (x, y))),
+        ])
+
+        self.hud = hudLayer.HudLayer([score_panel, health_panel, cooldown_panel])
 
     def reset_game(self):
         """
@@ -544,28 +572,11 @@ class MetroRunnersGame:
         Parameters: None
         Returns: None
         """
-        self.score = 0
-        self.gems_collected = 0
-        self.gravity_switches = 0
-        self.player.health = 100
-        self.player.rect.centerx = self.SCREEN_WIDTH // 2
-        self.player.rect.centery = self.SCREEN_HEIGHT // 2
-        self.obstacles.empty()
-        self.gems_group.empty()
-        self.all_sprites.empty()
-        self.all_sprites.add(self.bg, self.boundary_top, self.boundary_bottom)
-        self.boss.rect.right = 1300
-        self.boss.health = 100
+        self.sim.reset()
+        self.recording = replayLog.Replay(self.sim.seed, self.tick_rate)
         self.bg.normal()
-        self.boss_spawned = False
-        self.player.total_shurikens = 3
-        self.player.dash_distance = 100
-        self.player.dash_cooldown = 10
-        self.player.size = 100
-        self.projectile_upgrade = 10
-        self.sword_upgrade = 10
-        self.dash_upgrade = 10
-                    
+        self.actions = set()
+
     def home_menu(self):
         """
         Description: Display the home menu page
@@ -573,19 +584,49 @@ class MetroRunnersGame:
         Returns: None
         """
         # Draw elements
-        self.screen.blit(self.background_home.image, self.background_home.rect)
-        self.screen.blit(self.button.image, self.button.rect)
-        self.screen.blit(self.logo.image, self.logo.rect)
-        self.screen.blit(self.instructions.image, self.instructions.rect)
+        self.background_home.draw(self.renderer)
+        for sprite in (self.button, self.logo, self.instructions):
+            self.renderer.blit(sprite, sprite.image, sprite.rect.topleft)
+
+        # Show how much of the game is loaded under the Play button until it is ready
+        if not self.scene_ready:
+            bar = pygame.Rect(self.button.rect.left, self.button.rect.bottom + 8, self.button.rect.width, 8)
+            percent = int(self.loader.progress() * 100)
+            self.renderer.draw("loading", bar, percent, lambda surface: self.draw_loading_bar(surface, bar, percent))
 
-    def final_boss(self): 
+    def draw_loading_bar(self, surface, rect, percent):
         """
-        Description: Spawns the final boss
-        Parameters: None
+        Description: Draw the loading progress bar.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The area of the whole bar.
+            percent (int): How much of the bar to fill, from 0 to 100.
+
         Returns: None
         """
-        self.all_sprites.add(self.boss)
-        self.bg.boss_fight()
-        self.boss_spawned = True
-    
-MetroRunnersGame().alter()
\ No newline at end of file
+        pygame.draw.rect(surface, self.BLACK, rect, 1)
+        pygame.draw.rect(surface, self.GREEN, (rect.x, rect.y, rect.width * percent // 100, rect.height))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play METRO RUNNERS.")
+    parser.add_argument("--seed", type=replayLog.seed_value, help="seed of the first run")
+    parser.add_argument("--tick-rate", type=int, default=gameSimulation.TICK_RATE,
+                        help="simulation ticks per second")
+    parser.add_argument("--max-fps", type=int, default=0, help="render frame rate cap, 0 for uncapped")
+    parser.add_argument("--vsync", action="store_true", help="pace rendering to the display's refresh rate")
+    parser.add_argument("--render-mode", choices=(frameRenderer.DIRTY, frameRenderer.FULL),
+                        default=frameRenderer.DIRTY, help="update only changed rects, or redraw every frame")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="record per-phase frame timings and write them to this .json or .csv file on exit")
+    parser.add_argument("--record", metavar="PATH",
+                        help="write a replay of each run to PATH numbered by run, such as run-1.replay")
+    parser.add_argument("--replay", metavar="PATH", help="play this replay back at real speed instead of the keys")
+    parser.add_argument("--entity-store", action="store_true",
+                        help="move obstacles, gems and projectiles as NumPy arrays")
+    parser.add_argument("--speed", type=float, default=1.0, help="game seconds per real second, such as 0.5")
+    args = parser.parse_args()
+    MetroRunnersGame(seed=args.seed, tick_rate=args.tick_rate, max_fps=args.max_fps, vsync=args.vsync,
+                     render_mode=args.render_mode, profile_path=args.profile, record_path=args.record,
+                     replay=replayLog.Replay.load(args.replay) if args.replay else None,
+                     entity_store=args.entity_store, speed=args.speed).alter()
@@ -6,14 +6,112 @@ Description: This program file contains all of the moving sprites in the main ga
 
 import pygame
 import random
+import itertools
+from assetRegistry import ASSETS
+from animationClip import AnimationClip
+from textRenderer import TEXT
 
 SCREEN_WIDTH = 923.72
 SCREEN_HEIGHT = 480
 WHITE = (255, 255, 255)
 BAR_WIDTH = 200
 BAR_HEIGHT = 20
+SERIALS = itertools.count()  # Numbers pooled sprites in the order they are put in use
 
-class Obstacle(pygame.sprite.Sprite):
+def carry(amount, remainder):
+    """
+    Description: Add a fractional amount to a carried remainder and split off the whole part.
+
+    Sprites move in whole pixels, so when a tick only covers part of a pixel the fraction is carried over to the
+    next tick. This keeps speeds exact at any tick rate.
+
+    Parameters:
+        amount (float): The amount to add this tick.
+        remainder (float): The fraction carried over from earlier ticks.
+
+    Returns:
+        tuple: (whole, remainder) where whole is an int and remainder is the new fraction to carry.
+    """
+    amount += remainder
+    whole = int(amount)
+    return whole, amount - whole
+
+def carry_many(amount, remainder, count):
+    """
+    Description: Add the same fractional amount several times, as that many calls to carry would.
+
+    Parameters:
+        amount (float): The amount added each time.
+        remainder (float): The fraction carried over from earlier ticks.
+        count (int): How many times to add it.
+
+    Returns:
+        tuple: (whole, remainder) where whole is the total int split off and remainder is the new fraction.
+    """
+    if remainder == 0 and amount == int(amount):
+        return int(amount) * count, remainder  # Whole amounts never leave a fraction to carry
+    whole = 0
+    for i in range(count):
+        part, remainder = carry(amount, remainder)
+        whole += part
+    return whole, remainder
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Description: A sprite that can be reused through an objectPool.ObjectPool.
+
+    Subclasses put all of their per-use state in reset(), so a reused sprite carries the same fixed set of
+    attributes as a new one. Killing a pooled sprite removes it from its groups and returns it to its pool.
+
+    Attributes:
+        pool (objectPool.ObjectPool): The pool the sprite came from, or None when it was created directly.
+        active (bool): Whether the sprite is in use.
+        serial (int): Orders pooled sprites by when they were last put in use, which is the order groups of
+            them hold them in unless some joined late.
+    """
+    def __init__(self):
+        """
+        Description: Initialize a pooled sprite that is in use but does not belong to a pool.
+        Parameters: None
+        Returns: None
+        """
+        pygame.sprite.Sprite.__init__(self)
+        self.pool = None
+        self.active = True
+        self.serial = next(SERIALS)
+
+    def activate(self, pool):
+        """
+        Description: Mark the sprite as in use.
+
+        Parameters:
+            pool (objectPool.ObjectPool): The pool it was acquired from.
+
+        Returns: None
+        """
+        self.pool = pool
+        self.active = True
+        self.serial = next(SERIALS)
+
+    def deactivate(self):
+        """
+        Description: Mark the sprite as free.
+        Parameters: None
+        Returns: None
+        """
+        self.active = False
+
+    def kill(self):
+        """
+        Description: Remove the sprite from all groups and return it to its pool.
+        Parameters: None
+        Returns: None
+        """
+        pygame.sprite.Sprite.kill(self)
+        if self.pool is not None and self.active:
+            self.pool.release(self)
+
+class Obstacle(PooledSprite):
     """
     A class to represent obstacles in the game.
 
@@ -24,8 +122,10 @@ class Obstacle(pygame.sprite.Sprite):
         height (float): The height of the obstacle.
         speed (int): The speed at which the obstacle moves.
         imgpath (str): The file path to the image of the obstacle.
+        rng (random.Random): The random number generator used to pick a new height when the obstacle wraps.
+        loop (bool): Whether the obstacle wraps back to the right edge instead of leaving the screen.
     """
-    def __init__(self, x, y, width, height, speed, imgpath="01. Visual Assets/05. Other Sprites/flying car.png"):
+    def __init__(self, x, y, width, height, speed, imgpath="01. Visual Assets/05. Other Sprites/flying car.png", rng=random):
         """
         Initialize an Obstacle instance.
 
@@ -36,33 +136,72 @@ class Obstacle(pygame.sprite.Sprite):
             height (float): The height of the obstacle.
             speed (int): The speed at which the obstacle moves.
             imgpath (str): The file path to the image of the obstacle.
+            rng (random.Random, optional): The random number generator to use. Defaults to the global one.
             
         Returns: None
         """
-        pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.transform.scale(pygame.image.load(imgpath).convert_alpha(), (100, 50))
+        PooledSprite.__init__(self)
+        self.image = ASSETS.sprite(imgpath, (100, 50))
         self.rect = self.image.get_rect()
+        self.reset(x, y, speed, rng)
+
+    def reset(self, x, y, speed, rng=random, loop=True):
+        """
+        Description: Place the obstacle for a new use.
+
+        Parameters:
+            x (float): The x-coordinate of the obstacle.
+            y (float): The y-coordinate of the obstacle.
+            speed (int): The speed at which the obstacle moves.
+            rng (random.Random, optional): The random number generator to use. Defaults to the global one.
+            loop (bool, optional): Whether it wraps back to the right edge instead of leaving the screen.
+
+        Returns: None
+        """
         self.rect.x = x
         self.rect.y = y
         self.speed = speed
+        self.rng = rng
+        self.loop = loop
+        self.move_remainder = 0.0
 
-    def update(self):
+    def update(self, step=1.0):
         """
         Description: Update the obstacle's position.
 
         Move the obstacle to the left based on its speed.
         If the obstacle moves off the screen, reset its position to the right
-        and randomize its height for variation.
+        and randomize its height for variation, or remove it if it does not loop.
         
-        Parameters: None
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
         Returns: None
         """
-        self.rect.x -= self.speed
+        distance, self.move_remainder = carry(self.speed * step, self.move_remainder)
+        self.rect.x -= distance
         if self.rect.right < 0:
+            if not self.loop:
+                self.kill()
+                return
             self.rect.left = SCREEN_WIDTH
-            self.rect.bottom = random.randint(50, SCREEN_HEIGHT - 50)
+            self.rect.bottom = self.rng.randint(50, SCREEN_HEIGHT - 50)
+
+    def fast_forward(self, updates, step=1.0):
+        """
+        Description: Move the obstacle to where a number of updates would take it, without updating it, such as
+            after it slept out of view. It must not reach the left edge on the way.
+
+        Parameters:
+            updates (int): The updates missed.
+            step (float, optional): The length of each tick as a fraction of a 30 FPS frame.
+
+        Returns: None
+        """
+        distance, self.move_remainder = carry_many(self.speed * step, self.move_remainder, updates)
+        self.rect.x -= distance
             
-class Gems(pygame.sprite.Sprite): 
+class Gems(PooledSprite): 
     """
     A class to represent gems in the game.
 
@@ -96,42 +235,75 @@ class Gems(pygame.sprite.Sprite):
         Parameters: None
         Returns: None
         """
-        pygame.sprite.Sprite.__init__(self)
-        self.images = [pygame.image.load(img1).convert_alpha(), pygame.image.load(img2).convert_alpha(), 
-                       pygame.image.load(img3).convert_alpha(), pygame.image.load(img4).convert_alpha()]
-        self.image = pygame.transform.scale(self.images[image_index], (35, 35))
+        PooledSprite.__init__(self)
+        self.scaled_images = [ASSETS.sprite(img, (35, 35)) for img in (img1, img2, img3, img4)]
+        self.image = self.scaled_images[image_index]
         self.rect = self.image.get_rect()
+        self.reset(x, y, speed, image_index)
+
+    def reset(self, x, y, speed, image_index):
+        """
+        Description: Place the gem for a new use.
+
+        Parameters:
+            x (float): The x-coordinate of the gem.
+            y (float): The y-coordinate of the gem.
+            speed (int): The speed at which the gem moves.
+            image_index (int): The index to choose the gem image.
+
+        Returns: None
+        """
+        self.image = self.scaled_images[image_index]
         self.rect.x = x
         self.rect.y = y
         self.speed = speed
+        self.move_remainder = 0.0
         
-    def update(self): 
+    def update(self, step=1.0): 
         """
         Description: Update the gem's position.
 
         Move the gem to the left based on its speed.
         If the gem moves off the screen, remove it from all sprite groups.
         
-        Parameters: None
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
         Returns: None
         """
-        self.rect.x -= self.speed
+        distance, self.move_remainder = carry(self.speed * step, self.move_remainder)
+        self.rect.x -= distance
         if self.rect.right < 0: 
             self.kill() 
 
+    def fast_forward(self, updates, step=1.0):
+        """
+        Description: Move the gem to where a number of updates would take it, without updating it, such as after
+            it slept out of view. It must not reach the left edge on the way.
+
+        Parameters:
+            updates (int): The updates missed.
+            step (float, optional): The length of each tick as a fraction of a 30 FPS frame.
+
+        Returns: None
+        """
+        distance, self.move_remainder = carry_many(self.speed * step, self.move_remainder, updates)
+        self.rect.x -= distance
+
             
-class Projectile(pygame.sprite.Sprite):
+class Projectile(PooledSprite):
     """
     A class to represent projectiles in the game.
 
     Attributes:
         x (float): The x-coordinate of the projectile.
         y (float): The y-coordinate of the projectile.
+        clip (AnimationClip): The projectile animation, pre-scaled to 25x25.
         images (list): A list of images for the projectile animation.
         image_index (int): The current index of the image being displayed.
         speed (int): The speed at which the projectile moves.
-        last_update (int): The time of the last update.
-        animation_delay (int): The delay between animation frames in milliseconds.
+        animation_count (float): The number of 30 FPS updates since the last frame change.
+        animation_delay (int): The number of 30 FPS updates between animation frames.
     """
     def __init__(self, x, y, image1="01. Visual Assets/01. Projectile Sprites/shuriken1.png", 
                  image2="01. Visual Assets/01. Projectile Sprites/shuriken2.png",
@@ -150,21 +322,34 @@ class Projectile(pygame.sprite.Sprite):
             
         Returns: None
         """
-        pygame.sprite.Sprite.__init__(self)
-        self.images = [pygame.image.load(image1).convert_alpha(), pygame.image.load(image2).convert_alpha(), 
-                       pygame.image.load(image3).convert_alpha(), pygame.image.load(image4).convert_alpha()]
-        self.image_index = 0
-        self.image = pygame.transform.scale(self.images[self.image_index], (25, 25))
+        PooledSprite.__init__(self)
+        self.clip = AnimationClip((image1, image2, image3, image4), (25, 25))
+        self.images = self.clip.frames()
+        self.speed = 15
+        self.animation_delay = 2  # Updates between frame changes (projectiles are updated twice per tick)
+        self.imageNum = 0 
+        self.image = self.images[0]
         self.rect = self.image.get_rect()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """
+        Description: Place the projectile for a new throw.
+
+        Parameters:
+            x (float): The x-coordinate of the projectile.
+            y (float): The y-coordinate of the projectile.
+
+        Returns: None
+        """
+        self.image_index = 0
+        self.image = self.images[self.image_index]
         self.rect.x = x
         self.rect.y = y
-        self.speed = 15
-        self.last_update = pygame.time.get_ticks()  # Track the time of the last update
-        self.animation_delay = 2  # Milliseconds between frame updates
         self.animation_count = 0 
-        self.imageNum = 0 
+        self.move_remainder = 0.0
 
-    def update(self):
+    def update(self, step=1.0):
         """
         Description: Update the projectile's position and animate its image.
 
@@ -172,17 +357,20 @@ class Projectile(pygame.sprite.Sprite):
         Alternate between the images for animation.
         If the projectile moves off the screen, remove it from all sprite groups.
         
-        Parameters: None
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
         Returns: None
         """
-        now = pygame.time.get_ticks()
         # Check if it's time to update the frame
-        if now - self.last_update > self.animation_delay:
-            self.last_update = now
+        self.animation_count += step
+        if self.animation_count >= self.animation_delay:
+            self.animation_count = 0
             # Alternate between the two images
             self.image_index = (self.image_index + 1) % len(self.images)
-            self.image = pygame.transform.scale(self.images[self.image_index], (25,25)) 
-        self.rect.x += self.speed
+            self.image = self.images[self.image_index]
+        distance, self.move_remainder = carry(self.speed * step, self.move_remainder)
+        self.rect.x += distance
         if self.rect.left > SCREEN_WIDTH:
             self.kill()
 
@@ -193,15 +381,15 @@ class Sword(pygame.sprite.Sprite):
 
     Attributes:
         player (object): The player object.
-        images (list): A list of images for the sword animation.
+        clip (AnimationClip): The sword animation, pre-scaled to the sword's size.
+        images (list): A list of images for the sword animation, upside down while flipped.
         image (Surface): The current image of the sword.
         size (int): The size of the sword.
         rect (Rect): The rectangle representing the sword's position.
         is_swinging (bool): A flag indicating whether the sword is swinging.
         frame_index (int): The current frame index in the animation.
-        animation_speed (float): The speed of the animation.
-        current_time (int): The current time.
-        last_update (int): The time of the last update.
+        animation_speed (float): The number of 30 FPS frames each animation frame is shown for.
+        timer (timerWheel.Timer): Moves the swing on a frame at a time, None while the sword is not swinging.
         flipped (bool): A flag indicating whether the sword is flipped.
     """
     def __init__(self, player, y, x, size, 
@@ -228,9 +416,8 @@ class Sword(pygame.sprite.Sprite):
         """
         pygame.sprite.Sprite.__init__(self)
         self.player = player
-        self.images = [pygame.image.load(image1).convert_alpha(), pygame.image.load(image2).convert_alpha(), 
-                       pygame.image.load(image3).convert_alpha(), pygame.image.load(image4).convert_alpha(), 
-                       pygame.image.load(image5).convert_alpha()]
+        self.clip = AnimationClip((image1, image2, image3, image4, image5), (size, size))
+        self.images = self.clip.frames()
         
         self.image = self.images[0]
         self.size = size
@@ -241,40 +428,23 @@ class Sword(pygame.sprite.Sprite):
         # Some control variables
         self.is_swinging = False
         self.frame_index = 0
-        self.animation_speed = 0.4
-        self.current_time = 0
-        self.last_update = 0
+        self.animation_speed = 1
+        self.timer = None
         self.flipped = False
 
-    def update(self, y, x):
+    def update(self, y, x, step=1.0):
         """
-        Description: Update the sword's position and animation.
+        Description: Update the sword's position. Its timer animates it.
 
         Parameters:
             y (float): The y-coordinate of the sword.
             x (float): The x-coordinate of the sword.
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
             
         Returns: None
         """
         self.rect.left = (y-50)
         self.rect.top = (x-60)
-
-        # Flip the sword animation if player is flipped
-        if self.flipped:
-            self.images = [pygame.transform.flip(image, False, True) for image in self.images]
-            
-        # Animate the sword
-        if self.is_swinging:
-            self.current_time += pygame.time.get_ticks()
-            if self.current_time - self.last_update > self.animation_speed:
-                self.last_update = self.current_time
-                self.images[self.frame_index] = pygame.transform.scale(self.images[self.frame_index], (self.size, self.size))
-                self.frame_index += 1
-                if self.frame_index >= 5:
-                    self.frame_index = 0
-                    self.is_swinging = False
-                    self.kill()
-                self.image = self.images[self.frame_index]
     
     def swing(self):
         """
@@ -285,8 +455,40 @@ class Sword(pygame.sprite.Sprite):
         if not self.is_swinging:
             self.is_swinging = True
             self.frame_index = 0
-            self.current_time = 0
-            self.last_update = 0
+            self.image = self.images[0]
+            timers = self.player.timers
+            delay = timers.frames(self.animation_speed)
+            self.timer = timers.schedule(delay, self.next_frame, delay)
+
+    def next_frame(self):
+        """
+        Description: Show the next frame of the swing, putting the sword away after the last. Called by its timer.
+        Parameters: None
+        Returns: None
+        """
+        self.frame_index += 1
+        if self.frame_index >= 5:
+            self.frame_index = 0
+            self.is_swinging = False
+            self.timer.cancel()
+            self.timer = None
+            self.kill()
+        self.image = self.images[self.frame_index]
+
+    def resize(self, size):
+        """
+        Description: Change the drawn size of the sword, such as after an upgrade, re-scaling its frames once.
+
+        Parameters:
+            size (int): The new width and height of the sword.
+
+        Returns: None
+        """
+        self.size = size
+        self.clip.resize((size, size))
+        self.images = self.clip.frames(self.flipped)
+        self.image = self.images[self.frame_index]
+        self.rect.size = self.image.get_size()  # The hit area covers the drawn frame, whose pixels decide hits
 
     def switch_gravity(self):
         """
@@ -295,24 +497,25 @@ class Sword(pygame.sprite.Sprite):
         Returns: None
         """
         self.flipped = not self.flipped
+        self.images = self.clip.frames(self.flipped)
+        self.image = self.images[self.frame_index]
 
 class Boss(pygame.sprite.Sprite):
     """
     A class to represent the boss in the game.
 
     Attributes:
+        clip (AnimationClip): The boss animation, pre-scaled to 300x300.
         images (list): A list of images for the boss animation.
         image_index (int): The current index of the image being displayed.
         image (Surface): The current image of the boss.
+        timers (timerWheel.TimerWheel): The wheel its animation timer waits in.
         is_animated (bool): A flag indicating whether the boss is animated.
-        animation_speed (float): The speed of the animation.
-        current_time (int): The current time.
-        last_update (int): The time of the last update.
+        animation_speed (float): The number of 30 FPS frames each animation frame is shown for.
         rect (Rect): The rectangle representing the boss's position.
         health (int): The health of the boss.
-        font (Font): The font used for rendering text.
     """
-    def __init__(self, 
+    def __init__(self, timers,
                  image1="01. Visual Assets/03. Monster Sprites/monster1.gif", 
                  image2="01. Visual Assets/03. Monster Sprites/monster2.gif", 
                  image3="01. Visual Assets/03. Monster Sprites/monster3.gif", 
@@ -322,6 +525,7 @@ class Boss(pygame.sprite.Sprite):
         Description: Initialize a Boss instance.
 
         Parameters:
+            timers (timerWheel.TimerWheel): The wheel to animate the boss with once it appears.
             image1 (str): The file path to the first image of the boss. 
             image2 (str): The file path to the second image of the boss. 
             image3 (str): The file path to the third image of the boss. 
@@ -332,16 +536,15 @@ class Boss(pygame.sprite.Sprite):
         """
         pygame.sprite.Sprite.__init__(self)
 
-        self.images = [pygame.image.load(image1).convert_alpha(), pygame.image.load(image2).convert_alpha(), 
-                       pygame.image.load(image3).convert_alpha(), pygame.image.load(image4).convert_alpha(),
-                       pygame.image.load(image5).convert_alpha()]
+        self.clip = AnimationClip((image1, image2, image3, image4, image5), (300, 300))  # Adjust size as needed
+        self.images = self.clip.frames()
         self.image_index = 0
-        self.image = pygame.transform.scale(self.images[self.image_index], (300,300))  # Adjust size as needed
+        self.image = self.images[self.image_index]
 
+        self.timers = timers
         self.is_animated = False
-        self.animation_speed = 0.4
-        self.current_time = 0
-        self.last_update = 0
+        self.animation_speed = 1
+        self.move_remainder = 0.0
 
         # Set boss position
         self.rect = self.image.get_rect()
@@ -350,28 +553,40 @@ class Boss(pygame.sprite.Sprite):
 
         self.health = 100
 
-        # font 
-        self.font = pygame.font.Font("Migae.otf", 25)
-
-    def update(self):
+    def update(self, step=1.0):
         """
-        Description: Update the boss's position and animate its image.
+        Description: Update the boss's position.
 
-        Move the boss left until it reaches a certain position.
-        Alternate between the images for animation.
+        Move the boss left until it reaches a certain position. Its timer animates it.
         
-        Parameters: None
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
         Returns: None
         """
         if self.rect.right >= SCREEN_WIDTH + 100: 
-            self.rect.left -= 50
+            distance, self.move_remainder = carry(50 * step, self.move_remainder)
+            self.rect.left -= distance
 
-        # Animate 
-        self.current_time += pygame.time.get_ticks()
-        if self.current_time - self.last_update > self.animation_speed:
-            self.last_update = self.current_time
-            self.image_index = (self.image_index + 1) % len(self.images)
-            self.image = pygame.transform.scale(self.images[self.image_index], (300,300)) 
+    def start_animation(self):
+        """
+        Description: Start cycling through the boss's frames, such as when it appears.
+        Parameters: None
+        Returns: None
+        """
+        if not self.is_animated:
+            self.is_animated = True
+            delay = self.timers.frames(self.animation_speed)
+            self.timers.schedule(delay, self.next_frame, delay)
+
+    def next_frame(self):
+        """
+        Description: Show the boss's next frame. Called by its animation timer.
+        Parameters: None
+        Returns: None
+        """
+        self.image_index = (self.image_index + 1) % len(self.images)
+        self.image = self.images[self.image_index]
 
     def draw_health_bar(self, surface, x, y, health, color):
         """
@@ -394,5 +609,19 @@ class Boss(pygame.sprite.Sprite):
         fill_rect = pygame.Rect(x, y, fill, BAR_HEIGHT)
         pygame.draw.rect(surface, self.color, fill_rect)
         pygame.draw.rect(surface, WHITE, border_rect, 2)
-        health_text = self.font.render(f"{int(self.health)}%", True, WHITE)
+        health_text = TEXT.render(f"{int(self.health)}%", WHITE)
         surface.blit(health_text, (x + BAR_WIDTH + 10, y))
+
+    def health_bar_rect(self, x, y):
+        """
+        Description: Get the area covered by the health bar and its percentage text.
+
+        Parameters:
+            x (int): The x-coordinate of the top-left corner of the health bar.
+            y (int): The y-coordinate of the top-left corner of the health bar.
+
+        Returns:
+            pygame.Rect: The area the health bar draws inside.
+        """
+        text_width, text_height = TEXT.size("100%")
+        return pygame.Rect(x, y, BAR_WIDTH + 10 + text_width, max(BAR_HEIGHT, text_height))
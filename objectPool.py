@@ -0,0 +1,99 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the object pool used for sprites that are spawned and killed all the time, such as projectiles, obstacles and gems. Killed sprites go back to the pool and are reset for their next use instead of being thrown away.
+"""
+
+
+class ObjectPool:
+    """
+    Description: A pool of reusable objects.
+
+    Pooled objects must have reset(*args) to restore a fresh state, activate(pool) to mark them in use and
+    deactivate() to mark them free. movingSprites.PooledSprite provides activate and deactivate, and returns
+    itself to its pool when killed.
+
+    Attributes:
+        factory (function): Creates a new object when the pool is empty.
+        free (list): Objects ready to be reused.
+        max_size (int): The most free objects kept; extra released objects are dropped.
+        created (int): Objects created by the factory.
+        reused (int): Acquisitions served from the free list.
+        released (int): Objects returned to the pool.
+        active (int): Objects currently in use.
+        peak_active (int): The most objects in use at once.
+    """
+
+    def __init__(self, factory, size=0, max_size=256):
+        """
+        Description: Initialize a pool, optionally creating some objects up front.
+
+        Parameters:
+            factory (function): Creates a new object. Called with no arguments.
+            size (int, optional): How many objects to create up front.
+            max_size (int, optional): The most free objects to keep.
+
+        Returns: None
+        """
+        self.factory = factory
+        self.max_size = max(max_size, size)
+        self.free = [factory() for i in range(size)]
+        self.created = size
+        self.reused = 0
+        self.released = 0
+        self.active = 0
+        self.peak_active = 0
+
+    def acquire(self, *args):
+        """
+        Description: Get an object from the pool, creating one only when none are free.
+
+        Parameters:
+            args: Passed to the object's reset().
+
+        Returns:
+            object: The reset, active object.
+        """
+        if self.free:
+            obj = self.free.pop()
+            self.reused += 1
+        else:
+            obj = self.factory()
+            self.created += 1
+        obj.reset(*args)
+        obj.activate(self)
+        self.active += 1
+        if self.active > self.peak_active:
+            self.peak_active = self.active
+        return obj
+
+    def release(self, obj):
+        """
+        Description: Return an object to the pool.
+
+        Parameters:
+            obj (object): The object to return. It must have come from acquire().
+
+        Returns: None
+        """
+        obj.deactivate()
+        self.active -= 1
+        self.released += 1
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def stats(self):
+        """
+        Description: Report how the pool is being used.
+        Parameters: None
+        Returns:
+            dict: Created, reused, released, active, peak active and free counts.
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "active": self.active,
+            "peak_active": self.peak_active,
+            "free": len(self.free),
+        }
@@ -0,0 +1,129 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the scrolling parallax backgrounds. Each layer is an opaque, display-format strip of art that repeats horizontally; a frame draws only the part of it inside the window, as one blit or, where the strip wraps around, two.
+"""
+
+import math
+import pygame
+from movingSprites import carry
+
+
+class ParallaxLayer:
+    """
+    Description: One horizontally repeating strip of a background, scrolling at its own speed.
+
+    Attributes:
+        image (pygame.Surface): The art, converted to the display format with no per-pixel alpha.
+        repeat_width (int): The width after which the art repeats. Any art past it must be a copy of the start,
+            which lets the layer be drawn with a single blit for longer before it has to wrap.
+        speed (float): Pixels scrolled per 30 FPS frame.
+        y (int): The top edge of the layer in the window.
+        offset (int): How far into the art the left edge of the window is, from 0 up to repeat_width.
+        moved (int): Pixels scrolled by the last tick, to draw part way through it.
+        move_remainder (float): The fraction of a pixel carried over to the next tick.
+    """
+
+    def __init__(self, image, speed, repeat_width=None, y=0):
+        """
+        Description: Initialize a layer.
+
+        Parameters:
+            image (pygame.Surface): The art, opaque and in the display format, at least as wide as the window.
+            speed (float): Pixels scrolled per 30 FPS frame.
+            repeat_width (int, optional): The width after which the art repeats, the whole image when None.
+            y (int, optional): The top edge of the layer in the window.
+
+        Returns: None
+        """
+        self.image = image
+        self.repeat_width = repeat_width or image.get_width()
+        self.speed = speed
+        self.y = y
+        self.offset = 0
+        self.moved = 0
+        self.move_remainder = 0.0
+
+    def update(self, step=1.0):
+        """
+        Description: Scroll the layer.
+
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
+        Returns: None
+        """
+        self.moved, self.move_remainder = carry(self.speed * step, self.move_remainder)
+        self.offset = (self.offset + self.moved) % self.repeat_width
+
+    def spans(self, width, height, alpha=1.0):
+        """
+        Description: Work out which parts of the art cover the window.
+
+        Parameters:
+            width (int): The width of the window.
+            height (int): The height of the window.
+            alpha (float, optional): How far between the last two ticks to draw, from 0 to 1.
+
+        Returns:
+            list: One or two ((x, y), area) pairs: where to blit, and the rect of the art to blit there.
+        """
+        start = math.floor(self.offset - self.moved * (1 - alpha)) % self.repeat_width
+        height = min(height, self.image.get_height())
+        first = min(self.image.get_width() - start, width)
+        spans = [((0, self.y), pygame.Rect(start, 0, first, height))]
+        if first < width:
+            # Ran out of art; carry on from the same point of the next repeat
+            spans.append(((first, self.y), pygame.Rect((start + first) % self.repeat_width, 0, width - first, height)))
+        return spans
+
+
+class ParallaxBackground:
+    """
+    Description: A background made of layers drawn back to front, each scrolling at its own speed.
+
+    Attributes:
+        layers (list): The ParallaxLayer objects, back to front.
+        width (int): The width of the window.
+        height (int): The height of the window.
+    """
+
+    def __init__(self, layers, size):
+        """
+        Description: Initialize a background.
+
+        Parameters:
+            layers (list): The ParallaxLayer objects, back to front.
+            size (tuple): The (width, height) of the window.
+
+        Returns: None
+        """
+        self.layers = list(layers)
+        self.width = math.ceil(size[0])  # Round a fractional window width up, so the last column is covered
+        self.height = int(size[1])
+
+    def update(self, step=1.0):
+        """
+        Description: Scroll every layer.
+
+        Parameters:
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
+
+        Returns: None
+        """
+        for layer in self.layers:
+            layer.update(step)
+
+    def draw(self, renderer, alpha=1.0):
+        """
+        Description: Add the visible part of every layer to a frame.
+
+        Parameters:
+            renderer (frameRenderer.FrameRenderer): The renderer building the frame.
+            alpha (float, optional): How far between the last two ticks to draw, from 0 to 1.
+
+        Returns: None
+        """
+        for layer in self.layers:
+            for index, (position, area) in enumerate(layer.spans(self.width, self.height, alpha)):
+                renderer.blit((layer, index), layer.image, position, area)
@@ -7,7 +7,14 @@ Description: This program file contains the player sprite and its methods. This
 import pygame
 from movingSprites import Projectile
 from movingSprites import Sword
-import time
+from movingSprites import carry
+from animationClip import AnimationClip
+from assetRegistry import ASSETS
+from objectPool import ObjectPool
+from timerWheel import Cooldown
+from collisionBroadphase import Broadphase, first_impact
+import imageEffects
+from textRenderer import TEXT
 
 # Define gravity constants
 GRAVITY_DOWN = 15
@@ -16,29 +23,37 @@ WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 BAR_WIDTH = 200
 BAR_HEIGHT = 20
+COOLDOWN_FADE_LEVELS = 32  # Number of precomputed brightness levels per cooldown icon
+PROJECTILE_POOL_SIZE = 16  # Shurikens created up front for a player without a shared pool
+HIT_FLASH_MS = 150  # How long the player shows white after a hit
         
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, screen):
+    def __init__(self, screen, timers, projectile_pool=None):
         """
         Initialize the Player sprite.
 
         Parameters:
             screen (pygame.Surface): The surface representing the game window.
+            timers (timerWheel.TimerWheel): The wheel the player's cooldowns and animation timers wait in, advanced
+                once per tick by the simulation, so they all follow game time.
+            projectile_pool (objectPool.ObjectPool, optional): The pool shurikens are taken from. The player makes
+                its own when none is given.
         
         Returns: None
         """
         pygame.sprite.Sprite.__init__(self)
         
         # Load running animation images
-        self.runningAnimation = [
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer1.png"), (100, 100)),
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer2.png"), (100, 100)),
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer3.png"), (100, 100)),
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer4.png"), (100, 100)),
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer5.png"), (100, 100)),
-            pygame.transform.scale(pygame.image.load("01. Visual Assets/00. Player Sprites/mainPlayer6.png"), (100, 100))
-        ]
+        self.running_clip = AnimationClip([
+            "01. Visual Assets/00. Player Sprites/mainPlayer1.png",
+            "01. Visual Assets/00. Player Sprites/mainPlayer2.png",
+            "01. Visual Assets/00. Player Sprites/mainPlayer3.png",
+            "01. Visual Assets/00. Player Sprites/mainPlayer4.png",
+            "01. Visual Assets/00. Player Sprites/mainPlayer5.png",
+            "01. Visual Assets/00. Player Sprites/mainPlayer6.png"
+        ], (100, 100))
+        self.runningAnimation = self.running_clip.frames()
 
         # Start with the first image in the running animation
         self.imageNum = 0
@@ -50,28 +65,25 @@ class Player(pygame.sprite.Sprite):
         self.rect.top = 220
 
         self.screen = screen
-
-        # Load sounds
-        self.slashing = pygame.mixer.Sound("00. Sounds/slashing.wav")
-        self.slashing.set_volume(0.2)
-
-        self.dash_sound = pygame.mixer.Sound("00. Sounds/dash.wav")
-        self.dash_sound.set_volume(0.2)
-
-        self.shuriken_sound = pygame.mixer.Sound("00. Sounds/shurikens.mp3")
-        self.shuriken_sound.set_volume(2)
+        self.timers = timers
 
         # Gravity settings
         self.gravity_direction = GRAVITY_DOWN
         self.gravity_force = GRAVITY_DOWN
+        self.fall_remainder = 0.0  # Fraction of a pixel carried between ticks
         
         # Animation settings
-        self.animation_counter = 0
         self.animation_delay = 2  # Number of frames to wait before changing the image
+        delay = timers.frames(self.animation_delay)
+        self.animation_timer = timers.schedule(delay, self.next_frame, delay)
+        self.flash_timer = None  # Ends the current hit flash, None while the player is not flashing
 
         # Shooting settings
         self.flipped = False  # Flag to indicate whether the image is flipped
         self.projectiles = pygame.sprite.Group()  # Group to hold projectiles
+        if projectile_pool is None:
+            projectile_pool = ObjectPool(lambda: Projectile(0, 0), PROJECTILE_POOL_SIZE)
+        self.projectile_pool = projectile_pool  # Killed projectiles go back here to be thrown again
 
         self.size = 200
 
@@ -79,46 +91,43 @@ class Player(pygame.sprite.Sprite):
         self.sword = Sword(self, self.rect.left, self.rect.top, self.size)
         
         # Burst shooting variables
-        self.burst_cooldown = 2  # Cooldown duration in seconds
-        self.last_shot_time = 0  # Time of the last burst
-        self.burst_active = False  # Flag to indicate if a burst is ongoing
+        self.shoot_cooldown = Cooldown(timers, 2000)  # Time between bursts
+        self.burst_timer = None  # Fires the shots of the current burst, None between bursts
         self.shots_fired_in_burst = 0  # Counter for shots fired in the current burst
         self.shot_interval = 100  # Interval in milliseconds between shots in a burst
-        self.last_shot_in_burst_time = 0
         self.total_shurikens = 3  # Number of shurikens in a burst
 
         # Slash variables
-        self.last_slash_time = 0
-        self.slash_cooldown = 2
+        self.slash_cooldown = Cooldown(timers, 2000)
         self.slash_active = False
         
         # Dash variables
-        self.dash_cooldown = 10
-        self.last_dash_time = 0  # Time of the last dash
+        self.dash_cooldown = Cooldown(timers, 10000)
         self.dash_distance = 100
+        self.dash_pending = 0  # Distance of a dash still to be moved by the next update
 
         # Cooldown images for shooting, dashing, and slashing
-        self.cooldown_image = pygame.transform.scale(pygame.image.load("01. Visual Assets/01. Projectile Sprites/shuriken1.png").convert_alpha(), (50, 50))
+        self.cooldown_image = ASSETS.image("01. Visual Assets/01. Projectile Sprites/shuriken1.png", (50, 50))
         self.cooldown_image_rect = self.cooldown_image.get_rect()
         self.cooldown_image_rect.bottomright = (screen.get_width() - 100, screen.get_height() - 10)
+        self.cooldown_fades = imageEffects.BrightnessLevels(self.cooldown_image, COOLDOWN_FADE_LEVELS)
         self.brightened_cooldown_image = self.cooldown_image  # Initialize the brightened image
         
-        self.dash_cooldown_image = pygame.transform.scale(pygame.image.load("01. Visual Assets/05. Other Sprites/burst.png").convert_alpha(), (50, 50))
+        self.dash_cooldown_image = ASSETS.image("01. Visual Assets/05. Other Sprites/burst.png", (50, 50))
         self.dash_cooldown_image_rect = self.dash_cooldown_image.get_rect()
         self.dash_cooldown_image_rect.bottomright = (screen.get_width() - 30, screen.get_height() - 10)
+        self.dash_cooldown_fades = imageEffects.BrightnessLevels(self.dash_cooldown_image, COOLDOWN_FADE_LEVELS)
         self.brightened_dash_cooldown_image = self.dash_cooldown_image  # Initialize the brightened image
         
-        self.slash_cooldown_image = pygame.transform.scale(pygame.image.load("01. Visual Assets/02. Sword Sprites/sword1.gif").convert_alpha(), (75, 75))
+        self.slash_cooldown_image = ASSETS.image("01. Visual Assets/02. Sword Sprites/sword1.gif", (75, 75))
         self.slash_cooldown_image_rect = self.slash_cooldown_image.get_rect()
         self.slash_cooldown_image_rect.bottomright = (screen.get_width() - 140, screen.get_height() - 4)
+        self.slash_cooldown_fades = imageEffects.BrightnessLevels(self.slash_cooldown_image, COOLDOWN_FADE_LEVELS)
         self.brightened_slash_cooldown_image = self.slash_cooldown_image  # Initialize the brightened image
         
         # Health settings
         self.health = 100 
 
-        # Font for health display
-        self.font = pygame.font.Font("Migae.otf", 25)
-
     def adjust_brightness(self, image, factor):
         """
         Adjust the brightness of an image.
@@ -130,16 +139,7 @@ class Player(pygame.sprite.Sprite):
         Returns:
             pygame.Surface: The adjusted image surface.
         """
-        width, height = image.get_size()
-        new_image = pygame.Surface((width, height)).convert_alpha()
-        for x in range(width):
-            for y in range(height):
-                r, g, b, a = image.get_at((x, y))
-                r = min(255, max(0, int(r * factor)))
-                g = min(255, max(0, int(g * factor)))
-                b = min(255, max(0, int(b * factor)))
-                new_image.set_at((x, y), (r, g, b, a))
-        return new_image
+        return imageEffects.brightness(image, factor)
 
     def switch_gravity(self):
         """
@@ -149,153 +149,185 @@ class Player(pygame.sprite.Sprite):
         """
         self.gravity_direction *= -1
         self.gravity_force *= -1
+        self.fall_remainder = 0.0
         self.flipped = not self.flipped
-        self.runningAnimation = [pygame.transform.flip(image, False, True) for image in self.runningAnimation]
+        self.runningAnimation = self.running_clip.frames(self.flipped)
         self.sword.switch_gravity()
 
     def shoot(self):
         """
         Description: Initiate shooting projectiles.
         Parameters: None
-        Returns: None
+        Returns:
+            bool: True if a burst was started, False while the burst is cooling down.
         """
-        now = time.time()
-        if now - self.last_shot_time > self.burst_cooldown:
-            self.burst_active = True
-            self.shuriken_sound.play()
+        if self.shoot_cooldown.trigger():
+            if self.burst_timer is not None:
+                self.burst_timer.cancel()  # A burst longer than the cooldown starts over
             self.shots_fired_in_burst = 0
-            self.last_shot_time = now  # Update last shot time
-            self.last_shot_in_burst_time = pygame.time.get_ticks()  
+            self.burst_timer = self.timers.every(self.shot_interval, self.fire_burst_shot)
+            return True
+        return False
+
+    def fire_burst_shot(self):
+        """
+        Description: Throw the next shuriken of a burst. Called by the burst timer.
+        Parameters: None
+        Returns: None
+        """
+        projectile = self.projectile_pool.acquire(self.rect.right, self.rect.centery)
+        self.projectiles.add(projectile)
+        self.shots_fired_in_burst += 1
+        if self.shots_fired_in_burst >= self.total_shurikens:
+            self.burst_timer.cancel()
+            self.burst_timer = None
 
     def dash(self):
         """
         Description: Initiate dashing.
         Parameters: None
-        Returns: None
+        Returns:
+            bool: True if the player dashed, False while the dash is cooling down.
         """
-        now = time.time()
-        if now - self.last_dash_time > self.dash_cooldown:
-            self.rect.x += self.dash_distance
-            self.last_dash_time = now 
-            self.dash_sound.play()
+        if self.dash_cooldown.trigger():
+            self.dash_pending = self.dash_distance  # Swept on the next update, so the dash cannot skip over a car
+            return True
+        return False
 
     def slash(self):
         """
         Description: Initiate slashing with sword.
         Parameters: None
-        Returns: None
+        Returns:
+            bool: True if a slash was started, False while the slash is cooling down.
         """
-        now = time.time()
-        if now - self.last_slash_time > self.slash_cooldown:
+        if self.slash_cooldown.trigger():
             self.slash_active = True
-            self.last_slash_time = now
-            self.slashing.play()
+            return True
+        return False
+
+    def next_frame(self):
+        """
+        Description: Show the next frame of the running animation. Called by the animation timer.
+        Parameters: None
+        Returns: None
+        """
+        self.imageNum = (self.imageNum + 1) % len(self.runningAnimation)
+        self.show_frame()
+
+    def show_frame(self):
+        """
+        Description: Show the current frame of the running animation, flashed white while a hit flash lasts.
+        Parameters: None
+        Returns: None
+        """
+        if self.flash_timer is not None:
+            self.image = self.running_clip.flashed(self.flipped)[self.imageNum]
+        else:
+            self.image = self.runningAnimation[self.imageNum]
+
+    def flash(self):
+        """
+        Description: Flash the player white for a moment, as feedback for a hit. A new hit restarts the flash.
+        Parameters: None
+        Returns: None
+        """
+        if self.flash_timer is not None:
+            self.flash_timer.cancel()
+        self.flash_timer = self.timers.after(HIT_FLASH_MS, self.end_flash)
+        self.show_frame()
+
+    def end_flash(self):
+        """
+        Description: Go back to the normal frames once a hit flash is over. Called by the flash timer.
+        Parameters: None
+        Returns: None
+        """
+        self.flash_timer = None
+        self.show_frame()
 
-    def update(self, collidable, on_ground, on_ceil):
+    def nearby(self, collidable, area):
+        """
+        Description: Find the collidable sprites that reach into an area.
+
+        Parameters:
+            collidable (collisionBroadphase.Broadphase or pygame.sprite.Group): Collidable sprites, as a broadphase
+                snapshot or a plain group.
+            area (pygame.Rect): The area.
+
+        Returns:
+            list: The sprites whose rects collide with the area.
+        """
+        if isinstance(collidable, Broadphase):
+            return collidable.within(area)
+        return [sprite for sprite in collidable if area.colliderect(sprite.rect)]
+
+    def sweep_move(self, collidable, dx, dy):
+        """
+        Description: Move the player, stopping against the first obstacle in the way instead of passing through it.
+
+        Parameters:
+            collidable (collisionBroadphase.Broadphase or pygame.sprite.Group): Collidable sprites, as a broadphase
+                snapshot or a plain group.
+            dx (int): Pixels to move right.
+            dy (int): Pixels to move down.
+
+        Returns:
+            bool: True if an obstacle cut the move short.
+        """
+        path = self.rect.union(self.rect.move(dx, dy))
+        impact = first_impact(self.rect, dx, dy, self.nearby(collidable, path))
+        if impact is None:
+            self.rect.move_ip(dx, dy)
+            return False
+        time = impact[0]
+        self.rect.move_ip(round(dx * time), round(dy * time))
+        return True
+
+    def update(self, collidable, step=1.0):
         """
         Description: Update the player position, animation, projectiles, and cooldowns.
 
+        The player's own moves, falling and dashing, are swept, so however far they go in one tick they stop against
+        the first obstacle in the way and at the edge of the screen.
+
         Parameters:
-            collidable (pygame.sprite.Group): Group of collidable sprites.
-            on_ground (bool): Flag indicating if the player is on the ground.
-            on_ceil (bool): Flag indicating if the player is on the ceiling.
+            collidable (collisionBroadphase.Broadphase or pygame.sprite.Group): Collidable sprites, as a broadphase
+                snapshot or a plain group.
+            step (float, optional): The length of this tick as a fraction of a 30 FPS frame.
             
         Returns: None
         """
-        # Apply gravity
+        # Cars only drive left, so one overlapping the player has run into it from the right and shoves it along
+        for obj in self.nearby(collidable, self.rect):
+            if self.rect.colliderect(obj.rect):
+                self.rect.right = obj.rect.left
+
+        if self.dash_pending:
+            self.sweep_move(collidable, self.dash_pending, 0)
+            self.dash_pending = 0
+
+        # Apply gravity, falling no further than the edge of the screen
         if self.gravity_direction == GRAVITY_DOWN:
-            if self.rect.bottom < self.screen.get_height():
-                self.rect.top += self.gravity_force
+            room = self.screen.get_height() - self.rect.bottom
         else:
-            if self.rect.top > 0:
-                self.rect.top += self.gravity_force
-
-        # Update animation frame
-        self.animation_counter += 1
-        if self.animation_counter >= self.animation_delay:
-            self.imageNum = (self.imageNum + 1) % len(self.runningAnimation)
-            self.image = self.runningAnimation[self.imageNum]
-            self.animation_counter = 0  # Reset the counter
-            
-        collision_list = pygame.sprite.spritecollide(self, collidable, False)
-
-        for obj in collision_list:
-            # Calculate the overlap in each direction
-            overlap_right = self.rect.right - obj.rect.left
-            overlap_left = obj.rect.right - self.rect.left
-            overlap_down = self.rect.bottom - obj.rect.top
-            overlap_up = obj.rect.bottom - self.rect.top
-            
-            if on_ground == False and on_ceil == False: 
-
-                # Determine the smallest overlap
-                min_overlap = min(overlap_right, overlap_left, overlap_down, overlap_up)
-
-                if min_overlap == overlap_right:
-                    # Collision from the right
-                    self.rect.right = obj.rect.left
-                    
-                elif min_overlap == overlap_left:
-                    # Collision from the left
-                    self.rect.left = obj.rect.right
-                    
-                elif min_overlap == overlap_down:
-                    # Collision from above
-                    if self.gravity_direction == GRAVITY_DOWN:
-                        self.rect.bottom = obj.rect.top
-
-                elif min_overlap == overlap_up:
-                    # Collision from below
-                    if self.gravity_direction == GRAVITY_UP:
-                        self.rect.top = obj.rect.bottom
-
-                # Check for collisions and correct position
-                if overlap_right == min_overlap and self.rect.right > obj.rect.left:
-                    self.rect.right = obj.rect.left
-                if overlap_left == min_overlap and self.rect.left < obj.rect.right:
-                    self.rect.left = obj.rect.right
-                if overlap_down == min_overlap and self.rect.bottom > obj.rect.top:
-                    self.rect.bottom = obj.rect.top
-                if overlap_up == min_overlap and self.rect.top < obj.rect.bottom:
-                    self.rect.top = obj.rect.bottom
-                    
-            else: 
-                if self.rect.right >= obj.rect.left: 
-                    self.rect.right = obj.rect.left
-
-        # Handle burst shooting
-        if self.burst_active:
-            now = pygame.time.get_ticks()
-            if now - self.last_shot_in_burst_time > self.shot_interval and self.shots_fired_in_burst < self.total_shurikens:
-                projectile = Projectile(self.rect.right, self.rect.centery)
-                self.projectiles.add(projectile)
-                self.shots_fired_in_burst += 1
-                self.last_shot_in_burst_time = now  # Update time of last shot within burst
-            if self.shots_fired_in_burst >= self.total_shurikens:
-                self.burst_active = False
+            room = self.rect.top
+        if room > 0:
+            distance, self.fall_remainder = carry(self.gravity_force * step, self.fall_remainder)
+            self.sweep_move(collidable, 0, max(-room, min(distance, room)))
 
         if self.slash_active:
-            now = pygame.time.get_ticks()
-
             self.sword.swing()  # Trigger sword swing animation
             self.slash_active = False  # Reset slash flag after animation
 
         # Update projectiles and cooldown images
-        self.sword.update(self.rect.left, self.rect.top)  # Update sword position
-        self.projectiles.update()  # Update all projectiles
-
-        # Update cooldown bar length based on time passed since last shot and dash
-        time_elapsed_shoot = time.time() - self.last_shot_time
-        time_elapsed_dash = time.time() - self.last_dash_time
-        time_elapsed_slash = time.time() - self.last_slash_time
-
-        # Adjust brightness of cooldown images based on cooldown progress
-        cooldown_factor_shoot = min(1, time_elapsed_shoot / self.burst_cooldown)
-        cooldown_factor_dash = min(1, time_elapsed_dash / self.dash_cooldown)
-        cooldown_factor_slash = min(1, time_elapsed_slash / self.slash_cooldown)
-        self.brightened_cooldown_image = self.adjust_brightness(self.cooldown_image, cooldown_factor_shoot)
-        self.brightened_dash_cooldown_image = self.adjust_brightness(self.dash_cooldown_image, cooldown_factor_dash)
-        self.brightened_slash_cooldown_image = self.adjust_brightness(self.slash_cooldown_image, cooldown_factor_slash)
+        self.sword.update(self.rect.left, self.rect.top, step)  # Update sword position
+        self.projectiles.update(step)  # Update all projectiles
+
+        # Look up the precomputed brightness level of each cooldown image based on cooldown progress
+        self.brightened_cooldown_image = self.cooldown_fades.get(self.shoot_cooldown.progress())
+        self.brightened_dash_cooldown_image = self.dash_cooldown_fades.get(self.dash_cooldown.progress())
+        self.brightened_slash_cooldown_image = self.slash_cooldown_fades.get(self.slash_cooldown.progress())
         
     def draw_health_bar(self, surface, x, y, health, color):
         """
@@ -322,5 +354,19 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(surface, WHITE, border_rect, 2)
         
         # Render Text
-        health_text = self.font.render(f"{int(health)}%", True, WHITE)
+        health_text = TEXT.render(f"{int(health)}%", WHITE)
         surface.blit(health_text, (x + BAR_WIDTH + 10, y))
+
+    def health_bar_rect(self, x, y):
+        """
+        Description: Get the area covered by the health bar and its percentage text.
+
+        Parameters:
+            x (int): The x-coordinate of the top-left corner of the health bar.
+            y (int): The y-coordinate of the top-left corner of the health bar.
+
+        Returns:
+            pygame.Rect: The area the health bar draws inside.
+        """
+        text_width, text_height = TEXT.size("100%")
+        return pygame.Rect(x, y, BAR_WIDTH + 10 + text_width, max(BAR_HEIGHT, text_height))
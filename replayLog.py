@@ -0,0 +1,326 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains run replays. A replay is the seed of a run plus the keys pressed on each tick, stored as a small binary file, which is all the deterministic simulation needs to play the run again exactly, in the game window at real speed or headless as fast as the CPU allows.
+
+Usage:
+    python replayLog.py run.replay             Play a replay headless as fast as possible and check it matches
+    python replayLog.py run.replay --realtime  Watch a replay in the game window at real speed
+    python main.py --record run.replay         Play the game and record each run to run-1.replay, run-2.replay, ...
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import gameSimulation
+
+MAGIC = b"MRRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBqHII")  # Magic, version, seed, tick rate, ticks, final state checksum
+SEED_RANGE = (-2 ** 63, 2 ** 63)  # Seeds a replay can store, any signed 64-bit integer
+
+
+def action_mask(actions):
+    """
+    Description: Pack a tick's actions into a bitmask, one bit per key.
+
+    Parameters:
+        actions (iterable): The actions pressed on the tick.
+
+    Returns:
+        int: The bitmask, bit i set when gameSimulation.ACTIONS[i] was pressed.
+    """
+    mask = 0
+    for bit, action in enumerate(gameSimulation.ACTIONS):
+        if action in actions:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_actions(mask):
+    """
+    Description: Unpack a bitmask back into actions.
+
+    Parameters:
+        mask (int): The bitmask.
+
+    Returns:
+        tuple: The actions pressed, in gameSimulation.ACTIONS order.
+    """
+    return tuple(action for bit, action in enumerate(gameSimulation.ACTIONS) if mask & (1 << bit))
+
+
+def run_path(path, run):
+    """
+    Description: Get the file one run of a recording session is saved to, numbered so runs do not overwrite
+        each other.
+
+    Parameters:
+        path (str): The file given for the session, such as "run.replay".
+        run (int): The run's number in the session, from 1.
+
+    Returns:
+        str: The path with the run number before its extension, such as "run-1.replay".
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}-{run}{extension}"
+
+
+def seed_value(text):
+    """
+    Description: Parse a seed given on the command line, rejecting one a replay could not store.
+
+    Parameters:
+        text (str): The seed as typed.
+
+    Returns:
+        int: The seed.
+    """
+    seed = int(text)
+    if not SEED_RANGE[0] <= seed < SEED_RANGE[1]:
+        raise argparse.ArgumentTypeError(f"seed must be a signed 64-bit integer, got {text}")
+    return seed
+
+
+def write_varint(buffer, value):
+    """
+    Description: Append an unsigned integer in as few bytes as it needs, 7 bits per byte.
+
+    Parameters:
+        buffer (bytearray): The buffer to append to.
+        value (int): The integer.
+
+    Returns: None
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Description: Read an unsigned integer written by write_varint.
+
+    Parameters:
+        data (bytes): The data.
+        offset (int): Where the integer starts.
+
+    Returns:
+        tuple: (the integer, the offset just past it)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class Replay:
+    """
+    Description: The seed and inputs of one run.
+
+    Only ticks with a key pressed are stored, each as the number of ticks since the previous one followed by a
+    bitmask of the keys, so a typical run takes a couple of bytes per key press.
+
+    Attributes:
+        seed (int): The seed of the run.
+        tick_rate (int): Simulation ticks per second.
+        inputs (dict): The action bitmask of each tick with a key pressed.
+        ticks (int): The length of the run in ticks.
+        checksum (int): The simulation's checksum at the end of the run, 0 until finished.
+    """
+
+    def __init__(self, seed, tick_rate=gameSimulation.TICK_RATE, inputs=None, ticks=0, checksum=0):
+        """
+        Description: Initialize a replay.
+
+        Parameters:
+            seed (int): The seed of the run.
+            tick_rate (int, optional): Simulation ticks per second.
+            inputs (dict, optional): The action bitmask of each tick with a key pressed.
+            ticks (int, optional): The length of the run in ticks.
+            checksum (int, optional): The simulation's checksum at the end of the run.
+
+        Returns: None
+        """
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.inputs = inputs if inputs is not None else {}
+        self.ticks = ticks
+        self.checksum = checksum
+
+    def record(self, tick, actions):
+        """
+        Description: Record the actions pressed on a tick.
+
+        Parameters:
+            tick (int): The tick.
+            actions (iterable): The actions pressed.
+
+        Returns: None
+        """
+        if not actions:
+            return  # Most ticks, and nothing to store
+        mask = action_mask(actions)
+        if mask:
+            self.inputs[tick] = mask
+
+    def finish(self, simulation):
+        """
+        Description: Mark the end of the run, storing its length and final checksum.
+
+        Parameters:
+            simulation (gameSimulation.GameSimulation): The simulation that ran it.
+
+        Returns: None
+        """
+        self.ticks = simulation.tick
+        self.checksum = simulation.checksum()
+
+    def actions(self, tick):
+        """
+        Description: Get the actions pressed on a tick.
+
+        Parameters:
+            tick (int): The tick.
+
+        Returns:
+            tuple: The actions pressed.
+        """
+        return mask_actions(self.inputs.get(tick, 0))
+
+    def input_source(self):
+        """
+        Description: Get an input source that plays the recorded keys back into a simulation.
+        Parameters: None
+        Returns:
+            gameSimulation.ScriptedInput: The input source.
+        """
+        return gameSimulation.ScriptedInput({tick: mask_actions(mask) for tick, mask in self.inputs.items()})
+
+    def to_bytes(self):
+        """
+        Description: Encode the replay.
+        Parameters: None
+        Returns:
+            bytes: The header followed by the delta-encoded inputs.
+        """
+        data = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate, self.ticks, self.checksum))
+        previous = 0
+        for tick in sorted(self.inputs):
+            write_varint(data, tick - previous)
+            data.append(self.inputs[tick])
+            previous = tick
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Description: Decode a replay.
+
+        Parameters:
+            data (bytes): The encoded replay.
+
+        Returns:
+            Replay: The replay.
+
+        Raises:
+            ValueError: If the data is not a replay of this version.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Not a replay file")
+        magic, version, seed, tick_rate, ticks, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Replay version {version} is not supported")
+        inputs = {}
+        offset = HEADER.size
+        tick = 0
+        while offset < len(data):
+            delta, offset = read_varint(data, offset)
+            tick += delta
+            inputs[tick] = data[offset]
+            offset += 1
+        return cls(seed, tick_rate, inputs, ticks, checksum)
+
+    def save(self, path):
+        """
+        Description: Write the replay to a file.
+
+        Parameters:
+            path (str): The file path.
+
+        Returns: None
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Description: Read a replay from a file.
+
+        Parameters:
+            path (str): The file path.
+
+        Returns:
+            Replay: The replay.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def play(replay):
+    """
+    Description: Play a replay headless, as fast as the CPU allows.
+
+    Parameters:
+        replay (Replay): The replay.
+
+    Returns:
+        gameSimulation.GameSimulation: The simulation at the end of the replay. Its checksum() equals
+            replay.checksum when the run was reproduced exactly.
+    """
+    simulation = gameSimulation.GameSimulation(replay.seed, replay.tick_rate)
+    simulation.run(replay.input_source(), replay.ticks)
+    return simulation
+
+
+def main():
+    """
+    Description: Play a replay from the command line.
+    Parameters: None
+    Returns:
+        int: The exit code, 1 when the replay did not reproduce its run.
+    """
+    parser = argparse.ArgumentParser(description="Play back a recorded METRO RUNNERS run.")
+    parser.add_argument("path", help="the replay file")
+    parser.add_argument("--realtime", action="store_true", help="watch the replay in the game window")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    if args.realtime:
+        import main as game  # Imported here so the headless playback never opens a window
+        game.MetroRunnersGame(replay=replay).alter()
+        return 0
+
+    start = time.perf_counter()
+    simulation = play(replay)
+    seconds = time.perf_counter() - start
+    matched = simulation.checksum() == replay.checksum
+    print(f"{simulation.tick} ticks in {seconds:.2f} s ({simulation.tick / seconds:.0f} ticks/s), "
+          f"result {simulation.result}, score {simulation.score}, "
+          f"{'matches the recording' if matched else 'DOES NOT match the recording'}")
+    return 0 if matched else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the sound event bus. The simulation only raises named sound events; the bus merges repeats of an event within a frame and plays each on a fixed budget of mixer channels, giving the most important sounds a voice first.
+"""
+
+import pygame
+
+CHANNEL_BUDGET = 8  # Mixer channels the sound effects may use; the music streams outside of them
+
+# Sound priorities, from least to most important. A sound may take over the voice of a less important one.
+LOW = 0
+NORMAL = 1
+HIGH = 2
+CRITICAL = 3
+
+
+class SoundCue:
+    """
+    Description: A sound effect and how important it is.
+
+    Attributes:
+        sound (pygame.mixer.Sound): The fully decoded sound.
+        priority (int): LOW, NORMAL, HIGH or CRITICAL.
+    """
+
+    def __init__(self, sound, priority=NORMAL):
+        """
+        Description: Initialize a cue.
+
+        Parameters:
+            sound (pygame.mixer.Sound): The fully decoded sound.
+            priority (int, optional): LOW, NORMAL, HIGH or CRITICAL.
+
+        Returns: None
+        """
+        self.sound = sound
+        self.priority = priority
+
+
+class SoundBus:
+    """
+    Description: Plays the sound events of each frame on a fixed budget of mixer channels.
+
+    Events are posted as they happen and played once per frame by flush(). An event posted several times in one
+    frame, such as three cars destroyed by one slash, is played once. Events are played most important first;
+    when every channel is busy a sound replaces the least important one playing, or is dropped if nothing playing
+    is less important. Without a mixer the bus stays silent, so the game runs with no audio device.
+
+    Attributes:
+        cues (dict): The SoundCue of each event name.
+        channels (list): The pygame.mixer.Channel objects the bus plays on, empty without a mixer.
+        voices (list): The priority of the sound last started on each channel.
+        pending (dict): How many times each event was posted this frame, in the order first posted.
+        posted (int): Events posted so far.
+        merged (int): Posts merged into an event already pending in the same frame.
+        played (int): Sounds started.
+        stolen (int): Sounds cut off to make room for a more important one.
+        dropped (int): Sounds not played because every channel held something as important.
+    """
+
+    def __init__(self, channels=CHANNEL_BUDGET):
+        """
+        Description: Initialize a bus and claim its mixer channels.
+
+        Parameters:
+            channels (int, optional): The number of channels sound effects may use.
+
+        Returns: None
+        """
+        self.cues = {}
+        self.channels = []
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(channels)
+            self.channels = [pygame.mixer.Channel(index) for index in range(channels)]
+        self.voices = [LOW] * len(self.channels)
+        self.pending = {}
+        self.posted = 0
+        self.merged = 0
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def register(self, event, sound, priority=NORMAL):
+        """
+        Description: Set the sound played for an event.
+
+        Parameters:
+            event (str): The event name.
+            sound (pygame.mixer.Sound): The sound.
+            priority (int, optional): LOW, NORMAL, HIGH or CRITICAL.
+
+        Returns: None
+        """
+        self.cues[event] = SoundCue(sound, priority)
+
+    def post(self, event):
+        """
+        Description: Queue an event's sound for the end of the frame.
+
+        Parameters:
+            event (str): The event name.
+
+        Returns: None
+        """
+        self.posted += 1
+        if event in self.pending:
+            self.merged += 1
+            self.pending[event] += 1
+        else:
+            self.pending[event] = 1
+
+    def flush(self):
+        """
+        Description: Play the sounds of the events posted this frame, most important first.
+        Parameters: None
+        Returns: None
+        """
+        if not self.pending:
+            return
+        if self.channels:
+            cues = [self.cues[event] for event in self.pending]
+            cues.sort(key=lambda cue: -cue.priority)  # Stable, so equal priorities keep the order they happened
+            for cue in cues:
+                self.play(cue)
+        self.pending.clear()
+
+    def play(self, cue):
+        """
+        Description: Start a cue on a free channel, or on the channel of the least important sound playing.
+
+        Parameters:
+            cue (SoundCue): The cue to play.
+
+        Returns:
+            bool: True if the sound was started.
+        """
+        index = None
+        for channel_index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = channel_index
+                break
+        if index is None:
+            index = min(range(len(self.voices)), key=self.voices.__getitem__)
+            if self.voices[index] >= cue.priority:
+                self.dropped += 1
+                return False
+            self.stolen += 1
+
+        self.channels[index].play(cue.sound)
+        self.voices[index] = cue.priority
+        self.played += 1
+        return True
+
+    def play_music(self, path, volume):
+        """
+        Description: Stream a music file on repeat. It is decoded as it plays and does not use the bus's channels.
+
+        The game runs without music when the file or audio device is missing.
+
+        Parameters:
+            path (str): The file path to the music.
+            volume (float): The music volume.
+
+        Returns: None
+        """
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)
+        except pygame.error:
+            pass
+
+    def stats(self):
+        """
+        Description: Report how the bus used its channels.
+        Parameters: None
+        Returns:
+            dict: Posted, merged, played, stolen and dropped counts and the number of channels.
+        """
+        return {
+            "posted": self.posted,
+            "merged": self.merged,
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "channels": len(self.channels),
+        }
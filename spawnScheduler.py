@@ -0,0 +1,171 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the spawn scheduler. Obstacles and gems come from a wave description, plain data listing what to spawn, when, and in which pattern, and timed waves wait in a heap ordered by their next spawn time, so a tick only looks at the waves that are due.
+"""
+
+import heapq
+
+SCREEN_WIDTH = 923.72
+SCREEN_HEIGHT = 480
+
+# Kinds of spawned sprite
+OBSTACLE = "obstacle"
+GEM = "gem"
+KINDS = (OBSTACLE, GEM)
+
+# Wave patterns
+SINGLE = "single"  # Each sprite at its own random position
+LANE = "lane"  # A row at one height, spaced out horizontally
+TRAIL = "trail"  # A rising or falling diagonal line
+PATTERNS = (SINGLE, LANE, TRAIL)
+
+# Where waves enter: this far past the right edge of the screen, somewhere in the lower half
+SPAWN_OFFSET = (100, 500)
+SPAWN_TOP = SCREEN_HEIGHT // 2
+SPAWN_BOTTOM = SCREEN_HEIGHT - 50
+
+
+class Wave:
+    """
+    Description: One entry of a wave description.
+
+    A wave either keeps a number of sprites alive, checked every tick, or spawns at set times. A description is
+    a list of dicts with these keys, all optional except kind:
+        kind: OBSTACLE or GEM.
+        pattern: SINGLE, LANE or TRAIL. SINGLE by default.
+        count: Sprites per wave, 1 by default.
+        spacing: Horizontal pixels between the sprites of a LANE or TRAIL, 150 by default.
+        rise: Vertical pixels between the sprites of a TRAIL, 30 by default.
+        keep: Spawn the wave whenever fewer than this many sprites of its kind are alive. Replaces at and every.
+        at: Game time of the first wave in milliseconds, 0 by default.
+        every: Milliseconds between waves. The wave only spawns once when left out.
+        loop: Whether obstacles loop back to the right edge instead of leaving the screen, False by default.
+        before_boss: Whether the wave stops once the boss fight starts, False by default.
+
+    Attributes:
+        kind (str): OBSTACLE or GEM.
+        pattern (str): SINGLE, LANE or TRAIL.
+        count (int): Sprites per wave.
+        spacing (int): Horizontal pixels between sprites.
+        rise (int): Vertical pixels between the sprites of a trail.
+        keep (int): The number of sprites to keep alive, or 0 for a timed wave.
+        at (float): Game time of the first wave in milliseconds.
+        every (float): Milliseconds between waves, or None to spawn once.
+        loop (bool): Whether obstacles loop instead of leaving the screen.
+        before_boss (bool): Whether the wave stops once the boss fight starts.
+    """
+
+    def __init__(self, description):
+        """
+        Description: Initialize a wave from its description.
+
+        Parameters:
+            description (dict): The wave's entry in the wave description.
+
+        Returns: None
+
+        Raises:
+            ValueError: If the kind or pattern is unknown.
+        """
+        self.kind = description["kind"]
+        self.pattern = description.get("pattern", SINGLE)
+        if self.kind not in KINDS:
+            raise ValueError(f"Unknown spawn kind {self.kind!r}")
+        if self.pattern not in PATTERNS:
+            raise ValueError(f"Unknown wave pattern {self.pattern!r}")
+        self.count = description.get("count", 1)
+        self.spacing = description.get("spacing", 150)
+        self.rise = description.get("rise", 30)
+        self.keep = description.get("keep", 0)
+        self.at = description.get("at", 0)
+        self.every = description.get("every")
+        self.loop = description.get("loop", False)
+        self.before_boss = description.get("before_boss", False)
+
+    def positions(self, rng):
+        """
+        Description: Lay out one wave just past the right edge of the screen.
+
+        Parameters:
+            rng (random.Random): The random number generator of the run.
+
+        Returns:
+            list: A (kind, x, y, loop) spawn for each sprite of the wave.
+        """
+        spawns = []
+        x = SCREEN_WIDTH + rng.randint(*SPAWN_OFFSET)
+        y = rng.randint(SPAWN_TOP, SPAWN_BOTTOM)
+        if self.pattern == SINGLE:
+            spawns.append((self.kind, x, y, self.loop))
+            for _ in range(self.count - 1):
+                spawns.append((self.kind, SCREEN_WIDTH + rng.randint(*SPAWN_OFFSET),
+                               rng.randint(SPAWN_TOP, SPAWN_BOTTOM), self.loop))
+        else:
+            rise = self.rise * rng.choice((-1, 1)) if self.pattern == TRAIL else 0
+            for index in range(self.count):
+                spawns.append((self.kind, x + index * self.spacing,
+                               min(max(y + index * rise, 0), SPAWN_BOTTOM), self.loop))
+        return spawns
+
+
+class SpawnScheduler:
+    """
+    Description: Decides what spawns on each tick from a wave description.
+
+    Timed waves sit in a heap keyed by their next spawn time, and a repeating wave goes back in once it has
+    spawned, so the heap holds one entry per wave however long the schedule runs. A tick only checks the top of
+    the heap and the few keep waves, and spawning a wave of hundreds of sprites costs nothing until it is due.
+
+    Attributes:
+        waves (list): Every Wave in the description, in order.
+        keepers (list): The waves that keep sprites alive.
+        heap (list): (time, order, wave) of each timed wave still to spawn.
+        waves_spawned (int): Waves spawned so far.
+    """
+
+    def __init__(self, description, start_ms=0):
+        """
+        Description: Initialize a scheduler for a run.
+
+        Parameters:
+            description (list): The wave description, a dict per wave.
+            start_ms (float, optional): The game time the schedule starts at; wave times are relative to it.
+
+        Returns: None
+        """
+        self.waves = [Wave(entry) for entry in description]
+        self.keepers = [wave for wave in self.waves if wave.keep]
+        self.heap = [(start_ms + wave.at, order, wave) for order, wave in enumerate(self.waves) if not wave.keep]
+        heapq.heapify(self.heap)
+        self.waves_spawned = 0
+
+    def due(self, time_ms, rng, population, boss_spawned):
+        """
+        Description: Get everything to spawn on this tick.
+
+        Parameters:
+            time_ms (float): The current game time in milliseconds.
+            rng (random.Random): The random number generator of the run.
+            population (dict): The number of sprites of each kind alive.
+            boss_spawned (bool): Whether the boss fight has started.
+
+        Returns:
+            list: A (kind, x, y, loop) spawn for each sprite, keep waves first, then timed waves in time order.
+        """
+        spawns = []
+        for wave in self.keepers:
+            if population[wave.kind] < wave.keep and not (wave.before_boss and boss_spawned):
+                spawns.extend(wave.positions(rng))
+                self.waves_spawned += 1
+
+        heap = self.heap
+        while heap and heap[0][0] <= time_ms:
+            at, order, wave = heapq.heappop(heap)
+            if wave.before_boss and boss_spawned:
+                continue  # The wave is over for this run
+            spawns.extend(wave.positions(rng))
+            self.waves_spawned += 1
+            if wave.every:
+                heapq.heappush(heap, (at + wave.every, order, wave))
+        return spawns
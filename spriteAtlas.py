@@ -0,0 +1,99 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the sprite atlas. Sprite frames are packed as they load onto a few large pages in the display's alpha format, and each frame is handed out as a subsurface of its page, so every frame the game draws shares a handful of surfaces. A renderer can look a frame up to blit the page itself with the frame's rect as the area.
+"""
+
+import pygame
+
+PAGE_SIZE = (1024, 1024)  # Fits every frame the game draws at its default sizes on one or two pages
+
+
+class SpriteAtlas:
+    """
+    Description: Pages of packed sprite frames, filled in shelves.
+
+    Frames are placed left to right along a shelf as tall as the tallest frame on it. A frame that does not fit
+    on the shelf starts a new one below, and one that does not fit on the page starts a new page. Frames are
+    copied onto the page exactly, alpha included, and never move once placed.
+
+    Attributes:
+        page_size (tuple): The (width, height) of every page.
+        pages (list): The page surfaces, in the order they were started.
+        regions (dict): Maps each frame handed out to its (page, rect on the page).
+        x (int): Where the next frame goes along the current shelf.
+        y (int): The top edge of the current shelf.
+        shelf_height (int): The height of the tallest frame on the current shelf.
+        frames (int): The number of frames packed so far.
+    """
+
+    def __init__(self, page_size=PAGE_SIZE):
+        """
+        Description: Initialize an atlas with no pages.
+
+        Parameters:
+            page_size (tuple, optional): The (width, height) of every page.
+
+        Returns: None
+        """
+        self.page_size = page_size
+        self.clear()
+
+    def clear(self):
+        """
+        Description: Drop every page. Frames already handed out keep their pixels but are no longer regions.
+        Parameters: None
+        Returns: None
+        """
+        self.pages = []
+        self.regions = {}
+        self.x = 0
+        self.y = 0
+        self.shelf_height = 0
+        self.frames = 0
+
+    def add(self, image):
+        """
+        Description: Pack a frame into the atlas.
+
+        Parameters:
+            image (pygame.Surface): The frame, converted with convert_alpha().
+
+        Returns:
+            pygame.Surface: A subsurface of the page the frame was copied onto, or None when the frame is larger
+                than a page or not in the pages' pixel format, and should be drawn on its own.
+        """
+        width, height = image.get_size()
+        if width > self.page_size[0] or height > self.page_size[1] or not width or not height:
+            return None
+        if self.pages and image.get_masks() != self.pages[-1].get_masks():
+            return None
+
+        if self.x + width > self.page_size[0]:
+            self.x, self.y, self.shelf_height = 0, self.y + self.shelf_height, 0  # Start a new shelf
+        if not self.pages or self.y + height > self.page_size[1]:
+            page = pygame.Surface(self.page_size, pygame.SRCALPHA, image)
+            if page.get_masks() != image.get_masks():
+                return None
+            page.fill((0, 0, 0, 0))
+            self.pages.append(page)
+            self.x, self.y, self.shelf_height = 0, 0, 0
+
+        page = self.pages[-1]
+        page.blit(image, (self.x, self.y), special_flags=pygame.BLEND_RGBA_ADD)  # Onto zeros, so an exact copy
+        rect = pygame.Rect(self.x, self.y, width, height)
+        frame = page.subsurface(rect)
+        self.regions[frame] = (page, rect)
+        self.x += width
+        self.shelf_height = max(self.shelf_height, height)
+        self.frames += 1
+        return frame
+
+    def stats(self):
+        """
+        Description: Report how full the atlas is.
+        Parameters: None
+        Returns:
+            dict: The number of pages and frames.
+        """
+        return {"pages": len(self.pages), "frames": self.frames}
@@ -5,10 +5,16 @@ Description: This program file contains the other basic static sprites that don'
 """
 
 import pygame
+from assetRegistry import ASSETS, OPAQUE
+from parallaxBackground import ParallaxBackground, ParallaxLayer
+from textRenderer import TEXT
 
 WHITE = ((255, 255, 255))
 SCREEN_WIDTH = 923.72
 SCREEN_HEIGHT = 480
+CITY_IMAGE = "01. Visual Assets/05. Other Sprites/repeating city bg.png"
+BOSS_CITY_IMAGE = "01. Visual Assets/05. Other Sprites/bosscity.png"
+CITY_REPEAT_WIDTH = 920  # Both city images hold the skyline twice; it repeats every 920 pixels
 
 class Boundary(pygame.sprite.Sprite):
     """
@@ -39,43 +45,32 @@ class Boundary(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
 
-class Background(pygame.sprite.Sprite):
+class Background(ParallaxBackground):
     """
     A class to represent the background of the game.
 
+    The normal and boss city art both stay loaded, so switching between them only swaps the surface drawn.
+
     Attributes:
-        screen (pygame.Surface): The surface representing the game window.
+        window (pygame.Surface): The surface representing the game window.
+        normal_image (pygame.Surface): The regular city art.
+        boss_image (pygame.Surface): The city art shown during the boss fight.
+        city (ParallaxLayer): The scrolling city layer.
     """
     def __init__(self, screen):
         """
-        Description: Initialize the background sprite.
+        Description: Initialize the background.
 
         Parameters:
             screen (pygame.Surface): The game window surface.
         
         Returns: None
         """
-        pygame.sprite.Sprite.__init__(self)
         self.window = screen
-        self.image = pygame.image.load("01. Visual Assets/05. Other Sprites/repeating city bg.png").convert()  # Load and convert background image
-        self.rect = self.image.get_rect()
-        self.rect.left = 0
-        self.rect.top = 0
-
-        self.boss_image = pygame.image.load("01. Visual Assets/05. Other Sprites/bosscity.png").convert()  # Load boss background image
-        self.boss_rect = self.boss_image.get_rect()
-        self.boss_rect.left = 0
-        self.boss_rect.top = 0
-
-    def update(self):
-        """
-        Description: Update the background's position and handle fade-in effect.
-        Parameters: None
-        Returns: None
-        """
-        self.rect.left -= 10  # Move the background to the left
-        if self.rect.right <= self.window.get_width():
-            self.rect.left = 0  # Reset background position when it moves off-screen
+        self.normal_image = ASSETS.image(CITY_IMAGE, pixel_format=OPAQUE)
+        self.boss_image = ASSETS.image(BOSS_CITY_IMAGE, pixel_format=OPAQUE)
+        self.city = ParallaxLayer(self.normal_image, 10, CITY_REPEAT_WIDTH)
+        ParallaxBackground.__init__(self, [self.city], screen.get_size())
 
     def boss_fight(self):
         """
@@ -83,7 +78,7 @@ class Background(pygame.sprite.Sprite):
         Parameters: None
         Returns: None
         """
-        self.image = self.boss_image  # Set the background image to the boss image
+        self.city.image = self.boss_image
 
     def normal(self):
         """
@@ -91,18 +86,7 @@ class Background(pygame.sprite.Sprite):
         Parameters: None
         Returns: None
         """
-        self.image = pygame.image.load("01. Visual Assets/05. Other Sprites/repeating city bg.png").convert()  # Set background to regular image
-
-    def draw(self):
-        """
-        Description: Draw the current background image to the window.
-        Parameters: None
-        Returns: None
-        """
-        self.window.blit(self.image, self.rect)  # Draw the main background image
-        if self.fade_in_progress or self.boss_alpha > 0:
-            self.boss_image.set_alpha(self.boss_alpha)  # Set alpha transparency for boss image
-            self.window.blit(self.boss_image, self.boss_rect)  # Draw boss image with transparency
+        self.city.image = self.normal_image
 
 class End_Screen(pygame.sprite.Sprite):
     """
@@ -122,13 +106,11 @@ class End_Screen(pygame.sprite.Sprite):
         Returns: None
         """
         pygame.sprite.Sprite.__init__(self)
-        self.font = pygame.font.Font("Migae.otf", 25)  # Load a custom font for the end screen
-
         self.screen = screen
 
-        game_over_text = self.font.render(txt1, True, WHITE)  
-        restart_text = self.font.render("Press RETURN to play again", True, WHITE)  
-        quit_text = self.font.render("Press Q to quit", True, WHITE)  
+        game_over_text = TEXT.render(txt1, WHITE)  
+        restart_text = TEXT.render("Press RETURN to play again", WHITE)  
+        quit_text = TEXT.render("Press Q to quit", WHITE)  
 
         # Display texts on the screen
         self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
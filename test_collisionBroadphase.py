@@ -0,0 +1,128 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the tests of the collision broadphase: whether a snapshot is scanned or sorted along x, its queries find the same sprites in the same order as pygame's own collision functions, through spawns, deaths and moves.
+"""
+
+import random
+import pygame
+import pytest
+import collisionBroadphase
+from collisionBroadphase import Broadphase
+
+
+class Box(pygame.sprite.Sprite):
+    """
+    Description: A sprite that is only a rect.
+
+    Attributes:
+        rect (pygame.Rect): The sprite's rect.
+    """
+
+    def __init__(self, rng):
+        """
+        Description: Initialize a box of random size somewhere around the screen.
+
+        Parameters:
+            rng (random.Random): The random number generator.
+
+        Returns: None
+        """
+        pygame.sprite.Sprite.__init__(self)
+        self.rect = pygame.Rect(rng.randint(-100, 900), rng.randint(0, 500), rng.randint(0, 150), rng.randint(0, 80))
+
+
+def check_queries(broadphase, area):
+    """
+    Description: Check each query of a broadphase against colliderect over the sprites still alive, in snapshot order.
+
+    Parameters:
+        broadphase (Broadphase): The broadphase.
+        area (Box): The sprite to query with.
+
+    Returns: None
+    """
+    expected = [sprite for sprite in broadphase.sprites if sprite.alive() and area.rect.colliderect(sprite.rect)]
+    assert broadphase.collide(area) == expected
+    assert broadphase.within(area.rect) == expected
+    assert broadphase.collide_any(area) == (expected[0] if expected else None)
+    assert broadphase.overlaps(area.rect) == bool(expected)
+
+
+@pytest.mark.parametrize("count", [0, 10, collisionBroadphase.SWEEP_SIZE, 300])
+def test_matches_pygame(count):
+    """
+    Description: Queries agree with pygame before and after the snapshot is sorted, while sprites spawn, die and
+        move.
+    """
+    rng = random.Random(count)
+    group = pygame.sprite.Group([Box(rng) for index in range(count)])
+    broadphase = Broadphase()
+    broadphase.sync(group)
+    for query in range(60):
+        roll = rng.random()
+        if roll < 0.15 and group:
+            sprite = rng.choice(group.sprites())
+            sprite.kill()
+            broadphase.remove(sprite)
+        elif roll < 0.3:
+            sprite = Box(rng)
+            group.add(sprite)
+            broadphase.add(sprite)
+        elif roll < 0.4:
+            for sprite in group:
+                sprite.rect.x -= rng.randint(0, 30)
+            broadphase.refresh()
+        check_queries(broadphase, Box(rng))
+
+
+def test_sorts_busy_snapshots_only():
+    """
+    Description: A big snapshot is sorted once it has been queried SWEEP_QUERIES times, and a small one never is.
+    """
+    rng = random.Random(1)
+    area = Box(rng)
+    for count, sorted_after in ((collisionBroadphase.SWEEP_SIZE - 1, False), (collisionBroadphase.SWEEP_SIZE, True)):
+        broadphase = Broadphase()
+        broadphase.sync([Box(rng) for index in range(count)])
+        for query in range(collisionBroadphase.SWEEP_QUERIES):
+            broadphase.hits(area.rect)
+        assert broadphase.order is None
+        broadphase.hits(area.rect)
+        assert (broadphase.order is not None) == sorted_after
+
+
+def test_sync_keeps_sprites_in_area():
+    """
+    Description: A snapshot taken with an area holds only the sprites whose rects collide with it, in group order.
+    """
+    rng = random.Random(2)
+    sprites = [Box(rng) for index in range(100)]
+    broadphase = Broadphase()
+    for area in (pygame.Rect(0, 0, 400, 300), pygame.Rect(-1000, -1000, 3000, 3000)):
+        broadphase.sync(sprites, area)
+        assert broadphase.sprites == [sprite for sprite in sprites if area.colliderect(sprite.rect)]
+        assert broadphase.rects == [sprite.rect for sprite in broadphase.sprites]
+
+
+def test_tracked_group_snapshot_follows_changes():
+    """
+    Description: A tracked group's kept snapshot is taken again once its members change, and sprites removed from or
+        added to one tick's snapshot are back as in the group on the next sync.
+    """
+    rng = random.Random(3)
+    group = collisionBroadphase.TrackedGroup([Box(rng) for index in range(20)])
+    broadphase = Broadphase()
+    broadphase.sync(group)
+    first = group.sprites()[0]
+    broadphase.remove(first)
+    broadphase.add(Box(rng))
+    broadphase.sync(group)
+    assert broadphase.sprites == group.sprites()
+    assert broadphase.rects == [sprite.rect for sprite in group]
+
+    first.kill()
+    group.add(Box(rng))
+    broadphase.sync(group)
+    assert broadphase.sprites == group.sprites()
+    check_queries(broadphase, Box(rng))
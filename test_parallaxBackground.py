@@ -0,0 +1,88 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the tests of the parallax layers: the spans a layer draws always cover the window exactly once with the art in order, including where the strip wraps around.
+"""
+
+import pygame
+import pytest
+from parallaxBackground import ParallaxLayer
+
+
+def covered_columns(spans):
+    """
+    Description: List the art column drawn at each window column.
+
+    Parameters:
+        spans (list): The ((x, y), area) pairs from ParallaxLayer.spans.
+
+    Returns:
+        list: The art column at each window column, in window order.
+    """
+    columns = []
+    for (x, y), area in spans:
+        assert x == len(columns)  # Each span starts where the last one ended
+        columns.extend(range(area.left, area.right))
+    return columns
+
+
+def make_layer(width, speed, repeat_width=None):
+    """
+    Description: Make a layer over plain art.
+
+    Parameters:
+        width (int): The width of the art.
+        speed (float): Pixels scrolled per frame.
+        repeat_width (int, optional): The width after which the art repeats.
+
+    Returns:
+        ParallaxLayer: The layer.
+    """
+    return ParallaxLayer(pygame.Surface((width, 50)), speed, repeat_width, y=10)
+
+
+def test_single_span_before_wrapping():
+    """
+    Description: While the art reaches past the window, the layer is one blit from its offset.
+    """
+    layer = make_layer(300, 7)
+    for i in range(5):
+        layer.update()
+    spans = layer.spans(100, 50)
+    assert len(spans) == 1
+    assert spans[0][0] == (0, 10)
+    assert covered_columns(spans) == list(range(35, 135))
+
+
+@pytest.mark.parametrize("repeat_width", [None, 250])
+def test_wraps_into_two_spans(repeat_width):
+    """
+    Description: Where the art runs out, a second blit carries on from the same point of the next repeat.
+    """
+    layer = make_layer(300, 7, repeat_width)
+    period = repeat_width or 300
+    for i in range(40):
+        layer.update()
+        columns = covered_columns(layer.spans(100, 50))
+        assert len(columns) == 100
+        assert [column % period for column in columns] == [(layer.offset + x) % period for x in range(100)]
+
+
+def test_interpolates_back_to_last_tick():
+    """
+    Description: Drawing part way between ticks shows the layer part way through its last move.
+    """
+    layer = make_layer(300, 10)
+    layer.update()
+    layer.update()
+    assert covered_columns(layer.spans(100, 50, 0.0))[0] == 10
+    assert covered_columns(layer.spans(100, 50, 0.5))[0] == 15
+    assert covered_columns(layer.spans(100, 50, 1.0))[0] == 20
+
+
+def test_height_is_clipped_to_the_art():
+    """
+    Description: A window taller than the art draws only the art's rows.
+    """
+    layer = make_layer(300, 1)
+    assert all(area.height == 50 for position, area in layer.spans(100, 480))
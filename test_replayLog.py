@@ -0,0 +1,100 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the tests of run replays: the varint codec, the action bitmasks, the file format and playing a recorded run back exactly.
+"""
+
+import pytest
+import gameSimulation
+import replayLog
+
+
+def test_varint_round_trip():
+    """
+    Description: Every integer comes back from read_varint as written, with the offset just past it.
+    """
+    values = [0, 1, 127, 128, 255, 300, 16383, 16384, 2 ** 32, 2 ** 63]
+    data = bytearray()
+    for value in values:
+        start = len(data)
+        replayLog.write_varint(data, value)
+        assert len(data) - start == max(1, -(-value.bit_length() // 7))  # 7 bits per byte
+
+    offset = 0
+    for value in values:
+        read, offset = replayLog.read_varint(data, offset)
+        assert read == value
+    assert offset == len(data)
+
+
+def test_action_mask_round_trip():
+    """
+    Description: A bitmask unpacks to the actions packed into it, in ACTIONS order.
+    """
+    assert replayLog.action_mask(()) == 0
+    assert replayLog.mask_actions(0) == ()
+    for count in range(len(gameSimulation.ACTIONS) + 1):
+        actions = gameSimulation.ACTIONS[:count]
+        assert replayLog.mask_actions(replayLog.action_mask(tuple(reversed(actions)))) == actions
+
+
+@pytest.mark.parametrize("seed", [0, 1234, -5, 2 ** 63 - 1, -2 ** 63])
+def test_bytes_round_trip(seed):
+    """
+    Description: A replay decodes to the seed, tick rate, inputs, length and checksum it was encoded with.
+    """
+    inputs = {0: 1, 1: 3, 200: 8, 100000: 15}
+    replay = replayLog.Replay(seed, 60, dict(inputs), 100001, 0xDEADBEEF)
+    decoded = replayLog.Replay.from_bytes(replay.to_bytes())
+    assert (decoded.seed, decoded.tick_rate, decoded.inputs, decoded.ticks, decoded.checksum) == \
+        (seed, 60, inputs, 100001, 0xDEADBEEF)
+
+
+def test_rejects_other_files():
+    """
+    Description: Data that is not a replay of this version raises ValueError instead of decoding to nonsense.
+    """
+    data = replayLog.Replay(1).to_bytes()
+    with pytest.raises(ValueError):
+        replayLog.Replay.from_bytes(data[:4])
+    with pytest.raises(ValueError):
+        replayLog.Replay.from_bytes(b"NOPE" + data[4:])
+    with pytest.raises(ValueError):
+        replayLog.Replay.from_bytes(data[:4] + bytes([replayLog.VERSION + 1]) + data[5:])
+
+
+def test_seed_value_range():
+    """
+    Description: Seeds a replay can store are accepted on the command line and others are rejected.
+    """
+    assert replayLog.seed_value("-7") == -7
+    assert replayLog.seed_value(str(2 ** 63 - 1)) == 2 ** 63 - 1
+    with pytest.raises(Exception):
+        replayLog.seed_value(str(2 ** 63))
+
+
+def test_run_path_numbers_runs():
+    """
+    Description: Each run of a recording session gets its own file.
+    """
+    assert replayLog.run_path("run.replay", 1) == "run-1.replay"
+    assert replayLog.run_path("dir/run", 12) == "dir/run-12"
+
+
+def test_play_reproduces_recorded_run(tmp_path):
+    """
+    Description: A recorded run saved to a file and played back ends in the same state.
+    """
+    simulation = gameSimulation.GameSimulation(seed=99)
+    replay = replayLog.Replay(simulation.seed, simulation.tick_rate)
+    while not simulation.over and simulation.tick < 900:
+        actions = (gameSimulation.ACTIONS[simulation.tick % 4],) if simulation.tick % 11 == 0 else ()
+        replay.record(simulation.tick, actions)
+        simulation.step(actions)
+    replay.finish(simulation)
+
+    path = tmp_path / "run.replay"
+    replay.save(str(path))
+    played = replayLog.play(replayLog.Replay.load(str(path)))
+    assert played.tick == replay.ticks
+    assert played.checksum() == replay.checksum
@@ -0,0 +1,142 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the tests of the sound bus: repeats of an event in one frame are merged, the most important sounds are played first, and a full set of channels gives up the voice of a less important sound or drops the new one.
+"""
+
+import soundBus
+from soundBus import SoundBus, LOW, NORMAL, HIGH, CRITICAL
+
+
+class FakeChannel:
+    """
+    Description: A mixer channel that stays busy once started, so a test decides when channels are full.
+
+    Attributes:
+        playing (object): The sound last started, or None.
+    """
+
+    def __init__(self):
+        """
+        Description: Initialize an idle channel.
+        Parameters: None
+        Returns: None
+        """
+        self.playing = None
+
+    def get_busy(self):
+        """
+        Description: Report whether a sound has been started on the channel.
+        Parameters: None
+        Returns:
+            bool: True once a sound has been started.
+        """
+        return self.playing is not None
+
+    def play(self, sound):
+        """
+        Description: Start a sound, replacing any playing.
+        Parameters:
+            sound (object): The sound.
+        Returns: None
+        """
+        self.playing = sound
+
+
+def make_bus(channels):
+    """
+    Description: Make a bus over fake channels, with an event of each priority registered.
+
+    Parameters:
+        channels (int): The number of channels.
+
+    Returns:
+        SoundBus: The bus.
+    """
+    bus = SoundBus(channels)
+    bus.channels = [FakeChannel() for index in range(channels)]
+    bus.voices = [LOW] * channels
+    for name, priority in (("low", LOW), ("normal", NORMAL), ("high", HIGH), ("critical", CRITICAL)):
+        bus.register(name, name, priority)
+    return bus
+
+
+def playing(bus):
+    """
+    Description: List the sound on each channel.
+
+    Parameters:
+        bus (SoundBus): The bus.
+
+    Returns:
+        list: The sound started last on each channel, or None.
+    """
+    return [channel.playing for channel in bus.channels]
+
+
+def test_repeats_in_a_frame_merge():
+    """
+    Description: An event posted several times in a frame is played once.
+    """
+    bus = make_bus(4)
+    for i in range(3):
+        bus.post("normal")
+    bus.flush()
+    assert playing(bus) == ["normal", None, None, None]
+    assert (bus.posted, bus.merged, bus.played) == (3, 2, 1)
+    assert not bus.pending
+
+
+def test_most_important_first():
+    """
+    Description: With too few channels for a frame's sounds, the most important get them.
+    """
+    bus = make_bus(2)
+    for name in ("low", "normal", "critical", "high"):
+        bus.post(name)
+    bus.flush()
+    assert playing(bus) == ["critical", "high"]
+    assert bus.dropped == 2
+
+
+def test_steals_least_important_voice():
+    """
+    Description: A sound takes over the least important voice playing when every channel is busy.
+    """
+    bus = make_bus(3)
+    for name in ("normal", "low", "high"):
+        bus.post(name)
+        bus.flush()
+    bus.post("critical")
+    bus.flush()
+    assert playing(bus) == ["normal", "critical", "high"]
+    assert bus.stolen == 1
+
+
+def test_drops_when_nothing_is_less_important():
+    """
+    Description: A sound no more important than everything playing is dropped, not swapped for an equal one.
+    """
+    bus = make_bus(2)
+    for name in ("high", "high"):
+        bus.post(name)
+        bus.flush()
+    bus.post("normal")
+    bus.post("high")
+    bus.flush()
+    assert playing(bus) == ["high", "high"]
+    assert (bus.stolen, bus.dropped) == (0, 2)
+
+
+def test_silent_without_channels():
+    """
+    Description: With no mixer channels the bus plays nothing but still empties its queue.
+    """
+    bus = SoundBus()
+    bus.channels = []
+    bus.voices = []
+    bus.register("normal", "normal", soundBus.NORMAL)
+    bus.post("normal")
+    bus.flush()
+    assert bus.played == 0
+    assert not bus.pending
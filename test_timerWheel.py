@@ -0,0 +1,101 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the tests of the timer wheel and cooldowns: timers fire on exactly the tick they are due, whichever level of the wheel they wait in, and cancelled timers never fire.
+"""
+
+import pytest
+from timerWheel import TimerWheel, Cooldown, SLOT_BITS
+
+
+def run_until(wheel, tick):
+    """
+    Description: Advance a wheel up to a tick.
+
+    Parameters:
+        wheel (TimerWheel): The wheel.
+        tick (int): The tick to stop on.
+
+    Returns: None
+    """
+    while wheel.tick < tick:
+        wheel.advance()
+
+
+@pytest.mark.parametrize("delay", [1, 2, 63, 64, 65, 4095, 4096, 4097, 70000, 300000])
+def test_fires_on_due_tick(delay):
+    """
+    Description: A timer fires once, on its tick, including those that cascade down from a higher level.
+    """
+    wheel = TimerWheel()
+    fired = []
+    run_until(wheel, 37)  # Start part way through a slot, so cascades do not line up with the delay
+    wheel.schedule(delay, lambda: fired.append(wheel.tick))
+    run_until(wheel, 37 + delay + (1 << SLOT_BITS))
+    assert fired == [37 + delay]
+
+
+def test_same_tick_fires_in_schedule_order():
+    """
+    Description: Timers due on one tick fire in the order they were scheduled, wherever they waited.
+    """
+    wheel = TimerWheel()
+    fired = []
+    wheel.schedule(5000, lambda: fired.append("far"))
+    run_until(wheel, 4990)
+    wheel.schedule(10, lambda: fired.append("near"))
+    run_until(wheel, 5000)
+    assert fired == ["far", "near"]
+
+
+def test_repeating_timer_and_cancel():
+    """
+    Description: A repeating timer fires every interval until cancelled.
+    """
+    wheel = TimerWheel()
+    fired = []
+    timer = wheel.schedule(3, lambda: fired.append(wheel.tick), 4)
+    run_until(wheel, 15)
+    timer.cancel()
+    run_until(wheel, 100)
+    assert fired == [3, 7, 11, 15]
+
+
+def test_cancelled_far_timer_never_fires():
+    """
+    Description: Cancelling a timer waiting in a higher level stops it firing after it cascades.
+    """
+    wheel = TimerWheel()
+    fired = []
+    timer = wheel.schedule(5000, lambda: fired.append(wheel.tick))
+    run_until(wheel, 100)
+    timer.cancel()
+    run_until(wheel, 6000)
+    assert fired == []
+
+
+def test_times_round_up_to_ticks():
+    """
+    Description: Game time is turned into the ticks that must pass before that much time has.
+    """
+    wheel = TimerWheel(30)
+    assert wheel.ticks(0) == 0
+    assert wheel.ticks(100) == 3
+    assert wheel.ticks(101) == 4
+    assert wheel.frames(2) == 2
+    assert TimerWheel(60).frames(2) == 4
+
+
+def test_cooldown():
+    """
+    Description: A cooldown can be used once, then not again until its time has passed.
+    """
+    wheel = TimerWheel(30)
+    cooldown = Cooldown(wheel, 100)
+    assert cooldown.trigger()
+    assert not cooldown.trigger()
+    run_until(wheel, 2)
+    assert not cooldown.ready
+    run_until(wheel, 3)
+    assert cooldown.ready
+    assert cooldown.trigger()
@@ -0,0 +1,265 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the text renderer shared by the HUD, health bars and end screen. The glyphs the HUD uses are rasterized once into an atlas per font and colour, numeric strings are composed by blitting glyphs from it, and whole rendered strings are kept in a least-recently-used cache. The score, which changes nearly every frame, is drawn straight from the atlas instead of being cached.
+"""
+
+import pygame
+from collections import OrderedDict
+from assetRegistry import ASSETS
+
+WHITE = (255, 255, 255)
+
+HUD_FONT = "Migae.otf"
+HUD_FONT_SIZE = 25
+HUD_CHARACTERS = "0123456789%x:- Score"  # Every character of the score, gem counter and health percentages
+STRING_CACHE_SIZE = 256  # Rendered strings kept before the least recently used one is dropped
+
+
+class GlyphAtlas:
+    """
+    Description: The HUD glyphs of one font and colour, rasterized side by side on one surface.
+
+    Attributes:
+        font (pygame.font.Font): The font the glyphs come from.
+        surface (pygame.Surface): The atlas, with every glyph on one row.
+        glyphs (dict): The area of each character in the atlas.
+        advances (dict): How far each character moves the pen, which can be less than its glyph's width.
+        height (int): The height of every glyph.
+    """
+
+    def __init__(self, font, color, characters=HUD_CHARACTERS):
+        """
+        Description: Rasterize the glyphs into a new atlas.
+
+        Parameters:
+            font (pygame.font.Font): The font to rasterize.
+            color (tuple): The text colour.
+            characters (str, optional): The characters to rasterize.
+
+        Returns: None
+        """
+        self.font = font
+        characters = "".join(sorted(set(characters)))
+        images = [font.render(character, True, color) for character in characters]
+        self.height = font.get_height()
+        self.surface = pygame.Surface((max(1, sum(image.get_width() for image in images)), self.height),
+                                      pygame.SRCALPHA)
+        self.glyphs = {}
+        self.advances = {character: metrics[4] for character, metrics in zip(characters, font.metrics(characters))}
+        x = 0
+        for character, image in zip(characters, images):
+            # BLEND_RGBA_MAX copies the glyph's colour and alpha exactly onto the transparent atlas
+            self.surface.blit(image, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[character] = pygame.Rect(x, 0, image.get_width(), self.height)
+            x += image.get_width()
+
+    def covers(self, text):
+        """
+        Description: Check whether every character of a string is in the atlas.
+
+        Parameters:
+            text (str): The string.
+
+        Returns:
+            bool: True when the string can be composed from the atlas.
+        """
+        glyphs = self.glyphs
+        for character in text:
+            if character not in glyphs:
+                return False
+        return True
+
+    def compose(self, text):
+        """
+        Description: Build a string by blitting its glyphs from the atlas.
+
+        Parameters:
+            text (str): The string. Every character must be in the atlas.
+
+        Returns:
+            pygame.Surface: The rendered string.
+        """
+        areas = [self.glyphs[character] for character in text]
+        advances = [self.advances[character] for character in text]
+        width = sum(advances[:-1]) + max(areas[-1].width, advances[-1]) if text else 1
+        surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        self.draw(surface, text, (0, 0))
+        return surface
+
+    def draw(self, surface, text, pos):
+        """
+        Description: Blit a string's glyphs from the atlas straight onto a surface.
+
+        The glyphs are combined with BLEND_RGBA_MAX, so on a transparent area the result is the same as blitting
+        the composed string there.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The string. Every character must be in the atlas.
+            pos (tuple): The (x, y) of the string's top left corner.
+
+        Returns: None
+        """
+        x, y = pos
+        glyphs = self.glyphs
+        advances = self.advances
+        for character in text:
+            surface.blit(self.surface, (x, y), glyphs[character], special_flags=pygame.BLEND_RGBA_MAX)
+            x += advances[character]
+
+
+class TextRenderer:
+    """
+    Description: Renders and caches text for the whole game.
+
+    The same string in the same font and colour always comes back as the same surface while it stays cached, so
+    the frame renderer sees unchanged text as unchanged and never redraws it.
+
+    Attributes:
+        atlases (dict): The GlyphAtlas of each (font path, size, colour).
+        strings (OrderedDict): Rendered strings by (font path, size, colour, text), least recently used first.
+        max_strings (int): The number of strings kept.
+        hits (int): Strings served from the cache.
+        composed (int): Strings built from an atlas.
+        drawn (int): Strings drawn straight from an atlas without being cached.
+        rendered (int): Strings rendered by the font because a character was missing from the atlas.
+        evictions (int): Strings dropped from the cache.
+    """
+
+    def __init__(self, max_strings=STRING_CACHE_SIZE):
+        """
+        Description: Initialize an empty text renderer.
+
+        Parameters:
+            max_strings (int, optional): The number of rendered strings to keep.
+
+        Returns: None
+        """
+        self.atlases = {}
+        self.strings = OrderedDict()
+        self.max_strings = max_strings
+        self.hits = 0
+        self.composed = 0
+        self.drawn = 0
+        self.rendered = 0
+        self.evictions = 0
+
+    def atlas(self, path=HUD_FONT, size=HUD_FONT_SIZE, color=WHITE):
+        """
+        Description: Get the glyph atlas of a font and colour, rasterizing it on first use.
+
+        Parameters:
+            path (str, optional): The file path to the font.
+            size (int, optional): The point size of the font.
+            color (tuple, optional): The text colour.
+
+        Returns:
+            GlyphAtlas: The atlas.
+        """
+        key = (path, size, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(ASSETS.font(path, size), color)
+        return atlas
+
+    def render(self, text, color=WHITE, path=HUD_FONT, size=HUD_FONT_SIZE):
+        """
+        Description: Get a rendered string, from the cache when possible.
+
+        Parameters:
+            text (str): The string.
+            color (tuple, optional): The text colour.
+            path (str, optional): The file path to the font.
+            size (int, optional): The point size of the font.
+
+        Returns:
+            pygame.Surface: The rendered string. It is shared, so it must not be drawn on.
+        """
+        key = (path, size, color, text)
+        surface = self.strings.get(key)
+        if surface is not None:
+            self.strings.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        atlas = self.atlas(path, size, color)
+        if atlas.covers(text):
+            surface = atlas.compose(text)
+            self.composed += 1
+        else:
+            surface = atlas.font.render(text, True, color)
+            self.rendered += 1
+
+        self.strings[key] = surface
+        if len(self.strings) > self.max_strings:
+            self.strings.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def draw(self, surface, text, pos, color=WHITE, path=HUD_FONT, size=HUD_FONT_SIZE):
+        """
+        Description: Draw a string onto a transparent area of a surface without caching it, for text such as the
+            score that changes nearly every frame and would only push reusable strings out of the cache.
+
+        Parameters:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The string.
+            pos (tuple): The (x, y) of the string's top left corner.
+            color (tuple, optional): The text colour.
+            path (str, optional): The file path to the font.
+            size (int, optional): The point size of the font.
+
+        Returns: None
+        """
+        atlas = self.atlas(path, size, color)
+        if atlas.covers(text):
+            atlas.draw(surface, text, pos)
+            self.drawn += 1
+        else:
+            surface.blit(atlas.font.render(text, True, color), pos)
+            self.rendered += 1
+
+    def size(self, text, path=HUD_FONT, size=HUD_FONT_SIZE):
+        """
+        Description: Get the size a string is rendered at.
+
+        Parameters:
+            text (str): The string.
+            path (str, optional): The file path to the font.
+            size (int, optional): The point size of the font.
+
+        Returns:
+            tuple: The (width, height) of the string.
+        """
+        return self.render(text, WHITE, path, size).get_size()
+
+    def stats(self):
+        """
+        Description: Report how well the cache is doing.
+        Parameters: None
+        Returns:
+            dict: Hit, composed, drawn, rendered and eviction counts and the number of cached strings.
+        """
+        return {
+            "hits": self.hits,
+            "composed": self.composed,
+            "drawn": self.drawn,
+            "rendered": self.rendered,
+            "evictions": self.evictions,
+            "strings": len(self.strings),
+            "atlases": len(self.atlases),
+        }
+
+    def clear(self):
+        """
+        Description: Drop every atlas and cached string.
+        Parameters: None
+        Returns: None
+        """
+        self.atlases.clear()
+        self.strings.clear()
+
+
+# The text renderer shared by the whole game
+TEXT = TextRenderer()
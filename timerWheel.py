@@ -0,0 +1,284 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the hierarchical timer wheel and the cooldowns built on it. Every cooldown, burst interval, damage window and sprite animation registers a timer that fires on a simulation tick, so a tick only looks at the timers due on it, however many are waiting.
+"""
+
+import math
+from operator import attrgetter
+
+FRAME_RATE = 30  # Sprite speeds and animation delays are given in frames of a 30 FPS game
+SLOT_BITS = 6  # 64 slots per level
+LEVELS = 4  # Enough for 64 ** 4 ticks, over a week of game time at 30 ticks per second
+
+
+class Timer:
+    """
+    Description: A callback waiting in a TimerWheel.
+
+    Attributes:
+        callback (function): Called with no arguments when the timer fires.
+        expires (int): The tick it fires on.
+        interval (int): Ticks between firings of a repeating timer, or None to fire once.
+        order (int): When it was scheduled on its wheel, so timers due on the same tick fire in that order.
+        active (bool): Whether it is still waiting to fire. A cancelled timer stays in its slot until its slot is
+            next visited and is skipped there.
+    """
+
+    def __init__(self, callback, expires, interval=None, order=0):
+        """
+        Description: Initialize a timer.
+
+        Parameters:
+            callback (function): Called with no arguments when the timer fires.
+            expires (int): The tick it fires on.
+            interval (int, optional): Ticks between firings of a repeating timer, or None to fire once.
+            order (int, optional): When it was scheduled on its wheel.
+
+        Returns: None
+        """
+        self.callback = callback
+        self.expires = expires
+        self.interval = interval
+        self.order = order
+        self.active = True
+
+    def cancel(self):
+        """
+        Description: Stop the timer from firing again.
+        Parameters: None
+        Returns: None
+        """
+        self.active = False
+
+
+class TimerWheel:
+    """
+    Description: Timers bucketed by the tick they fire on, in levels of coarser and coarser slots.
+
+    The first level has a slot for each of the next 64 ticks, the next a slot for each of the next 64 spans of 64
+    ticks, and so on. A tick fires the one slot of the first level it lands on. Whenever the first level comes
+    round again, the next level's slot for the coming span is emptied into the finer levels, so each timer is
+    only moved a few times in its life and a tick costs the same however many timers are waiting.
+
+    Attributes:
+        tick_rate (int): Simulation ticks per second.
+        tick (int): The number of ticks advanced so far.
+        slots (list): The slot lists of each level.
+        spare (list): An empty list swapped in for a slot as it fires, so firing makes no new lists.
+        scheduled (int): The number of timers scheduled so far.
+    """
+
+    def __init__(self, tick_rate=FRAME_RATE):
+        """
+        Description: Initialize an empty wheel.
+
+        Parameters:
+            tick_rate (int, optional): Simulation ticks per second, used to turn times into ticks.
+
+        Returns: None
+        """
+        self.tick_rate = tick_rate
+        self.tick = 0
+        self.scheduled = 0
+        self.slots = [[[] for slot in range(1 << SLOT_BITS)] for level in range(LEVELS)]
+        self.spare = []
+
+    def ticks(self, ms):
+        """
+        Description: Turn a length of game time into a number of ticks, rounding up.
+
+        Parameters:
+            ms (float): The time in milliseconds.
+
+        Returns:
+            int: The ticks that must pass before that much game time has.
+        """
+        return max(0, math.ceil(ms * self.tick_rate / 1000 - 1e-9))  # Shrug off float error such as 2.0000000004
+
+    def frames(self, count):
+        """
+        Description: Turn a number of 30 FPS frames into a number of ticks, rounding up.
+
+        Parameters:
+            count (float): The frames.
+
+        Returns:
+            int: The ticks that must pass before that many frames have.
+        """
+        return self.ticks(count * 1000 / FRAME_RATE)
+
+    def schedule(self, delay, callback, interval=None):
+        """
+        Description: Fire a callback a number of ticks from now.
+
+        Parameters:
+            delay (int): Ticks until it fires, at least 1.
+            callback (function): Called with no arguments when the timer fires.
+            interval (int, optional): Fire again every this many ticks until cancelled.
+
+        Returns:
+            Timer: The timer, to cancel it with.
+        """
+        timer = Timer(callback, self.tick + max(1, delay), interval and max(1, interval), self.scheduled)
+        self.scheduled += 1
+        self.insert(timer)
+        return timer
+
+    def after(self, ms, callback):
+        """
+        Description: Fire a callback once, once an amount of game time has passed.
+
+        Parameters:
+            ms (float): The game time in milliseconds.
+            callback (function): Called with no arguments when the timer fires.
+
+        Returns:
+            Timer: The timer, to cancel it with.
+        """
+        return self.schedule(self.ticks(ms), callback)
+
+    def every(self, ms, callback):
+        """
+        Description: Fire a callback over and over, each time an amount of game time has passed.
+
+        Parameters:
+            ms (float): The game time in milliseconds.
+            callback (function): Called with no arguments each time the timer fires.
+
+        Returns:
+            Timer: The timer, to cancel it with.
+        """
+        delay = self.ticks(ms)
+        return self.schedule(delay, callback, delay)
+
+    def insert(self, timer):
+        """
+        Description: Put a timer into the slot covering the tick it fires on.
+
+        Parameters:
+            timer (Timer): The timer.
+
+        Returns: None
+        """
+        delay = timer.expires - self.tick
+        if delay < 1 << SLOT_BITS:
+            self.slots[0][timer.expires & ((1 << SLOT_BITS) - 1)].append(timer)  # Most timers, such as animations
+            return
+        level = 0
+        while level < LEVELS - 1 and delay >= 1 << (SLOT_BITS * (level + 1)):
+            level += 1
+        # Timers past the top level's reach wait in its furthest slot and are moved on when it is emptied
+        slot = min(timer.expires, self.tick + (1 << (SLOT_BITS * LEVELS)) - 1) >> (SLOT_BITS * level)
+        self.slots[level][slot & ((1 << SLOT_BITS) - 1)].append(timer)
+
+    def advance(self):
+        """
+        Description: Move on one tick and fire every timer due on it, in the order they were scheduled.
+        Parameters: None
+        Returns: None
+        """
+        self.tick += 1
+        mask = (1 << SLOT_BITS) - 1
+        index = self.tick & mask
+
+        if not index:
+            # Each time a level comes round, spread the next level's slot for the coming span over the finer levels
+            level = 1
+            while level < LEVELS and not self.tick & ((1 << (SLOT_BITS * level)) - 1):
+                level += 1
+            for cascade in range(level - 1, 0, -1):
+                slot = (self.tick >> (SLOT_BITS * cascade)) & mask
+                timers, self.slots[cascade][slot] = self.slots[cascade][slot], []
+                for timer in timers:
+                    if timer.active:
+                        self.insert(timer)
+
+        timers = self.slots[0][index]
+        if not timers:
+            return
+        self.slots[0][index] = self.spare
+        if len(timers) > 1:
+            timers.sort(key=attrgetter("order"))  # Cascaded timers reach the slot after ones scheduled straight in
+        for timer in timers:
+            if not timer.active:
+                continue
+            if timer.expires != self.tick:
+                self.insert(timer)  # Still beyond the top level's reach
+                continue
+            if timer.interval:
+                timer.expires += timer.interval
+                self.insert(timer)
+            else:
+                timer.active = False
+            timer.callback()
+        timers.clear()
+        self.spare = timers
+
+
+class Cooldown:
+    """
+    Description: Something that, once used, cannot be used again until some game time has passed, such as an
+        ability or the window after taking damage in which no more hits are counted.
+
+    Attributes:
+        timers (TimerWheel): The wheel its timer waits in.
+        duration_ms (float): How long it lasts in milliseconds. A change applies from the next use.
+        ready (bool): Whether it can be used.
+        started (int): The tick it was last used on, or None.
+        length (int): The ticks its last use lasts.
+        timer (Timer): The timer that will make it ready, or None while it is ready.
+    """
+
+    def __init__(self, timers, duration_ms):
+        """
+        Description: Initialize a cooldown that is ready.
+
+        Parameters:
+            timers (TimerWheel): The wheel to wait in.
+            duration_ms (float): How long it lasts in milliseconds.
+
+        Returns: None
+        """
+        self.timers = timers
+        self.duration_ms = duration_ms
+        self.ready = True
+        self.started = None
+        self.length = 0
+        self.timer = None
+
+    def trigger(self):
+        """
+        Description: Use it if it is ready, starting the wait.
+        Parameters: None
+        Returns:
+            bool: True if it was ready, False while it is still cooling down.
+        """
+        if not self.ready:
+            return False
+        self.started = self.timers.tick
+        self.length = self.timers.ticks(self.duration_ms)
+        if self.length > 0:
+            self.ready = False
+            self.timer = self.timers.schedule(self.length, self.expire)
+        return True
+
+    def expire(self):
+        """
+        Description: Make it ready again. Called by its timer.
+        Parameters: None
+        Returns: None
+        """
+        self.ready = True
+        self.timer = None
+
+    def progress(self):
+        """
+        Description: Get how far through the wait it is, such as to fade in its HUD icon.
+        Parameters: None
+        Returns:
+            float: From 0 when just used to 1 once ready.
+        """
+        if self.ready:
+            return 1.0
+        return (self.timers.tick - self.started) / self.length
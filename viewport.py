@@ -0,0 +1,82 @@
+"""
+Author: METRO RUNNERS contributors
+Date: October 17 2026
+Description: This program file contains the viewport, the part of the game world the window shows plus a margin around it. Sprites outside it are left out of drawing and collision tests, and sprites that will not reach it for a while can sleep until they do, so the cost of a tick follows what is on screen rather than everything that has been spawned.
+"""
+
+import math
+import pygame
+from operator import attrgetter
+
+RECT = attrgetter("rect")
+MARGIN = 100  # Pixels around the window still counted as in view; as far as a sprite is drawn from its tick position
+
+
+class Viewport:
+    """
+    Description: The window's view of the game world, with a margin around it.
+
+    Attributes:
+        rect (pygame.Rect): The part of the world the window shows.
+        margin (int): Pixels around the window still counted as in view.
+        area (pygame.Rect): The window grown by the margin on every side. A sprite is in view when its rect
+            collides with this.
+    """
+
+    def __init__(self, size, margin=MARGIN):
+        """
+        Description: Initialize a viewport over the window.
+
+        Parameters:
+            size (tuple): The (width, height) of the window.
+            margin (int, optional): Pixels around the window still counted as in view.
+
+        Returns: None
+        """
+        self.rect = pygame.Rect(0, 0, math.ceil(size[0]), math.ceil(size[1]))
+        self.margin = margin
+        self.area = self.rect.inflate(2 * margin, 2 * margin)
+
+    def contains(self, rect):
+        """
+        Description: Check whether a rect is in view.
+
+        Parameters:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            bool: True if it collides with the viewport's area.
+        """
+        return self.area.colliderect(rect)
+
+    def visible(self, sprites):
+        """
+        Description: Find the sprites that are in view.
+
+        Parameters:
+            sprites (iterable): The sprites, such as a group.
+
+        Returns:
+            list: The sprites whose rects collide with the viewport's area, in their original order.
+        """
+        sprites = sprites.sprites() if isinstance(sprites, pygame.sprite.AbstractGroup) else list(sprites)
+        indices = self.area.collidelistall(list(map(RECT, sprites)))
+        if len(indices) == len(sprites):
+            return sprites  # Usually everything is in view
+        return [sprites[index] for index in indices]
+
+    def ticks_until_visible(self, rect, pixels_per_tick):
+        """
+        Description: Find how many ticks a sprite moving left can surely pass without coming into view.
+
+        Parameters:
+            rect (pygame.Rect): Where the sprite is.
+            pixels_per_tick (float): The furthest it can move left in one tick.
+
+        Returns:
+            int: The ticks it stays out of view for, 0 when it is not right of the view or does not move.
+        """
+        distance = rect.left - self.area.right
+        if distance <= 0 or pixels_per_tick <= 0:
+            return 0
+        return int(distance // pixels_per_tick)